@@ -1,6 +1,10 @@
 import pytest
-from yroots.ChebyshevApproximator import chebApproximate, interval_approximate_nd
+from yroots.ChebyshevApproximator import chebApproximate, interval_approximate_nd, isVectorized, ChebyshevGridCache, chebApproximateSystem, jitFunction
+from yroots.ChebyshevApproximator import getDCTBackend, ScipyDCT, MatrixDCT, DCTBackend, evaluateOnGrid, GRID_CHUNK_SIZE
 import numpy as np
+import math
+from yroots.polynomial import MultiCheb, MultiPower
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 def test_ChebyshevApproximator():
     #Test Chebyshev Approximations!
@@ -34,4 +38,166 @@ def test_ChebyshevApproximator():
         degDiffs = np.array(coeff.shape) - np.array(expectedCoeff.shape)
         #Assert the degree is close
         assert(np.all(degDiffs >= -1))
-        assert(np.all(degDiffs <= 5))
\ No newline at end of file
+        assert(np.all(degDiffs <= 5))
+
+def test_vectorized_evaluation():
+    #Detect whether functions can evaluate a whole grid in one call
+    a = np.array([-1., 0.])
+    b = np.array([1., 2.])
+    assert isVectorized(lambda x,y: np.sin(x*y) + y**2, a, b)
+    assert not isVectorized(lambda x,y: math.sin(x*y) + y**2, a, b) #math.sin rejects arrays
+    assert not isVectorized(lambda x,y: np.max([x,y]), a, b) #Reduces the grid to a single value
+    assert not isVectorized(lambda x,y: x if x > y else y, a, b) #Ambiguous truth value of an array
+
+    #The vectorized and pointwise evaluations give the same approximation
+    f = lambda x,y: np.cos(3*x) * np.exp(y) - y
+    degs = np.array([20, 15])
+    coeff1 = interval_approximate_nd(f, degs.copy(), a, b, vectorized=True)
+    coeff2 = interval_approximate_nd(f, degs.copy(), a, b, vectorized=False)
+    assert np.allclose(coeff1, coeff2, rtol=0, atol=1e-14)
+    #Falls back to pointwise evaluation if the function is not actually vectorized
+    g = lambda x,y: math.cos(3*x) * math.exp(y) - y
+    coeff3 = interval_approximate_nd(g, degs.copy(), a, b, vectorized=True)
+    assert np.allclose(coeff3, coeff2, rtol=0, atol=1e-14)
+    #A grid too large for one call is evaluated in chunks, rather than one point at a time
+    calls = []
+    def h(x, y):
+        calls.append(np.size(x))
+        if np.size(x) > GRID_CHUNK_SIZE:
+            raise MemoryError
+        return x*y
+    pts = np.random.rand(3*GRID_CHUNK_SIZE + 5, 2)
+    assert np.array_equal(evaluateOnGrid(h, pts, vectorized=True), pts[:,0]*pts[:,1])
+    assert len(calls) == 5 and max(calls[1:]) <= GRID_CHUNK_SIZE
+    #Constant functions that return a single value still work
+    coeff4 = interval_approximate_nd(lambda x,y: 3., degs.copy(), a, b, vectorized=True)
+    assert np.isclose(coeff4[0,0], 3.) and np.allclose(coeff4.ravel()[1:], 0)
+
+    #chebApproximate gives the same result whether or not the grid is evaluated all at once
+    approx1, err1 = chebApproximate(f, a, b, vectorized=True)
+    approx2, err2 = chebApproximate(f, a, b, vectorized=False)
+    assert approx1.shape == approx2.shape
+    assert np.allclose(approx1, approx2, rtol=0, atol=1e-13)
+
+def test_grid_cache():
+    #Doubling the degree only evaluates the new points and gives the same approximation
+    f = lambda x,y: np.sin(4*x + y**2) + y
+    a = np.array([-1., -2.])
+    b = np.array([1., 0.5])
+    cache = ChebyshevGridCache()
+    for deg in [8, 16, 32]:
+        degs = np.array([deg, 5])
+        coeff = interval_approximate_nd(f, degs.copy(), a, b, cache=cache)
+        assert np.array_equal(coeff, interval_approximate_nd(f, degs.copy(), a, b))
+    assert cache.numEvaluations == 33*6
+    #Grids that are not nested are evaluated from scratch
+    interval_approximate_nd(f, np.array([17, 5]), a, b, cache=cache)
+    assert cache.numEvaluations == 33*6 + 18*6
+
+def slow_function(x, y):
+    #A function that can only be evaluated one point at a time
+    return math.exp(x) * math.cos(3*y) - x*y
+
+def test_executor_evaluation():
+    #Evaluating the grid on a pool gives exactly the same approximation as evaluating it serially
+    a = np.array([-1., 0.])
+    b = np.array([1., 2.])
+    expected, expectedErr = chebApproximate(slow_function, a, b)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        approx, err = chebApproximate(slow_function, a, b, executor=executor)
+    assert np.array_equal(approx, expected) and err == expectedErr
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        approx, err = chebApproximate(slow_function, a, b, executor=executor)
+    assert np.array_equal(approx, expected) and err == expectedErr
+
+def test_polynomial_approximation():
+    #Polynomials are transformed onto any interval exactly, keeping their degree, without sampling them
+    np.random.seed(0)
+    a = np.array([-3., 0.5])
+    b = np.array([2., 7.])
+    x = np.random.rand(100, 2)*2 - 1
+    for f in [MultiPower(np.random.randn(4, 3)), MultiCheb(np.random.randn(3, 5))]:
+        coeff, error = chebApproximate(f, a, b)
+        assert coeff.shape == f.coeff.shape
+        assert 0 < error and np.max(np.abs(MultiCheb(coeff)(x) - f(((b-a)*x + b + a)/2))) <= error + 1e-14
+    #On [-1,1] a MultiCheb is its own approximation
+    f = MultiCheb(np.random.randn(3, 5))
+    coeff, error = chebApproximate(f, -np.ones(2), np.ones(2))
+    assert np.array_equal(coeff, f.coeff) and error == 0
+
+def test_system_approximation():
+    #A function returning several components is evaluated once per point for all of them, and each
+    #component gets its own degree
+    numEvaluations = [0]
+    def F(x, y):
+        numEvaluations[0] += np.size(x)
+        return np.sin(3*x*y), np.cos(x*y) - y, np.exp(x)
+    a = np.array([-1., 0.])
+    b = np.array([1., 2.])
+    coeffs, errors = chebApproximateSystem(F, a, b)
+    assert len(coeffs) == 3 and errors.shape == (3,)
+    assert coeffs[2].shape[1] == 1
+    np.random.seed(0)
+    x = np.random.rand(100, 2)*2 - 1
+    values = F(*(((b-a)*x + b + a)/2).T)
+    for coeff, error, value in zip(coeffs, errors, values):
+        assert np.max(np.abs(MultiCheb(coeff)(x) - value)) < 1e-13
+    #Each component approximated alone takes more evaluations in total
+    sharedEvaluations, numEvaluations[0] = numEvaluations[0], 0
+    for i in range(3):
+        chebApproximate(lambda x, y: F(x, y)[i], a, b)
+    assert sharedEvaluations < numEvaluations[0]
+    #Components that don't depend on the input, and functions that aren't vectorized, work too
+    coeffs, errors = chebApproximateSystem(lambda x, y: [math.sin(x)*y, 2.], a, b)
+    assert coeffs[1].shape == (1, 1) and np.isclose(coeffs[1][0,0], 2)
+
+def test_jit_functions():
+    #Arithmetic functions are compiled once and give the same approximation
+    f = lambda x,y: 2*x**2/(x**4-4) - 2*x**2 + np.sin(3*y)
+    g = lambda x,y: math.exp(x) * math.cos(3*y) - x*y
+    a = np.array([-1., 0.])
+    b = np.array([1., 2.])
+    for func in [f, g]:
+        approx, err = chebApproximate(func, a, b)
+        jitApprox, jitErr = chebApproximate(func, a, b, jitFunctions=True)
+        assert jitFunction(func, a, b) is not None
+        assert jitApprox.shape == approx.shape and np.allclose(jitApprox, approx, atol=1e-14)
+    kernel = jitFunction(f, a, b)
+    assert jitFunction(f, a, b) is kernel
+    #Functions numba can't compile are evaluated as usual
+    table = {}
+    h = lambda x,y: table.get(x, 0.) + x*y
+    assert jitFunction(h, a, b) is None
+    approx, err = chebApproximate(h, a, b, jitFunctions=True)
+    assert np.array_equal(approx, chebApproximate(h, a, b)[0])
+
+def test_dct_backends():
+    #Every backend computes the same transform, including on grids with a trailing axis of functions
+    np.random.seed(0)
+    for shape, dim in [((9, 6), 2), ((17, 5, 3), 2), ((5, 4, 3), 3), ((70, 6), 2)]:
+        values = np.random.rand(*shape)
+        expected = getDCTBackend("fftpack").dct(values.copy(), dim)
+        for backend in ["scipy", "matrix", ScipyDCT(workers=2), MatrixDCT(maxSize=4)]:
+            assert np.allclose(getDCTBackend(backend).dct(values.copy(), dim), expected, rtol=0, atol=1e-12)
+    f = lambda x,y: np.sin(5*x*y) + y
+    approx, err = chebApproximate(f, [-1, -1], [1, 1])
+    for backend in ["scipy", "matrix"]:
+        backendApprox, backendErr = chebApproximate(f, [-1, -1], [1, 1], dctBackend=backend)
+        assert backendApprox.shape == approx.shape and np.allclose(backendApprox, approx, rtol=0, atol=1e-14)
+    with pytest.raises(ValueError):
+        getDCTBackend("fft")
+    #Backends have to implement dct
+    class IncompleteDCT(DCTBackend):
+        pass
+    with pytest.raises(TypeError):
+        IncompleteDCT()
+
+def test_fftw_dct():
+    pytest.importorskip("pyfftw")
+    np.random.seed(0)
+    values = np.random.rand(17, 9, 2)
+    backend = getDCTBackend("fftw")
+    assert np.allclose(backend.dct(values.copy(), 2), getDCTBackend("fftpack").dct(values.copy(), 2))
+    #The plan for the shape is made once and reused
+    backend.dct(values.copy(), 2)
+    assert len(backend.plans) == 1
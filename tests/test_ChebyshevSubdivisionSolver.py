@@ -330,12 +330,53 @@ def test_transformChebInPlaceND():
 def test_transformCheb():
     pass
 
+def test_TransformChebMatrix():
+    #The cached matrices are the ones TransformChebInPlace1D multiplies by
+    for n in [1, 2, 5, 40, 100]:
+        for alpha, beta in [(0.5, 0.5), (0.3, -0.2), (1e-18, 0.3)]:
+            C = chebsolver.getTransformationMatrix(alpha, beta, n)
+            assert np.array_equal(C, chebsolver.TransformChebInPlace1D(np.eye(n), alpha, beta))
+            assert not C.flags.writeable
+    assert chebsolver.getTransformationMatrix(0.5, 0.5, 40) is chebsolver.getTransformationMatrix(0.5, 0.5, 40)
+    #High degree dimensions are transformed by matrix multiplication
+    np.random.seed(9)
+    M = np.random.randn(60, 10, 40)
+    for dim in range(3):
+        order = [dim] + [i for i in range(3) if i != dim]
+        expected = chebsolver.TransformChebInPlace1D(M.transpose(order), 0.37, 0.21).transpose(np.argsort(order))
+        assert np.allclose(chebsolver.TransformChebInPlaceND(M, dim, 0.37, 0.21, False), expected, rtol=0, atol=1e-13)
+
 def test_transformChebToInterval():
-    pass
+    #The batched transformation matches transforming each polynomial one dimension at a time
+    np.random.seed(7)
+    for dim, maxDeg in [(1, 30), (2, 20), (3, 8), (4, 5)]:
+        Ms = [np.random.randn(*np.random.randint(1, maxDeg, size=dim)) for _ in range(dim)]
+        Ms[0] = Ms[0].T #Not C contiguous
+        errors = np.random.rand(dim)*1e-10
+        alphas = np.random.rand(dim)
+        alphas[0] = 1e-18 #Shortens the first dimension
+        betas = (np.random.rand(dim)*2 - 1)*(1 - alphas)
+        newMs, newErrors = chebsolver.transformChebToInterval(Ms, alphas, betas, errors, False)
+        for M, e, newM, newE in zip(Ms, errors, newMs, newErrors):
+            expectedM, expectedE = chebsolver.transformCheb(M, alphas, betas, e, False)
+            assert np.array_equal(newM, expectedM)
+            assert np.isclose(newE, expectedE, rtol=1e-14, atol=0)
 
 def test_find_vertices():
     pass
 
+def test_chebSplit1D():
+    #Splitting in one pass matches transforming to each half separately
+    np.random.seed(8)
+    for dim, maxDeg in [(1, 40), (2, 20), (3, 8)]:
+        M = np.random.randn(*np.random.randint(2, maxDeg, size=dim))
+        M[-1] *= 1e-40 #Small enough for the transformations to drop the last row
+        for transformDim in range(dim):
+            for exact in [False, True]:
+                lower, upper = chebsolver.chebSplit1D(M, transformDim, exact)
+                assert np.array_equal(lower, chebsolver.chebTransform1D(M, 0.5, -0.5, transformDim, exact))
+                assert np.array_equal(upper, chebsolver.chebTransform1D(M, 0.5, 0.5, transformDim, exact))
+
 def test_zoomInOnIntervalIter():
     #why is dims=len(Ms) ASK Erik:
     #not sure how we test the np.any(...) part
@@ -396,4 +437,215 @@ def test_BoundingIntervalLinearSystem():
 
 #find vertices
 #wait for peter's PR to get merged in before doing this...
-#but yeah it basically justs does the halfspace stuff
\ No newline at end of file
+#but yeah it basically justs does the halfspace stuff
+def test_parallel_subdivision():
+    """Solving the subtrees on a process pool finds the same bounding boxes as solving them in order."""
+    from concurrent.futures import ProcessPoolExecutor
+    from yroots.ChebyshevApproximator import chebApproximate
+    f = lambda x,y: np.sin(20*x + 3*y) - y
+    g = lambda x,y: np.cos(15*x*y) - x
+    Ms, errors = [], []
+    for func in [f,g]:
+        M, err = chebApproximate(func, -np.ones(2), np.ones(2))
+        Ms.append(M)
+        errors.append(err)
+    errors = np.array(errors)
+    roots, boxes = chebsolver.solveChebyshevSubdivision(Ms, errors, returnBoundingBoxes=True)
+    for parallelDepth in [1, 2]:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            roots2, boxes2 = chebsolver.solveChebyshevSubdivision(Ms, errors, returnBoundingBoxes=True,
+                                                                  executor=executor, parallelDepth=parallelDepth)
+        assert len(roots) > 0
+        assert np.array_equal(roots, roots2)
+        assert np.array_equal([box.getFinalInterval() for box in boxes], [box.getFinalInterval() for box in boxes2])
+
+def test_queue_orders():
+    """Every order of the work queue finds the same bounding boxes as solvePolyRecursive."""
+    from yroots.ChebyshevApproximator import chebApproximate
+    f = lambda x,y: np.sin(30*x*y)
+    g = lambda x,y: np.cos(25*(x+y)) - x*y
+    Ms, errors = [], []
+    for func in [f,g]:
+        M, err = chebApproximate(func, -np.ones(2), np.ones(2))
+        Ms.append(M)
+        errors.append(err)
+    errors = np.array(errors)
+    solverOptions = chebsolver.SolverOptions()
+    solverOptions.useFinalStep = True
+    interior, exterior = chebsolver.solvePolyRecursive(Ms, chebsolver.TrackedInterval(np.array([[-1.,1.]]*2)), errors, solverOptions)
+    expected = [box.getFinalInterval() for box in interior + exterior]
+    for queueOrder in ['depth', 'breadth', 'volume']:
+        roots, boxes = chebsolver.solveChebyshevSubdivision(Ms, errors, returnBoundingBoxes=True, queueOrder=queueOrder)
+        assert len(boxes) == len(expected)
+        assert np.array_equal([box.getFinalInterval() for box in boxes], expected)
+    #Solving a level at once does the same steps, but the batched linear algebra can round differently
+    stats = chebsolver.SolverStats()
+    roots, boxes = chebsolver.solveChebyshevSubdivision(Ms, errors, returnBoundingBoxes=True, queueOrder='level', stats=stats)
+    assert len(boxes) == len(expected)
+    assert np.allclose([box.getFinalInterval() for box in boxes], expected)
+    assert stats.intervalsVisited > len(boxes)
+    with pytest.raises(ValueError):
+        chebsolver.solveChebyshevSubdivision(Ms, errors, queueOrder='random')
+
+def test_BoundingIntervalLinearSystemBatch():
+    """The batched constant term check and BoundingIntervalLinearSystem agree with them on each interval."""
+    np.random.seed(3)
+    shapes = [(5,4), (5,4), (2,6), (5,4), (3,3)]
+    allMs = [[np.random.randn(*shape) * 0.5**np.add.outer(np.arange(shape[0]), np.arange(shape[1])) for i in range(2)]
+                for shape in shapes]
+    #An interval the constant term check throws out, and one with no linear terms in the first dimension
+    allMs[1][0][0,0] = 10.
+    allMs[3][0][1,:] = 0
+    allMs[3][1][1,:] = 0
+    allErrors = np.abs(np.random.randn(len(shapes), 2)) * 1e-3
+    for indices in [[0,1,3], [2], [4]]:
+        Ms = [np.stack([allMs[j][i] for j in indices]) for i in range(2)]
+        errors = allErrors[indices]
+        A, consts, sums = chebsolver.getCheckTerms(Ms)
+        throwOuts = chebsolver.constantCheckBatch(consts, sums, errors)
+        for finalStep in [False, True]:
+            bounds = chebsolver.BoundingIntervalLinearSystemBatch(A.copy(), consts, sums, errors, finalStep)
+            for j, throwOut, interval, changed, should_stop, throwOutLinear in zip(indices, throwOuts, *bounds):
+                assert throwOut == any(abs(M[0,0]) > np.sum(np.abs(M)) - abs(M[0,0]) + e for M, e in zip(allMs[j], allErrors[j]))
+                expected = chebsolver.BoundingIntervalLinearSystem(allMs[j], allErrors[j], finalStep)
+                assert np.allclose(interval, expected[0], rtol=1e-12, atol=1e-14)
+                assert (changed, should_stop, throwOutLinear) == expected[1:]
+
+def test_SolverStats():
+    """The statistics kept during a solve add up, and merging them adds each count."""
+    from yroots.ChebyshevApproximator import chebApproximate
+    f = lambda x,y: np.sin(20*x + 3*y) - y
+    g = lambda x,y: np.cos(15*x*y) - x
+    Ms, errors = [], []
+    for func in [f,g]:
+        M, err = chebApproximate(func, -np.ones(2), np.ones(2))
+        Ms.append(M)
+        errors.append(err)
+    errors = np.array(errors)
+    stats = chebsolver.SolverStats()
+    roots = chebsolver.solveChebyshevSubdivision(Ms, errors, stats=stats)
+    assert np.array_equal(roots, chebsolver.solveChebyshevSubdivision(Ms, errors))
+    assert stats.intervalsPerLevel[1] == 1
+    assert stats.intervalsVisited == sum(stats.intervalsPerLevel.values())
+    #Every final step interval is visited again
+    assert stats.finalStepEntries >= len(roots)
+    discards = stats.constantCheckDiscards + stats.quadraticCheckDiscards + stats.linearCheckDiscards
+    assert 0 < discards < stats.intervalsVisited
+    assert stats.zoomIterations >= stats.intervalsVisited - stats.constantCheckDiscards - stats.quadraticCheckDiscards
+    assert stats.transforms > 0
+    assert stats.times['subdivision'] >= stats.times['zoom']
+    total = chebsolver.SolverStats()
+    total.merge(stats)
+    total.merge(stats)
+    assert total.intervalsVisited == 2*stats.intervalsVisited
+    assert total.transforms == 2*stats.transforms
+    assert np.isclose(total.times['zoom'], 2*stats.times['zoom'])
+
+def test_SolverTracer():
+    """The tracers see the same intervals the statistics count, and tracing doesn't change the roots."""
+    import io, json
+    from yroots.ChebyshevApproximator import chebApproximate
+    from yroots.tracers import NDJSONTracer, TimingTracer
+    f = lambda x,y: np.sin(20*x + 3*y) - y
+    g = lambda x,y: np.cos(15*x*y) - x
+    Ms, errors = [], []
+    for func in [f,g]:
+        M, err = chebApproximate(func, -np.ones(2), np.ones(2))
+        Ms.append(M)
+        errors.append(err)
+    errors = np.array(errors)
+    stats = chebsolver.SolverStats()
+    trace = io.StringIO()
+    with NDJSONTracer(trace) as tracer:
+        roots = chebsolver.solveChebyshevSubdivision(Ms, errors, stats=stats, tracer=tracer)
+    assert np.array_equal(roots, chebsolver.solveChebyshevSubdivision(Ms, errors))
+    events = [json.loads(line) for line in trace.getvalue().splitlines()]
+    counts = {}
+    for event in events:
+        counts[event["event"]] = counts.get(event["event"], 0) + 1
+    assert counts["entered"] == stats.intervalsVisited
+    assert counts["finalStep"] == stats.finalStepEntries
+    reasons = [event["reason"] for event in events if event["event"] == "pruned"]
+    assert reasons.count("constantCheck") == stats.constantCheckDiscards
+    assert reasons.count("quadraticCheck") == stats.quadraticCheckDiscards
+    assert reasons.count("linearCheck") == stats.linearCheckDiscards
+    assert all(0 <= event["volumeRatio"] <= 1 for event in events if event["event"] == "zoomed")
+    assert events[0]["event"] == "entered" and events[0]["interval"] == [[-1.,1.],[-1.,1.]]
+
+    timing = TimingTracer()
+    chebsolver.solveChebyshevSubdivision(Ms, errors, tracer=timing)
+    totals = timing.totals()
+    assert totals["constantCheck"][0] == stats.constantCheckDiscards
+    assert totals["subdivided"][0] == counts["subdivided"]
+    assert totals["rootBox"][0] == counts["rootBox"]
+    assert timing.zooms == counts["zoomed"]
+    assert all(total >= maxTime >= 0 for count, total, maxTime in totals.values())
+
+def test_memory_bounded():
+    """Rebuilding the approximations for combined intervals finds the same roots while holding less at once."""
+    from yroots.ChebyshevApproximator import chebApproximate
+    from yroots.tracers import TimingTracer
+    f = lambda x,y: y**4 - y**3 + 2*x**2*y**2 + 3*x**2*y + x**4
+    h = lambda x,y: y**10 - 2*x**8*y**2 + 4*x**4*y - 2
+    g = lambda x,y: h(2*x, 2*(y+.5))
+    Ms, errors = [], []
+    for func in [f,g]:
+        M, err = chebApproximate(func, -np.ones(2), np.ones(2))
+        Ms.append(M)
+        errors.append(err)
+    errors = np.array(errors)
+    stats, boundedStats = chebsolver.SolverStats(), chebsolver.SolverStats()
+    tracer = TimingTracer()
+    roots = chebsolver.solveChebyshevSubdivision(Ms, errors, stats=stats)
+    boundedRoots = chebsolver.solveChebyshevSubdivision(Ms, errors, stats=boundedStats, tracer=tracer, memoryBounded=True)
+    #The combined intervals are solved again from rebuilt approximations
+    assert tracer.combined > 0
+    assert len(boundedRoots) == len(roots)
+    assert np.allclose(sorted(map(tuple, boundedRoots)), sorted(map(tuple, roots)))
+    assert 0 < boundedStats.peakCoefficientBytes < stats.peakCoefficientBytes
+    assert stats.peakCoefficientBytes >= sum(M.nbytes for M in Ms)
+
+    #Rebuilding with no transforms gives back the approximations on the search interval
+    rebuiltMs, rebuiltErrors = chebsolver.rebuildMs(Ms, errors, chebsolver.TrackedInterval(np.array([[-1.,1.]]*2)), False)
+    assert all(np.array_equal(M, rebuilt) for M, rebuilt in zip(Ms, rebuiltMs))
+    assert np.array_equal(errors, rebuiltErrors)
+
+def test_budget():
+    """
+    When the budget runs out, the subdivision returns the roots found so far, the intervals it didn't solve,
+    and which limit ran out. The roots it didn't find are all in the unresolved intervals.
+    """
+    from yroots.ChebyshevApproximator import chebApproximate
+    Ms, errors = [], []
+    for func in [lambda x,y: np.sin(30*x), lambda x,y: np.sin(30*y)]:
+        M, err = chebApproximate(func, -np.ones(2), np.ones(2))
+        Ms.append(M)
+        errors.append(err)
+    errors = np.array(errors)
+    roots = chebsolver.solveChebyshevSubdivision(Ms, errors)
+    for queueOrder in ['depth', 'level']:
+        partialRoots, unresolved, status = chebsolver.solveChebyshevSubdivision(Ms, errors, maxIntervals=100, queueOrder=queueOrder)
+        assert status == 'maxIntervals'
+        assert 0 < len(unresolved)
+        assert len(partialRoots) < len(roots)
+        for root in roots:
+            found = len(partialRoots) > 0 and np.min(np.linalg.norm(partialRoots - root, axis=1)) < 1e-10
+            assert found or any(np.all((interval.interval[:,0] <= root) & (root <= interval.interval[:,1])) for interval in unresolved)
+    #The subtrees running on an executor when the time runs out aren't stopped, and are returned as unresolved
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(2) as executor:
+        partialRoots, unresolved, status = chebsolver.solveChebyshevSubdivision(Ms, errors, maxTime=0.05, executor=executor)
+    assert status == 'maxTime'
+    assert len(partialRoots) < len(roots) and 0 < len(unresolved)
+    for root in roots:
+        found = len(partialRoots) > 0 and np.min(np.linalg.norm(partialRoots - root, axis=1)) < 1e-10
+        assert found or any(np.all((interval.interval[:,0] <= root) & (root <= interval.interval[:,1])) for interval in unresolved)
+    #Nothing is solved without any time, and a large enough budget changes nothing
+    partialRoots, unresolved, status = chebsolver.solveChebyshevSubdivision(Ms, errors, maxTime=0)
+    assert status == 'maxTime' and len(partialRoots) == 0
+    assert np.array_equal(unresolved[0].interval, [[-1.,1.]]*2)
+    budget = chebsolver.SolveBudget(maxIntervals=10**6)
+    fullRoots, boxes, unresolved, status = chebsolver.solveChebyshevSubdivision(Ms, errors, returnBoundingBoxes=True, budget=budget)
+    assert status == 'solved' and len(unresolved) == 0
+    assert np.array_equal(fullRoots, roots)
+    assert 0 < budget.intervals < 10**6
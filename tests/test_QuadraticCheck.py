@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+from yroots.QuadraticCheck import quadratic_check, get_fixed_vars, get_fixed_masks
+
+@pytest.mark.parametrize("dim,deg", [(1,5), (2,2), (2,6), (3,2), (3,4), (4,3), (5,3)])
+def test_compiled_quadratic_check(dim, deg):
+    #The compiled checks throw out exactly the same intervals as the python versions
+    rng = np.random.default_rng(dim*10 + deg)
+    numThrownOut = 0
+    for test in range(100):
+        shape = tuple(rng.integers(1, deg+1, size=dim)) if test % 2 else (deg,)*dim
+        #Make the quadratic part large compared to the rest so that some intervals are thrown out
+        coeff = rng.standard_normal(shape) * np.where(np.indices(shape).sum(axis=0) <= 2, 1, rng.uniform(0, .05))
+        if test % 3 == 0:
+            coeff.flat[0] += rng.uniform(0, 5)*np.sign(coeff.flat[0])
+        tol = rng.uniform(0, .1)
+        for nd_check in [False, True]:
+            expected = quadratic_check(coeff, tol, nd_check, compiled=False)
+            assert quadratic_check(coeff, tol, nd_check) == expected
+            numThrownOut += expected
+        #Slices of larger tensors, like the solver passes in
+        padded = np.zeros(tuple(s+2 for s in shape))
+        padded[tuple(slice(0, s) for s in shape)] = coeff
+        assert quadratic_check(padded[tuple(slice(0, s) for s in shape)], tol) == quadratic_check(coeff, tol, compiled=False)
+    assert 0 < numThrownOut < 200
+
+def test_get_fixed_masks():
+    for dim in range(1, 6):
+        masks = get_fixed_masks(dim)
+        assert [tuple(np.nonzero(mask)[0]) for mask in masks] == get_fixed_vars(dim)
@@ -0,0 +1,51 @@
+import numpy as np
+from yroots import bench
+
+def test_EvaluationCounter():
+    f = bench.EvaluationCounter(lambda x,y: x*y)
+    f(0.5, 0.5)
+    f(np.zeros(10), np.zeros(10))
+    f(np.zeros((3,1)), np.zeros(4))
+    assert f.count == 1 + 10 + 12
+    assert f(2., 3.) == 6.
+
+def test_loadProblems():
+    problems = bench.loadProblems(["chebfun2"], pattern=r"test_roots_(1_4|2_1)$")
+    assert [problem.name for problem in problems] == ["chebfun2:test_roots_1_4", "chebfun2:test_roots_2_1"]
+    assert len(problems[0].funcs) == 2
+    assert np.array_equal(problems[0].a, [-1,-1]) and np.array_equal(problems[0].b, [1,1])
+
+def test_runProblem_and_compareResults():
+    problem = bench.BenchmarkProblem("linear", [lambda x,y: x - y + .5, lambda x,y: x + y], np.array([-1,-1]), np.array([1,1]), {})
+    result = bench.runProblem(problem, measureMemory=True, warmup=False)
+    assert result["numRoots"] == 1
+    assert result["functionEvaluations"] > 0
+    assert result["intervalsVisited"] >= 1
+    assert result["peakMemory"] > 0
+    results = {"problems": {"linear": result}}
+    assert bench.compareResults(results, results) == []
+    slower = {"problems": {"linear": dict(result, wallTime=result["wallTime"]*2, numRoots=2)}}
+    assert len(bench.compareResults(slower, results, tolerance=0.5)) == 2
+    assert bench.compareResults(results, slower, tolerance=0.5) == ["linear: found 1 roots, baseline found 2"]
+
+def test_import_times():
+    importTime = bench.measureImportTime("yroots", repeat=1)
+    assert 0 < importTime
+    results = {"importTimes": {"yroots": importTime}, "problems": {}}
+    assert bench.compareResults(results, results) == []
+    slower = {"importTimes": {"yroots": importTime*2 + 1}, "problems": {}}
+    assert len(bench.compareResults(slower, results)) == 1
+
+def test_dct_times():
+    dctTimes = bench.measureDCTTimes(shapes=[(9, 6)], backends=["fftpack", "matrix"], repeat=1)
+    assert list(dctTimes) == ["fftpack:9x6", "matrix:9x6"]
+    results = {"dctTimes": dctTimes, "problems": {}}
+    assert bench.compareResults(results, results) == []
+    slower = {"dctTimes": {name: dctTime*2 + 1 for name, dctTime in dctTimes.items()}, "problems": {}}
+    assert len(bench.compareResults(slower, results)) == 2
+
+def test_quadratic_check_times():
+    quadraticCheckTimes = bench.measureQuadraticCheckTimes(degrees={2: 5}, numTests=2, repeat=1)
+    assert list(quadraticCheckTimes) == ["python:2d", "compiled:2d"]
+    results = {"quadraticCheckTimes": quadraticCheckTimes, "problems": {}}
+    assert bench.compareResults(results, results) == []
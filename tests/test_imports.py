@@ -0,0 +1,37 @@
+import subprocess
+import sys
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def loadedModules(code):
+    """Runs code in a new python process and returns the modules it loaded."""
+    code += "; import sys; print(' '.join(sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    return set(output.stdout.split())
+
+def test_import_is_lazy():
+    """Importing yroots doesn't load numba or scipy until the solver is used."""
+    modules = loadedModules("import yroots")
+    for heavy in ["numba", "scipy", "matplotlib", "yroots.Combined_Solver"]:
+        assert heavy not in modules
+    modules = loadedModules("import yroots; yroots.solve")
+    assert "yroots.Combined_Solver" in modules and "numba" in modules
+    #Dependencies the solver only needs for plotting or polynomial multiplication
+    for heavy in ["matplotlib", "scipy.spatial", "scipy.optimize", "scipy.signal"]:
+        assert heavy not in modules
+
+def test_public_names():
+    import yroots
+    from yroots.ChebyshevSubdivisionSolver import SolverStats
+    from yroots.tracers import SolverTracer, NDJSONTracer
+    assert yroots.SolverStats is SolverStats
+    assert yroots.NDJSONTracer is NDJSONTracer
+    assert yroots.SolverTracer is SolverTracer
+    assert callable(yroots.solve) and callable(yroots.warmup)
+    assert "solve" in dir(yroots)
+    #The public names are the same when their module is imported before yroots
+    code = ("from yroots.tracers import NDJSONTracer; from yroots.ChebyshevSubdivisionSolver import SolverStats; import yroots; "
+            "print(yroots.SolverTracer is yroots.tracers.SolverTracer, yroots.SolverStats is SolverStats)")
+    output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    assert output.stdout.split() == ["True", "True"]
@@ -1,11 +1,17 @@
 import numpy as np
-from numba import njit
+from numba import njit, vectorize, float64
 from yroots.polynomial import MultiCheb, MultiPower
+from yroots.ChebyshevSubdivisionSolver import TransformChebInPlaceND, getTransformationError
 import itertools
+import os
 from scipy.fftpack import dctn
+import scipy.fft
+from functools import lru_cache
 import warnings
+import weakref
+from abc import ABC, abstractmethod
 
-@njit
+@njit(cache=True)
 def transform(x, a, b):
     """Transforms points from the interval [-1, 1] to the interval [a, b].
 
@@ -25,7 +31,456 @@ def transform(x, a, b):
     """
     return ((b-a)*x+(b+a))/2
 
-def interval_approximate_nd(f, degs, a, b, retSupNorm = False):
+#The values of the globals and closure variables each function used when jitFunction compiled it,
+#and the kernel, or None if it couldn't be compiled
+_jitKernels = weakref.WeakKeyDictionary()
+
+def _jitState(f):
+    """Gets the code of f and the values of the globals and closure variables it uses.
+
+    Numba compiles these values into the kernel as constants, so the kernel has to be compiled again
+    when any of them change.
+    """
+    code = getattr(f, '__code__', None)
+    if code is None:
+        return None
+    names = [name for name in code.co_names if name in getattr(f, '__globals__', {})]
+    values = [f.__globals__[name] for name in names]
+    for cell in f.__closure__ or ():
+        try:
+            values.append(cell.cell_contents)
+        except ValueError: # The closure variable hasn't been assigned yet
+            values.append(cell)
+    #Copy arrays so changes made to them in place are detected
+    return code, [value.copy() if isinstance(value, np.ndarray) else value for value in values]
+
+def _sameJitState(state1, state2):
+    """Checks whether two states from _jitState have the same code and values."""
+    if state1 is None or state2 is None:
+        return state1 is state2
+    if state1[0] is not state2[0] or len(state1[1]) != len(state2[1]):
+        return False
+    for value1, value2 in zip(state1[1], state2[1]):
+        if value1 is value2:
+            continue
+        if isinstance(value1, np.ndarray) and isinstance(value2, np.ndarray):
+            if value1.dtype != value2.dtype or not np.array_equal(value1, value2, equal_nan=value1.dtype.kind in 'fc'):
+                return False
+        elif type(value1) is not type(value2) or not isinstance(value1, (bool, int, float, complex, str)) \
+                or not (value1 == value2 or value1 != value1 and value2 != value2):
+            return False
+    return True
+
+def _kernelAgrees(kernel, f, a, b):
+    """Checks that kernel gives the same values as f on a few points in [a,b]."""
+    dim = len(a)
+    test_pts = transform(np.array([[0.8984743990614998**(val+1) for val in range(dim)],
+                                   [-0.7996847717584993*(-1)**val for val in range(dim)]]), a, b)
+    return np.allclose(kernel(*test_pts.T), [f(*pt) for pt in test_pts], rtol=1e-10, equal_nan=True)
+
+def jitFunction(f, a, b):
+    """Compiles f with numba into a vectorized kernel that evaluates a whole grid at once.
+
+    The kernel is checked against f on a few points in [a,b]. Kernels are cached for each function
+    object, so f is only compiled once unless the values of the globals or closure variables it uses
+    change, which numba compiles into the kernel as constants. A cached kernel is checked against f
+    again each time it is used, and compiled again if they don't agree.
+
+    Parameters
+    ----------
+    f : function from R^n -> R
+        The function to compile. It must only use arithmetic and numpy functions numba supports.
+    a : numpy array
+        The lower bound on the interval.
+    b : numpy array
+        The upper bound on the interval.
+
+    Returns
+    -------
+    kernel : numba ufunc or None
+        The compiled function, or None if f couldn't be compiled or doesn't agree with its kernel.
+    """
+    try:
+        cached = _jitKernels.get(f)
+    except TypeError: # f can't be weakly referenced, so don't try to compile it
+        return None
+    state = _jitState(f)
+    try:
+        with warnings.catch_warnings(), np.errstate(all='ignore'):
+            warnings.simplefilter('ignore')
+            if cached is not None and _sameJitState(cached[0], state):
+                if cached[1] is None or _kernelAgrees(cached[1], f, a, b):
+                    return cached[1]
+            kernel = vectorize([float64(*[float64]*len(a))])(f)
+            if not _kernelAgrees(kernel, f, a, b):
+                kernel = None
+    except Exception:
+        kernel = None
+    _jitKernels[f] = (state, kernel)
+    return kernel
+
+def isVectorized(f, a, b, numFuncs=None):
+    """Determines whether f can be evaluated on many points at once by passing it numpy arrays.
+
+    Evaluates f on a few predetermined points in [a,b] both with a single vectorized call and one
+    point at a time. The function is considered vectorized only if the vectorized call succeeds,
+    returns one value per point, and agrees with the pointwise evaluations.
+
+    Parameters
+    ----------
+    f : function
+        The function being evaluated.
+    a : numpy array
+        The lower bound on the interval.
+    b : numpy array
+        The upper bound on the interval.
+    numFuncs : int (optional)
+        If f returns the values of numFuncs functions at once, the number of functions.
+
+    Returns
+    -------
+    is_vectorized : bool
+        Whether f(*pts.T) evaluates f at every row of pts.
+    """
+    if isinstance(f, MultiCheb) or isinstance(f, MultiPower): # These always evaluate arrays of points
+        return True
+    dim = len(a)
+    test_pts = transform(np.array([[0.8984743990614998**(val+1) for val in range(dim)],
+                                   [(-0.2598647169391334*(val+1)/(dim))**2 for val in range(dim)],
+                                   [-0.7996847717584993*(-1)**val for val in range(dim)]]), a, b)
+    try:
+        with np.errstate(all='ignore'):
+            vec_values = np.asarray(f(*test_pts.T))
+            pt_values = np.array([f(*pt) for pt in test_pts])
+            if numFuncs is not None: # f(*pts.T) gives each function's values in a row
+                pt_values = pt_values.T
+    except Exception:
+        return False
+    if vec_values.shape != pt_values.shape:
+        return False
+    tol = 1e-10 * np.max(np.abs(pt_values))
+    return bool(np.allclose(vec_values, pt_values, rtol=1e-10, atol=tol, equal_nan=True))
+
+#The number of points evaluated in each call when a vectorized function can't evaluate a whole grid at once
+GRID_CHUNK_SIZE = 4096
+
+def evaluateVectorized(f, pts, numFuncs=None):
+    """Evaluates a vectorized f at each row of pts in a single call.
+
+    Returns
+    -------
+    values : numpy array or None
+        The value of f at each point, with one column per function if numFuncs is given, or None if the
+        call fails or does not return one value per point.
+    """
+    try:
+        if numFuncs is not None: # Functions that are constant may return a single value instead of one per point
+            values = np.column_stack([np.broadcast_to(value, len(pts)) for value in f(*pts.T)])
+            if values.shape == (len(pts), numFuncs):
+                return values
+        else:
+            values = np.asarray(f(*pts.T))
+            if values.ndim == 0: # Constant functions may return a single value
+                return np.full(len(pts), values[()])
+            if values.shape == (len(pts),):
+                return values
+    except Exception:
+        pass
+    return None
+
+def evaluateOnGrid(f, pts, vectorized=False, executor=None, numFuncs=None):
+    """Evaluates f at each row of pts.
+
+    If f is vectorized, the whole grid is evaluated in a single call. If that call fails or does not
+    return one value per point, the points are evaluated in chunks of GRID_CHUNK_SIZE points with one
+    call each, and only the chunks where that fails too are evaluated one point at a time.
+
+    If an executor is given, the points are split into contiguous chunks that are evaluated
+    concurrently, and the values are put back together in the original order.
+
+    Parameters
+    ----------
+    f : function from R^n -> R
+        The function to evaluate.
+    pts : numpy array
+        The points to evaluate f at, one point per row.
+    vectorized : bool
+        Whether f accepts numpy arrays and evaluates them elementwise.
+    executor : concurrent.futures.Executor (optional)
+        The pool to evaluate chunks of points on. With a ProcessPoolExecutor, f must be picklable, so
+        it must be defined at the top level of a module rather than as a lambda.
+    numFuncs : int (optional)
+        If f returns the values of numFuncs functions at once, the number of functions.
+
+    Returns
+    -------
+    values : numpy array
+        The value of f at each point. If numFuncs is given, it has one column per function.
+    """
+    if isinstance(f, MultiCheb) or isinstance(f, MultiPower):
+        return f(pts)
+    if executor is not None and len(pts) > 1:
+        # Use a few chunks per core so uneven evaluation times still balance out
+        chunks = np.array_split(pts, min(len(pts), 4*(os.cpu_count() or 1)))
+        return np.concatenate(list(executor.map(evaluateOnGrid, itertools.repeat(f), chunks,
+                                                itertools.repeat(vectorized), itertools.repeat(None),
+                                                itertools.repeat(numFuncs))))
+    if vectorized:
+        values = evaluateVectorized(f, pts, numFuncs)
+        if values is not None:
+            return values
+        if len(pts) > GRID_CHUNK_SIZE:
+            chunks = np.array_split(pts, -(-len(pts) // GRID_CHUNK_SIZE))
+            return np.concatenate([evaluateOnGrid(f, chunk, vectorized, None, numFuncs) for chunk in chunks])
+    return np.array([f(*pt) for pt in pts])
+
+class ChebyshevGridCache():
+    """Stores the values of a function on Chebyshev grids so that nested grids can reuse them.
+
+    The degree n Chebyshev extrema cos(k*pi/n) are a subset of the degree 2n extrema, so when a grid
+    is requested whose degree in each dimension is a power of two multiple of the degree of a cached
+    grid, only the points not already in the cached grid are evaluated. Only powers of two are used
+    so that the shared points are computed exactly the same in floating point.
+
+    A cache is only valid for a single function and interval.
+
+    Parameters
+    ----------
+    grids : dict
+        Maps the tuple of degrees of each cached grid to the function values on that grid.
+    numEvaluations : int
+        The number of points at which the function has been evaluated through the cache.
+    """
+    def __init__(self):
+        self.grids = {}
+        self.numEvaluations = 0
+
+    def getNestedGrid(self, degs):
+        """Finds the largest cached grid whose points are all in the grid with degrees degs.
+
+        Returns
+        -------
+        cachedDegs : tuple or None
+            The degrees of the cached grid, or None if no cached grid is nested in this one.
+        """
+        bestDegs, bestSize = None, 0
+        for cachedDegs in self.grids:
+            ratios = [d // c for d, c in zip(degs, cachedDegs)]
+            if all(d % c == 0 and (r & (r-1)) == 0 for d, c, r in zip(degs, cachedDegs, ratios)):
+                size = np.prod(np.array(cachedDegs) + 1)
+                if size > bestSize:
+                    bestDegs, bestSize = cachedDegs, size
+        return bestDegs
+
+    def evaluate(self, f, degs, cheb_pts, vectorized=False, executor=None, numFuncs=None):
+        """Gets the values of f on the Chebyshev grid with degrees degs, evaluating only new points.
+
+        Parameters
+        ----------
+        f : function from R^n -> R
+            The function to evaluate.
+        degs : numpy array
+            The degree of the grid in each dimension.
+        cheb_pts : numpy array
+            The points of the grid, one per row, in the same order as the flattened grid.
+        vectorized : bool
+            Whether f can evaluate many points in one call by being passed numpy arrays.
+        executor : concurrent.futures.Executor (optional)
+            The pool used to evaluate the new points concurrently.
+        numFuncs : int (optional)
+            If f returns the values of numFuncs functions at once, the number of functions.
+
+        Returns
+        -------
+        values : numpy array
+            The values of f on the grid, with shape degs+1, followed by numFuncs if it is given.
+        """
+        degs = tuple(int(d) for d in degs)
+        shape = tuple(d+1 for d in degs) + (() if numFuncs is None else (numFuncs,))
+        if degs in self.grids:
+            return self.grids[degs]
+        cachedDegs = self.getNestedGrid(degs)
+        if cachedDegs is None:
+            values = evaluateOnGrid(f, cheb_pts, vectorized, executor, numFuncs).reshape(shape)
+            self.numEvaluations += len(cheb_pts)
+        else:
+            # The cached points are every (d/c)th point of the new grid in each dimension.
+            oldSpots = np.ix_(*[np.arange(0, d+1, d//c) for d, c in zip(degs, cachedDegs)])
+            isNew = np.ones(shape[:len(degs)], dtype=bool)
+            isNew[oldSpots] = False
+            isNew = isNew.ravel()
+            newValues = evaluateOnGrid(f, cheb_pts[isNew], vectorized, executor, numFuncs)
+            values = np.empty(shape, dtype=np.result_type(newValues, self.grids[cachedDegs]))
+            values[oldSpots] = self.grids[cachedDegs]
+            values.reshape(len(isNew), -1)[isNew] = newValues.reshape(len(newValues), -1)
+            self.numEvaluations += len(newValues)
+        # Grids nested in the new grid are no longer needed.
+        for oldDegs in [c for c in self.grids if all(d % c_ == 0 for d, c_ in zip(degs, c))]:
+            del self.grids[oldDegs]
+        self.grids[degs] = values
+        return values
+
+class EvaluationBudgetCounter():
+    """Counts the points a function is evaluated at to approximate it, when passed to chebApproximate.
+
+    Solve uses it to charge the approximations against the maxFunctionEvals of its budget. To count all
+    the evaluations of a function, wrap it in a bench.EvaluationCounter instead.
+
+    Attributes
+    ----------
+    numEvaluations : int
+        The number of Chebyshev grid points the function has been evaluated at.
+    """
+    def __init__(self):
+        self.numEvaluations = 0
+
+#The largest number of points in a dimension that MatrixDCT transforms with a matrix product
+MATRIX_DCT_MAX_SIZE = 65
+
+class DCTBackend(ABC):
+    """Computes the unnormalized type 1 DCT of a grid of function values, which interval_approximate_nd
+    turns into Chebyshev coefficients. Subclasses must implement dct.
+
+    Pass a backend, or the name of one of the built in backends, as the dctBackend option of solve or
+    chebApproximate:
+    'fftpack' uses scipy.fftpack.dctn, and is the default.
+    'scipy' uses scipy.fft.dctn on all the cpus. Use ScipyDCT(workers) to choose how many.
+    'fftw' uses pyFFTW, which must be installed, and reuses the plan for each shape of grid.
+    'matrix' multiplies by the DCT matrix in each dimension, which has less overhead on tiny grids.
+    """
+    @abstractmethod
+    def dct(self, values, dim):
+        """Transforms values along its first dim axes. values may be overwritten.
+
+        Parameters
+        ----------
+        values : numpy array
+            The values of the function on a Chebyshev grid. Any axes after the first dim are transformed
+            separately.
+        dim : int
+            The number of dimensions of the grid.
+
+        Returns
+        -------
+        transformed : numpy array
+            The type 1 DCT of values, with the same shape.
+        """
+        pass
+
+class FFTPackDCT(DCTBackend):
+    """Transforms with the single threaded scipy.fftpack.dctn."""
+    def dct(self, values, dim):
+        return dctn(values, type=1, axes=list(range(dim)), overwrite_x=True)
+
+class ScipyDCT(DCTBackend):
+    """Transforms with scipy.fft.dctn.
+
+    Parameters
+    ----------
+    workers : int
+        Defaults to -1. The number of threads to use for large grids, or -1 to use all the cpus.
+    """
+    def __init__(self, workers=-1):
+        self.workers = workers
+
+    def dct(self, values, dim):
+        return scipy.fft.dctn(values, type=1, axes=list(range(dim)), overwrite_x=True, workers=self.workers)
+
+class FFTWDCT(DCTBackend):
+    """Transforms with pyFFTW. The first transform of each shape plans it, which takes a while, and
+    later transforms of the same shape reuse the plan.
+
+    Parameters
+    ----------
+    threads : int
+        Defaults to 1. The number of threads FFTW uses.
+    """
+    def __init__(self, threads=1):
+        try:
+            import pyfftw
+        except ImportError as e:
+            raise ImportError("pyFFTW must be installed to use the 'fftw' DCT backend") from e
+        self.pyfftw = pyfftw
+        self.threads = threads
+        self.plans = {}
+
+    def dct(self, values, dim):
+        key = (values.shape, dim)
+        if key not in self.plans:
+            inputArray = self.pyfftw.empty_aligned(values.shape, dtype='float64')
+            outputArray = self.pyfftw.empty_aligned(values.shape, dtype='float64')
+            self.plans[key] = self.pyfftw.FFTW(inputArray, outputArray, axes=tuple(range(dim)),
+                                               direction=['FFTW_REDFT00']*dim, threads=self.threads)
+        plan = self.plans[key]
+        plan.input_array[...] = values
+        return plan().copy()
+
+    def __getstate__(self):
+        #Plans can't be pickled, so a copy sent to another process makes its own
+        return {"threads": self.threads}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+@lru_cache(maxsize=None)
+def getDCTMatrix(n):
+    """Gets the matrix of the unnormalized type 1 DCT of n points."""
+    k = np.arange(n)
+    weights = np.full(n, 2.)
+    weights[[0, -1]] = 1
+    return np.cos(np.pi*np.outer(k, k)/(n-1)) * weights
+
+class MatrixDCT(DCTBackend):
+    """Transforms grids with at most maxSize points in each dimension by multiplying by the DCT matrix
+    in each dimension, and larger grids with scipy.fft.dctn.
+
+    Parameters
+    ----------
+    maxSize : int
+        Defaults to MATRIX_DCT_MAX_SIZE. The largest number of points in a dimension to use matrices for.
+    """
+    def __init__(self, maxSize=MATRIX_DCT_MAX_SIZE):
+        self.maxSize = maxSize
+
+    def dct(self, values, dim):
+        if max(values.shape[:dim]) > self.maxSize:
+            return scipy.fft.dctn(values, type=1, axes=list(range(dim)), overwrite_x=True)
+        shape = values.shape
+        for _ in range(dim):
+            #Transform the first axis, then move it to the back of the grid axes so the next one is first
+            n = values.shape[0]
+            values = (getDCTMatrix(n) @ values.reshape(n, -1)).reshape(values.shape)
+            values = np.moveaxis(values, 0, dim-1)
+        return values.reshape(shape)
+
+#The backends used for each name, shared so FFTWDCT keeps its plans between approximations
+_dctBackends = {"fftpack": FFTPackDCT(), "scipy": ScipyDCT(), "matrix": MatrixDCT()}
+
+def getDCTBackend(backend=None):
+    """Gets the DCTBackend for the dctBackend option.
+
+    Parameters
+    ----------
+    backend : DCTBackend, string, or None
+        A backend, the name of a built in backend, or None for the default 'fftpack'.
+
+    Returns
+    -------
+    backend : DCTBackend
+        The backend to use.
+    """
+    if backend is None:
+        return _dctBackends["fftpack"]
+    if isinstance(backend, DCTBackend):
+        return backend
+    if backend == "fftw" and "fftw" not in _dctBackends:
+        _dctBackends["fftw"] = FFTWDCT()
+    if backend not in _dctBackends:
+        raise ValueError(f"Invalid input: unknown DCT backend {backend!r}. Use 'fftpack', 'scipy', 'fftw', 'matrix', or a DCTBackend")
+    return _dctBackends[backend]
+
+def interval_approximate_nd(f, degs, a, b, retSupNorm = False, vectorized = False, cache = None, executor = None,
+                            numFuncs = None, dctBackend = None, evaluationCounter = None):
     """Generates an approximation of f on [a,b] using Chebyshev polynomials of degs degrees.
 
     Calculates the values of the function at the Chebyshev grid points and performs the FFT
@@ -43,13 +498,28 @@ def interval_approximate_nd(f, degs, a, b, retSupNorm = False):
         A list of the degree of interpolation in each dimension.
     retSupNorm : bool
         Whether to return the sup norm of the function.
+    vectorized : bool
+        Whether f can evaluate the whole grid in one call by being passed numpy arrays.
+    cache : ChebyshevGridCache (optional)
+        Stores the function values so that later approximations on nested grids can reuse them.
+    executor : concurrent.futures.Executor (optional)
+        A thread or process pool used to evaluate chunks of the grid concurrently.
+    numFuncs : int (optional)
+        If f returns the values of numFuncs functions at once, the number of functions. The functions
+        are all interpolated from the same grid.
+    dctBackend : DCTBackend or string (optional)
+        How to compute the DCT, see DCTBackend. Defaults to 'fftpack'.
+    evaluationCounter : EvaluationBudgetCounter (optional)
+        Counts the points f is evaluated at.
 
     Returns
     -------
     coeffs : numpy array
-        The coefficients of the Chebyshev interpolating polynomial.
-    supNorm : float (optional)
-        The sup norm of the function, approximated as the maximum function evaluation.
+        The coefficients of the Chebyshev interpolating polynomial. If numFuncs is given, the last axis
+        indexes the functions.
+    supNorm : float or numpy array (optional)
+        The sup norm of the function, approximated as the maximum function evaluation. If numFuncs is
+        given, the sup norm of each function.
     """
     dim = len(degs)
     # If any dimension has degree 0, turn it to degree 1 (will be sliced out at the end)
@@ -61,21 +531,22 @@ def interval_approximate_nd(f, degs, a, b, retSupNorm = False):
                                for deg, a_, b_ in zip(degs, a, b)]),indexing='ij')
     cheb_pts = np.column_stack(tuple(map(lambda x: x.flatten(), cheb_grid)))
 
-    if isinstance(f, MultiCheb) or isinstance(f, MultiPower): # for faster function evaluations
-        #TODO: Evaluate Grid???
-        values = f(cheb_pts).reshape(*(degs+1))
+    shape = tuple(degs+1) + (() if numFuncs is None else (numFuncs,))
+    if cache is None:
+        values = evaluateOnGrid(f, cheb_pts, vectorized, executor, numFuncs).reshape(shape)
+        numEvaluations = len(cheb_pts)
     else:
-        # values = f(*cheb_pts.T).reshape(*(degs+1))
-        values = np.array([f(*cheb_pt) for cheb_pt in cheb_pts]).reshape(*(degs+1))
+        numEvaluations = cache.numEvaluations
+        values = cache.evaluate(f, degs, cheb_pts, vectorized, executor, numFuncs)
+        numEvaluations = cache.numEvaluations - numEvaluations
+    if evaluationCounter is not None:
+        evaluationCounter.numEvaluations += numEvaluations
     #Get the supNorm if we want it
     if retSupNorm:
-        supNorm = np.max(np.abs(values))
-
-    #TODO: Save the duplicated function values when we double the approximation.
-    #Less efficient in higher dimensions, we save 1/2**(dim-1) of the functions evals
+        supNorm = np.max(np.abs(values), axis=tuple(range(dim)))
 
     #Do real DCT
-    coeffs = dctn(values/np.prod(degs), type=1, overwrite_x=True)
+    coeffs = getDCTBackend(dctBackend).dct(values/np.prod(degs), dim)
     #Divide edges by 2    
     for d in range(dim):
         coeffs[tuple([slice(None) if i != d else 0 for i in range(dim)])] /= 2
@@ -115,8 +586,9 @@ def hasConverged(coeff, coeff2, tol):
         Absolute values of chebyshev coefficients of degree n approximation.
     coeff2 : numpy array
         Absolute values of chebyshev coefficients of degree 2n+1 approximation.
-    tol : float
-        Tolerance (distance from zero) used to determine wheher the coefficients have converged.
+    tol : float or numpy array
+        Tolerance (distance from zero) used to determine wheher the coefficients have converged. If the
+        coefficients have a last axis indexing several functions, the tolerance of each function.
     
     Returns
     -------
@@ -126,7 +598,7 @@ def hasConverged(coeff, coeff2, tol):
     coeff3 = coeff2.copy()
     # Subtract off coeff from coeff2 elementwise and ensure all elements are then less than tol
     coeff3[tuple([slice(0, d) for d in coeff.shape])] -= coeff 
-    return np.max(np.abs(coeff3)) < tol
+    return np.all(np.abs(coeff3) < tol)
     
 def getFinalDegree(coeff,tol,macheps = 2**-52):
     """Finalize the degree of Chebyshev approximation to use along one particular dimension.
@@ -203,7 +675,7 @@ def checkConstantInDimension(f,a,b,currDim, relApproxTol, absApproxTol = 0):
     # First test point x_1
     x_1 = transform(np.array([0.8984743990614998**(val+1) for val in range(dim)]),a,b)
     eval1 = (f(*x_1) if not is_m else f(x_1))
-    if np.isclose(eval1,0,rtol=relApproxTol, atol=absApproxTol): # Make sure f(x_1) != 0 (unlikely)
+    if np.any(np.isclose(eval1,0,rtol=relApproxTol, atol=absApproxTol)): # Make sure f(x_1) != 0 (unlikely)
         return False
     # Test how changing x_1[dim] changes the value of f for several values         
     for val in transform(np.array([-0.7996847717584993,0.18546110255464776,-0.13975937255055182,0.,1.,-1.]),a[currDim],b[currDim]):
@@ -215,7 +687,7 @@ def checkConstantInDimension(f,a,b,currDim, relApproxTol, absApproxTol = 0):
     # Second test point x_2
     x_2 = transform(np.array([(-0.2598647169391334*(val+1)/(dim))**2 for val in range(dim)]),a,b)
     eval1 = (f(*x_2) if not is_m else f(x_2))
-    if np.isclose(eval1,0,rtol=relApproxTol, atol=absApproxTol): # Make sure f(x_2) != 0 (unlikely)
+    if np.any(np.isclose(eval1,0,rtol=relApproxTol, atol=absApproxTol)): # Make sure f(x_2) != 0 (unlikely)
             return False
     for val in transform(np.array([-0.17223860129797386,0.10828286380141305,-0.5333148248321931,0.46471703497219596]),a[currDim],b[currDim]):
         x_2[currDim] = val
@@ -225,10 +697,11 @@ def checkConstantInDimension(f,a,b,currDim, relApproxTol, absApproxTol = 0):
     # Both test points had not zeros of f and had no variance along dimension currDim.
     return True
         
-def getChebyshevDegrees(f, a, b, relApproxTol, absApproxTol = 0):
+def getChebyshevDegrees(f, a, b, relApproxTol, absApproxTol = 0, vectorized = False, executor = None, initialDegrees = None,
+                        numFuncs = None, dctBackend = None, evaluationCounter = None):
     """Compute the minimum degrees in each dimension that give a reliable Chebyshev approximation for f.
 
-    For each dimension, starts with degree 8, generates an approximation, and checks to see if the
+    For each dimension, starts with degree 8 (or the degree from initialDegrees), generates an approximation, and checks to see if the
     sequence of coefficients is converging. Repeats, doubling the degree guess until the coefficients
     are seen to converge to 0. Then calls getFinalDegree to get the exact degree of convergence.
     
@@ -244,15 +717,30 @@ def getChebyshevDegrees(f, a, b, relApproxTol, absApproxTol = 0):
         The relative tolerance (distance from zero) used to determine convergence
     absApproxTol : float
         The absolute tolerance (distance from zero) used to determine convergence
+    vectorized : bool
+        Whether f can evaluate the whole grid in one call by being passed numpy arrays.
+    executor : concurrent.futures.Executor (optional)
+        A thread or process pool used to evaluate chunks of each grid concurrently.
+    initialDegrees : numpy array (optional)
+        The degree to start guessing at in each dimension, when a good guess is known. Starting too low
+        costs extra doublings, starting too high evaluates f on a larger grid than needed.
+    numFuncs : int (optional)
+        If f returns the values of numFuncs functions at once, the number of functions. The grids are
+        shared, and the degree is doubled until every function has converged.
+    dctBackend : DCTBackend or string (optional)
+        How to compute the DCT, see DCTBackend. Defaults to 'fftpack'.
+    evaluationCounter : EvaluationBudgetCounter (optional)
+        Counts the points f is evaluated at on the grids.
     
     Returns
     -------
     chebDegrees : numpy array
-        The numerical degree in each dimension.
+        The numerical degree in each dimension. If numFuncs is given, it has a column for each function.
     epsilons : numpy array
-        The value the coefficients converged to in each dimension.
+        The value the coefficients converged to in each dimension, with a column for each function if
+        numFuncs is given.
     rhos : numpy array
-        The rate of convergence in each dimension.
+        The rate of convergence in each dimension, with a column for each function if numFuncs is given.
     """    
     dim = len(a)
     chebDegrees = [np.inf]*dim # the approximation degree in each dimension
@@ -272,9 +760,13 @@ def getChebyshevDegrees(f, a, b, relApproxTol, absApproxTol = 0):
         # Isolate the current dimension by fixing all other dimensions at constant degree approximation
         degs = np.array([5]*dim if dim <= 5 else [2]*dim)
         for i in range(len(chebDegrees)): # save computation by using already computed degrees if lower
-            if chebDegrees[i] < degs[i]:
-                degs[i] = chebDegrees[i]
+            if np.max(chebDegrees[i]) < degs[i]:
+                degs[i] = np.max(chebDegrees[i])
         currGuess = 8 # Take initial guess degree 8 in the current dimension
+        if initialDegrees is not None:
+            currGuess = max(int(initialDegrees[currDim]), currGuess)
+        # Doubling the degree reuses the function values from the previous grid
+        cache = ChebyshevGridCache()
         tupleForChunk = tuple([i for i in range(currDim)] + [i for i in range(currDim+1,dim)])
         while True: # Runs until the coefficients are shown to converge to 0 in this dimension
             if currGuess > 1e5:
@@ -283,7 +775,9 @@ def getChebyshevDegrees(f, a, b, relApproxTol, absApproxTol = 0):
                               "and restarting the process after ensuring that the function(s) inputted are " +
                               "continuous and smooth on the approximation interval.\n\n")
             degs[currDim] = currGuess
-            coeff, supNorm = interval_approximate_nd(f, degs, a, b, retSupNorm=True) # get approximation
+            coeff, supNorm = interval_approximate_nd(f, degs, a, b, retSupNorm=True, vectorized=vectorized,
+                                                     cache=cache, executor=executor, numFuncs=numFuncs,
+                                                     dctBackend=dctBackend, evaluationCounter=evaluationCounter) # get approximation
             # Get "average" coefficients along the current dimension
             coeffChunk = np.average(np.abs(coeff), axis=tupleForChunk)
             tol = absApproxTol + supNorm * relApproxTol # Set tolerance for convergence from the supNorm
@@ -296,18 +790,27 @@ def getChebyshevDegrees(f, a, b, relApproxTol, absApproxTol = 0):
             # Since the coefficients have started to converge, check if they have fully converged.
             # Degree n and 2n+1 are unlikely to have higher degree terms alias into the same spot.
             degs[currDim] = currGuess + 1 # 2n+1
-            coeff2, supNorm2 = interval_approximate_nd(f, degs, a, b, retSupNorm=True)
-            tol = absApproxTol + max(supNorm, supNorm2) * relApproxTol
+            coeff2, supNorm2 = interval_approximate_nd(f, degs, a, b, retSupNorm=True, vectorized=vectorized,
+                                                       executor=executor, numFuncs=numFuncs, dctBackend=dctBackend,
+                                                       evaluationCounter=evaluationCounter)
+            tol = absApproxTol + np.maximum(supNorm, supNorm2) * relApproxTol
             if not hasConverged(coeff, coeff2, tol):
                 continue # Keed doubling if the coefficients have not fully converged.
             
             # The coefficients have been shown to converge to 0. Get the exact degree where this occurs.
             coeffChunk = np.average(np.abs(coeff2), axis=tupleForChunk)
-            deg, eps, rho = getFinalDegree(coeffChunk,tol)
+            if numFuncs is None:
+                deg, eps, rho = getFinalDegree(coeffChunk,tol)
+            else: # Each function gets its own degree from the shared grid
+                deg, eps, rho = np.array([getFinalDegree(coeffChunk[:,i],tol[i]) for i in range(numFuncs)]).T
+                deg = deg.astype(int)
             chebDegrees[currDim] = deg
             epsilons.append(eps)
             rhos.append(rho)
             break # Finished with the current dimension
+    if numFuncs is not None: # The dimensions f is constant in have one value for all the functions
+        return tuple(np.array([np.broadcast_to(value, numFuncs) for value in values])
+                     for values in (chebDegrees, epsilons, rhos))
     return np.array(chebDegrees), np.array(epsilons), np.array(rhos)
 
 def getApproxError(degs, epsilons, rhos):
@@ -355,7 +858,50 @@ def getApproxError(degs, epsilons, rhos):
         approxError += s * thisEps
     return approxError
 
-def chebApproximate(f, a, b, relApproxTol=1e-10):
+def polynomialApproximate(f, a, b):
+    """Gets the Chebyshev coefficients of a MultiCheb or MultiPower polynomial on the interval [a,b].
+
+    The coefficients are mapped onto [a,b] with the exact transformation xHat = alpha*x + beta in
+    each dimension, so f is never evaluated and the degree is the degree of f.
+
+    Parameters
+    ----------
+    f : MultiCheb or MultiPower
+        The polynomial to approximate.
+    a : numpy array
+        The lower bound of the interval in each dimension.
+    b : numpy array
+        The upper bound of the interval in each dimension.
+
+    Returns
+    -------
+    coeff : numpy array
+        The Chebyshev coefficient tensor of f on [a,b].
+    error : float
+        An upper bound on the rounding error of the coefficients.
+    """
+    macheps = 2**-52
+    alphas, betas = (b-a)/2, (b+a)/2
+    if isinstance(f, MultiPower):
+        coeff = f.to_cheb().astype(float)
+        #Each Chebyshev coefficient is a sum of at most sum(shape) products of the power coefficients
+        error = sum(f.coeff.shape) * macheps * np.sum(np.abs(f.coeff))
+    else:
+        coeff = f.coeff.astype(float)
+        #The coefficients are exact on [-1,1]^n, and are rounded like sums of the coefficients when rescaled
+        rescaled = np.any(alphas != 1) or np.any(betas != 0)
+        error = sum(coeff.shape) * macheps * np.sum(np.abs(coeff)) if rescaled else 0.
+    for dim in range(coeff.ndim):
+        if alphas[dim] == 1 and betas[dim] == 0:
+            continue
+        newCoeff = TransformChebInPlaceND(coeff, dim, alphas[dim], betas[dim], True)
+        #The coefficients grow when the interval is bigger than [-1,1], so bound the error with the larger of the two
+        error += max(getTransformationError(coeff, dim), getTransformationError(newCoeff, dim))
+        coeff = newCoeff
+    return coeff, error
+
+def chebApproximate(f, a, b, relApproxTol=1e-10, vectorized=None, executor=None, initialDegrees=None, jitFunctions=False,
+                    dctBackend=None, evaluationCounter=None):
     """Generate and return an approximation for the function f on the interval [a,b].
 
     Uses properties of Chebyshev polynomials and the FFT to quickly generate a reliable
@@ -409,6 +955,26 @@ def chebApproximate(f, a, b, relApproxTol=1e-10):
         converged to zero. If all coefficients after degree n are within relApproxTol * supNorm
         (the maximum function evaluation on the interval) of zero, the coefficients will be
         considered to have converged at degree n. Defaults to 1e-10.
+    vectorized : bool or None
+        Whether f accepts numpy arrays and evaluates them elementwise, so that each Chebyshev grid
+        can be evaluated in a single call. Defaults to None, in which case this is detected by
+        comparing a vectorized call on a few points to evaluating them one at a time.
+    executor : concurrent.futures.Executor (optional)
+        A thread or process pool used to evaluate chunks of each Chebyshev grid concurrently, which
+        helps when f is expensive to evaluate. The values are reassembled in grid order, so the result
+        does not depend on the executor. With a ProcessPoolExecutor, f must be picklable.
+    initialDegrees : list or numpy array (optional)
+        The degree in each dimension to start searching for the degree of the approximation at, instead of 8.
+        Used when the degree is roughly known, like when approximating again on part of an interval.
+    jitFunctions : bool
+        Defaults to False. Whether to try compiling f with numba, see jitFunction, and evaluate the grids
+        with the compiled kernel. If f can't be compiled, it is evaluated as usual.
+    dctBackend : DCTBackend or string (optional)
+        How to compute the DCT that turns function values into coefficients, see DCTBackend. Defaults to
+        'fftpack'.
+    evaluationCounter : EvaluationBudgetCounter (optional)
+        If given, the number of Chebyshev grid points f is evaluated at is added to it. The few points
+        used to check the input aren't counted.
     
     Returns
     -------
@@ -444,7 +1010,96 @@ def chebApproximate(f, a, b, relApproxTol=1e-10):
     # If the function is a MultiCheb object on [-1,1]^n, then return its matrix as the approximation
     if isinstance(f,MultiCheb) and np.allclose(a,-np.ones_like(a)) and np.allclose(b,np.ones_like(b)):
         return f.coeff.astype(float), 0
+    # Other polynomials are transformed onto [a,b] without evaluating them
+    if isinstance(f,MultiCheb) or isinstance(f,MultiPower):
+        return polynomialApproximate(f, a.astype(float), b.astype(float))
     
+    if jitFunctions:
+        kernel = jitFunction(f, a.astype(float), b.astype(float))
+        if kernel is not None:
+            f, vectorized = kernel, True
+
     # Generate and return the approximation
-    degs, epsilons, rhos = getChebyshevDegrees(f, a, b, relApproxTol)
-    return interval_approximate_nd(f, degs, a, b), getApproxError(degs, epsilons, rhos)
+    if vectorized is None:
+        vectorized = isVectorized(f, a, b)
+    dctBackend = getDCTBackend(dctBackend)
+    degs, epsilons, rhos = getChebyshevDegrees(f, a, b, relApproxTol, vectorized=vectorized, executor=executor,
+                                               initialDegrees=initialDegrees, dctBackend=dctBackend,
+                                               evaluationCounter=evaluationCounter)
+    return (interval_approximate_nd(f, degs, a, b, vectorized=vectorized, executor=executor, dctBackend=dctBackend,
+                                    evaluationCounter=evaluationCounter),
+            getApproxError(degs, epsilons, rhos))
+
+def chebApproximateSystem(F, a, b, relApproxTol=1e-10, vectorized=None, executor=None, initialDegrees=None,
+                          dctBackend=None, evaluationCounter=None):
+    """Generate approximations for each component of a function F: R^n -> R^m on the interval [a,b].
+
+    Works like chebApproximate, but F is evaluated once on each grid for all its components, so
+    work the components share is only done once. The grids are sized for the component that needs
+    the highest degree in each dimension, and each component's approximation is cut down to its own
+    degree afterwards.
+
+    Examples
+    --------
+
+    >>> F = lambda x,y: (np.sin(x*y), np.cos(x*y) - y)
+    >>> approxs, errors = yroots.ChebyshevApproximator.chebApproximateSystem(F,[-1,-1],[1,1])
+
+    Parameters
+    ----------
+    F : function
+        The function to be approximated. It takes n inputs and returns a list, tuple, or array of its
+        m components. If vectorized, each component is an array with a value for each point.
+    a: list or numpy array
+        An array containing the lower bound of the approximation interval in each dimension, listed in
+        dimension order
+    b: list or numpy array
+        An array containing the upper bound of the approximation interval in each dimension, listed in
+        dimension order.
+    relApproxTol : float
+        The relative tolerance used to determine at what degree the Chebyshev coefficients of each
+        component have converged to zero. Defaults to 1e-10.
+    vectorized : bool or None
+        Whether F accepts numpy arrays and evaluates them elementwise. Defaults to None, in which case
+        this is detected.
+    executor : concurrent.futures.Executor (optional)
+        A thread or process pool used to evaluate chunks of each Chebyshev grid concurrently.
+    initialDegrees : list or numpy array (optional)
+        The degree in each dimension to start searching for the degree of the approximations at.
+    dctBackend : DCTBackend or string (optional)
+        How to compute the DCT, see DCTBackend. Defaults to 'fftpack'.
+    evaluationCounter : EvaluationBudgetCounter (optional)
+        If given, the number of Chebyshev grid points F is evaluated at is added to it.
+
+    Returns
+    -------
+    coefficient_matrices : list of numpy arrays
+        The coefficient matrix of the Chebyshev approximation of each component.
+    errors : numpy array
+        The error associated with the approximation of each component.
+    """
+    if not hasattr(F, '__call__'):
+        raise ValueError(f"Invalid input: input function is not callable")
+    a, b = np.atleast_1d(np.array(a, dtype=float)), np.atleast_1d(np.array(b, dtype=float))
+    if len(a) != len(b):
+        raise ValueError(f"Invalid input: {len(a)} lower bounds were given but {len(b)} upper bounds were given")
+    if (b<a).any():
+        raise ValueError(f"Invalid input: at least one lower bound is greater than the corresponding upper bound.")
+    try:
+        midValues = np.array(F(*[(u+l)/2 for l,u in zip(a,b)]), dtype=float)
+    except TypeError as e:
+        raise ValueError("Invalid input: length of the upper/lower bound lists must match the dimension of the function")
+    if midValues.ndim != 1:
+        raise ValueError(f"Invalid input: the function should return a list of values, but returned shape {midValues.shape}")
+    numFuncs = len(midValues)
+
+    if vectorized is None:
+        vectorized = isVectorized(F, a, b, numFuncs)
+    dctBackend = getDCTBackend(dctBackend)
+    degs, epsilons, rhos = getChebyshevDegrees(F, a, b, relApproxTol, vectorized=vectorized, executor=executor,
+                                               initialDegrees=initialDegrees, numFuncs=numFuncs, dctBackend=dctBackend,
+                                               evaluationCounter=evaluationCounter)
+    coeffs = interval_approximate_nd(F, np.max(degs, axis=1), a, b, vectorized=vectorized, executor=executor,
+                                     numFuncs=numFuncs, dctBackend=dctBackend, evaluationCounter=evaluationCounter)
+    return ([coeffs[tuple(slice(0, d+1) for d in degs[:,i]) + (i,)] for i in range(numFuncs)],
+            np.array([getApproxError(degs[:,i], epsilons[:,i], rhos[:,i]) for i in range(numFuncs)]))
@@ -2,12 +2,20 @@ import numpy as np
 from numba import njit, float64
 from numba.types import UniTuple
 from itertools import product
-from scipy.spatial import HalfspaceIntersection, QhullError
-from scipy.optimize import linprog
 from yroots.QuadraticCheck import quadratic_check
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from concurrent.futures import wait, FIRST_COMPLETED
+import heapq
+from time import perf_counter
 import copy
 import warnings
 
+#Transformations of dimensions with at least this many coefficients are done by matrix multiplication
+#with a cached transformation matrix, rather than with the recurrence in TransformChebInPlace1D.
+MATRIX_TRANSFORM_MIN_DEGREE = 32
+
 class SolverOptions():
     """Settings for running interval checks, transformations, and subdivision in solvePolyRecursive.
 
@@ -22,11 +30,32 @@ class SolverOptions():
     low_dim_quadratic_check : bool
         Defaults to True. Whether or not to run quadratic check in dim 2, 3.
     all_dim_quadratic_check : bool
-        Defaults to False. Whether or not to run quadratic check in dim >= 4.
+        Defaults to True. Whether or not to run quadratic check in dim >= 4.
     maxZoomCount : int
         Maximum number of zooms allowed before subdividing (prevents infinite infintesimal shrinking)
     level : int
         Depth of subdivision for the given interval.
+    executor : concurrent.futures.Executor
+        Defaults to None. If given, the subintervals created once the subdivision reaches parallelDepth are
+        each solved as a separate task on this executor.
+    parallelDepth : int
+        Defaults to 1. The subdivision depth at which subintervals are handed off to the executor.
+    queueOrder : string
+        Defaults to 'depth'. The order solvePolyQueue solves the intervals in, one of 'depth', 'breadth', 'volume',
+        or 'level'.
+    stats : SolverStats
+        Defaults to None. If given, the statistics of the solve are added to it. Copies of the options share it.
+    tracer : SolverTracer
+        Defaults to None. If given, it is called on each event in the subdivision, see tracers.py.
+    memoryBounded : bool
+        Defaults to False. If True, subdivided intervals don't keep their approximations for solving combined
+        intervals again. They are rebuilt from topMs with the transforms of the interval when needed.
+    topMs : list of numpy arrays
+        Defaults to None. The chebyshev approximations on the search interval, used when memoryBounded.
+    topErrors : numpy array
+        Defaults to None. The errors of the approximations in topMs.
+    budget : SolveBudget
+        Defaults to None. If given, solvePolyQueue stops once it runs out. Copies of the options share it.
     """
     def __init__(self):
         #Init all the Options to default value
@@ -34,14 +63,191 @@ class SolverOptions():
         self.exact = False
         self.constant_check = True
         self.low_dim_quadratic_check = True
-        self.all_dim_quadratic_check = False
+        self.all_dim_quadratic_check = True
         self.maxZoomCount = 25
         self.level = 0
+        self.executor = None
+        self.parallelDepth = 1
+        self.queueOrder = 'depth'
+        self.stats = None
+        self.tracer = None
+        self.memoryBounded = False
+        self.topMs = None
+        self.topErrors = None
+        self.budget = None
 
     def copy(self):
         return copy.copy(self) #Return shallow copy, everything should be a basic type
 
-@njit
+class SolverStats():
+    """Statistics about what the solver did, for finding out why a system is slow to solve.
+
+    Pass one to solve or solveChebyshevSubdivision with the stats argument and it is filled in as
+    the solver runs. The same object can be passed to several solves to add up their statistics.
+
+    Attributes
+    ----------
+    intervalsPerLevel : dict
+        The number of intervals visited at each depth of subdivision, with the search interval at depth 1.
+        Includes restarting an interval for the final step.
+    zoomIterations : int
+        The number of times zoomInOnIntervalIter was run.
+    constantCheckDiscards : int
+        The number of intervals thrown out by the constant term check.
+    quadraticCheckDiscards : int
+        The number of intervals thrown out by quadratic_check.
+    linearCheckDiscards : int
+        The number of intervals thrown out by BoundingIntervalLinearSystem.
+    transforms : int
+        The number of Chebyshev approximations transformed to a new interval, when zooming in, subdividing,
+        or solving again on combined intervals.
+    finalStepEntries : int
+        The number of intervals that started the final step.
+    resolves : int
+        The number of times solve ran again on part of the search interval.
+    reusedApproximations : int
+        The number of approximations on those parts that were transformed from the approximation on the
+        larger interval instead of being sampled again, when solve is run with reuseApproximations.
+    times : dict
+        The seconds spent in each stage of the solver. 'approximation' and 'subdivision' are the two
+        halves of solve. The subdivision is split further into 'constantCheck', 'quadraticCheck',
+        'trim', 'zoom', 'subdivide', and 'combine'.
+    peakCoefficientBytes : int
+        The most bytes of Chebyshev coefficients held at once by solvePolyQueue: the intervals waiting to
+        be solved, the interval being solved with its subintervals, and the approximations subdivided intervals
+        keep for solving combined intervals again. Subtrees solved on an executor are not counted.
+    """
+    def __init__(self):
+        self.intervalsPerLevel = {}
+        self.zoomIterations = 0
+        self.constantCheckDiscards = 0
+        self.quadraticCheckDiscards = 0
+        self.linearCheckDiscards = 0
+        self.transforms = 0
+        self.finalStepEntries = 0
+        self.resolves = 0
+        self.reusedApproximations = 0
+        self.peakCoefficientBytes = 0
+        self.times = {}
+
+    @property
+    def intervalsVisited(self):
+        """The total number of intervals visited."""
+        return sum(self.intervalsPerLevel.values())
+
+    def addTime(self, stage, seconds):
+        self.times[stage] = self.times.get(stage, 0.) + seconds
+
+    @contextmanager
+    def timer(self, stage):
+        """A context manager that adds the time spent in it to stage."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.addTime(stage, perf_counter() - start)
+
+    def merge(self, other):
+        """Adds the statistics from another SolverStats, like one kept by a worker process, to this one."""
+        for level, count in other.intervalsPerLevel.items():
+            self.intervalsPerLevel[level] = self.intervalsPerLevel.get(level, 0) + count
+        for name in ["zoomIterations", "constantCheckDiscards", "quadraticCheckDiscards", "linearCheckDiscards",
+                     "transforms", "finalStepEntries", "resolves", "reusedApproximations"]:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.peakCoefficientBytes = max(self.peakCoefficientBytes, other.peakCoefficientBytes)
+        for stage, seconds in other.times.items():
+            self.addTime(stage, seconds)
+
+    def asDict(self):
+        """Gets the statistics as a dictionary, for saving them as JSON."""
+        result = dict(vars(self))
+        result["intervalsPerLevel"] = dict(sorted(self.intervalsPerLevel.items()))
+        result["intervalsVisited"] = self.intervalsVisited
+        return result
+
+    def __repr__(self):
+        return f"SolverStats({self.asDict()})"
+
+    def __str__(self):
+        lines = [f"Intervals visited: {self.intervalsVisited} " +
+                    str({level:count for level,count in sorted(self.intervalsPerLevel.items())}),
+                 f"Zoom iterations: {self.zoomIterations}",
+                 f"Intervals thrown out: {self.constantCheckDiscards} by the constant term check, " +
+                    f"{self.quadraticCheckDiscards} by the quadratic check, {self.linearCheckDiscards} by the linear check",
+                 f"Transforms: {self.transforms}",
+                 f"Final step entries: {self.finalStepEntries}",
+                 f"Resolves: {self.resolves} ({self.reusedApproximations} approximations reused)",
+                 f"Peak coefficient bytes: {self.peakCoefficientBytes}"]
+        lines += [f"{stage} time: {seconds:.4g}s" for stage, seconds in self.times.items()]
+        return "\n".join(lines)
+
+class SolveBudget():
+    """Limits on the work a solve can do before it stops and returns what it has found so far.
+
+    Pass the limits to solve or solveChebyshevSubdivision, or pass a budget with the budget argument. One
+    budget is shared by the subdivision and all the re-solves of a solve. The limits are checked before each
+    interval of the subdivision is solved and before the functions are approximated on each part of the
+    search interval, so a solve can go over them by the work on one interval or one approximation, or on one
+    depth of the subdivision with the queue order 'level'. The subtrees of the subdivision already running on
+    an executor when a limit runs out aren't stopped. They keep running on the executor after the solve
+    returns, and their intervals are returned as unresolved.
+
+    Parameters
+    ----------
+    maxTime : float
+        Defaults to None. The most seconds the solve can take, from when the budget is made.
+    maxIntervals : int
+        Defaults to None. The most intervals the subdivision can solve. Starting the final step on an interval
+        doesn't count as another one.
+    maxFunctionEvals : int
+        Defaults to None. The most points the functions can be evaluated at to approximate them.
+
+    Attributes
+    ----------
+    intervals : int
+        The number of intervals visited so far.
+    functionEvals : int
+        The number of points the functions have been evaluated at so far.
+    status : string
+        'solved' until one of the limits runs out, then the one that ran out: 'maxTime', 'maxIntervals',
+        or 'maxFunctionEvals'.
+    """
+    def __init__(self, maxTime=None, maxIntervals=None, maxFunctionEvals=None):
+        self.maxTime = maxTime
+        self.maxIntervals = maxIntervals
+        self.maxFunctionEvals = maxFunctionEvals
+        self.start = perf_counter()
+        self.intervals = 0
+        self.functionEvals = 0
+        self.status = 'solved'
+
+    def exhausted(self):
+        """Checks if any of the limits has run out, and records the first one that did in status."""
+        if self.status == 'solved':
+            if self.maxTime is not None and perf_counter() - self.start >= self.maxTime:
+                self.status = 'maxTime'
+            elif self.maxIntervals is not None and self.intervals >= self.maxIntervals:
+                self.status = 'maxIntervals'
+            elif self.maxFunctionEvals is not None and self.functionEvals >= self.maxFunctionEvals:
+                self.status = 'maxFunctionEvals'
+        return self.status != 'solved'
+
+    def remainingTime(self):
+        """The seconds left before maxTime, or None if there is no time limit."""
+        return None if self.maxTime is None else max(self.maxTime - (perf_counter() - self.start), 0.)
+
+    def takeIntervals(self, numIntervals):
+        """Counts visiting up to numIntervals more intervals, and returns how many of them fit in maxIntervals."""
+        if self.maxIntervals is not None:
+            numIntervals = min(numIntervals, self.maxIntervals - self.intervals)
+        self.intervals += numIntervals
+        return numIntervals
+
+def stageTimer(stats, stage):
+    """Times a stage of the solver if statistics are being kept, with stats.timer."""
+    return nullcontext() if stats is None else stats.timer(stage)
+
+@njit(cache=True)
 def TransformChebInPlace1D(coeffs, alpha, beta):
     """Applies the transformation alpha*x + beta to one dimension of a Chebyshev approximation.
 
@@ -118,7 +324,7 @@ def TransformChebInPlace1D(coeffs, alpha, beta):
     #
     return transformedCoeffs[:maxRow]
 
-@njit
+@njit(cache=True)
 def TransformChebInPlace1DErrorFree(coeffs, alpha, beta):
     """Applies the transformation alpha*x + beta to the Chebyshev polynomial coeffs with minimal error.
 
@@ -236,7 +442,7 @@ def TransformChebInPlace1DErrorFree(coeffs, alpha, beta):
         arr3E = arr
     return transformedCoeffs[:maxRow]
 
-@njit
+@njit(cache=True)
 def TransformChebInPlace1DErrorFreeSplit(coeffs, betaSign):
     """Applies the transformation 0.5*x +- 0.5 to the Chebyshev polynomial coeffs with minimal error.
 
@@ -335,6 +541,347 @@ def TransformChebInPlace1DErrorFreeSplit(coeffs, betaSign):
         arr3E = arr
     return transformedCoeffs[:maxRow]
 
+@njit(cache=True)
+def TransformChebAlongAxis(coeffs, alpha, beta):
+    """Applies the transformation alpha*x + beta to the middle axis of a Chebyshev approximation.
+
+    Does the same computation as TransformChebInPlace1D, but on a tensor of shape (pre, n, post) that
+    represents an approximation reshaped so that the dimension being transformed is in the middle. This
+    avoids having to transpose the tensor to put the dimension first.
+
+    Parameters
+    ----------
+    coeffs : numpy array
+        The coefficient tensor, of shape (pre, n, post)
+    alpha : double
+        The scaler of the transformation
+    beta : double
+        The shifting of the transformation
+
+    Returns
+    -------
+    transformedCoeffs : numpy array
+        The new coefficient tensor, with the same shape as coeffs. Only the first maxRow rows of the middle
+        axis can be nonzero.
+    maxRow : int
+        The number of rows of the middle axis that are kept. TransformChebInPlace1D would return
+        transformedCoeffs[:,:maxRow].
+    """
+    pre, n, post = coeffs.shape
+    transformedCoeffs = np.zeros_like(coeffs)
+
+    #The three most recent columns of the transformation matrix C, as in TransformChebInPlace1D
+    arr1 = np.zeros(n)
+    arr2 = np.zeros(n)
+    arr3 = np.zeros(n)
+
+    arr1[0] = 1.
+    arr2[0] = beta
+    arr2[1] = alpha
+    for p in range(pre):
+        for q in range(post):
+            transformedCoeffs[p,0,q] = coeffs[p,0,q]
+            transformedCoeffs[p,0,q] += beta * coeffs[p,1,q]
+            transformedCoeffs[p,1,q] += alpha * coeffs[p,1,q]
+
+    maxRow = 2
+    for col in range(2, n):
+        #Find the column of C
+        arr3[0] = -arr1[0] + alpha*arr2[1] + 2*beta*arr2[0]
+        if maxRow > 2:
+            arr3[1] = -arr1[1] + alpha*(2*arr2[0] + arr2[2]) + 2*beta*arr2[1]
+        for i in range(2, maxRow - 1):
+            arr3[i] = -arr1[i] + alpha*(arr2[i-1] + arr2[i+1]) + 2*beta*arr2[i]
+        i = maxRow - 1
+        arr3[i] = -arr1[i] + (2 if i == 1 else 1)*alpha*(arr2[i-1]) + 2*beta*arr2[i]
+        finalVal = alpha*arr2[i]
+        #Zero out the final entry if it is essentially machine epsilon, like TransformChebInPlace1D
+        lastRow = maxRow + 1 if abs(finalVal) > 1e-16 else maxRow
+        if lastRow > maxRow:
+            arr3[maxRow] = finalVal
+        #Matrix multiplication with the column
+        for p in range(pre):
+            for row in range(lastRow):
+                val = arr3[row]
+                for q in range(post):
+                    transformedCoeffs[p,row,q] += coeffs[p,col,q] * val
+        maxRow = lastRow
+
+        arr = arr1
+        arr1 = arr2
+        arr2 = arr3
+        arr3 = arr
+    return transformedCoeffs, maxRow
+
+@njit(cache=True)
+def TransformChebSplitAlongAxis(coeffs):
+    """Splits the middle axis of a Chebyshev approximation in half at 0, giving both halves in one pass.
+
+    The halves are the transformations 0.5*x - 0.5 and 0.5*x + 0.5. The transformation matrices of the
+    two only differ by sign, C(alpha,-beta)[i,j] = (-1)**(i+j)*C(alpha,beta)[i,j], so each column of C
+    is only calculated once. Gives exactly the same result as two calls to TransformChebAlongAxis.
+
+    Parameters
+    ----------
+    coeffs : numpy array
+        The coefficient tensor, of shape (pre, n, post)
+
+    Returns
+    -------
+    lowerCoeffs : numpy array
+        The coefficient tensor on the lower half, with the same shape as coeffs.
+    upperCoeffs : numpy array
+        The coefficient tensor on the upper half, with the same shape as coeffs.
+    maxRow : int
+        The number of rows of the middle axis that are kept in both.
+    """
+    pre, n, post = coeffs.shape
+    alpha, beta = 0.5, 0.5
+    lowerCoeffs = np.zeros_like(coeffs)
+    upperCoeffs = np.zeros_like(coeffs)
+
+    #The three most recent columns of the transformation matrix C for the upper half
+    arr1 = np.zeros(n)
+    arr2 = np.zeros(n)
+    arr3 = np.zeros(n)
+
+    arr1[0] = 1.
+    arr2[0] = beta
+    arr2[1] = alpha
+    for p in range(pre):
+        for q in range(post):
+            lowerCoeffs[p,0,q] = coeffs[p,0,q]
+            lowerCoeffs[p,0,q] += -beta * coeffs[p,1,q]
+            lowerCoeffs[p,1,q] += alpha * coeffs[p,1,q]
+            upperCoeffs[p,0,q] = coeffs[p,0,q]
+            upperCoeffs[p,0,q] += beta * coeffs[p,1,q]
+            upperCoeffs[p,1,q] += alpha * coeffs[p,1,q]
+
+    maxRow = 2
+    for col in range(2, n):
+        #Find the column of C, as in TransformChebAlongAxis
+        arr3[0] = -arr1[0] + alpha*arr2[1] + 2*beta*arr2[0]
+        if maxRow > 2:
+            arr3[1] = -arr1[1] + alpha*(2*arr2[0] + arr2[2]) + 2*beta*arr2[1]
+        for i in range(2, maxRow - 1):
+            arr3[i] = -arr1[i] + alpha*(arr2[i-1] + arr2[i+1]) + 2*beta*arr2[i]
+        i = maxRow - 1
+        arr3[i] = -arr1[i] + (2 if i == 1 else 1)*alpha*(arr2[i-1]) + 2*beta*arr2[i]
+        finalVal = alpha*arr2[i]
+        lastRow = maxRow + 1 if abs(finalVal) > 1e-16 else maxRow
+        if lastRow > maxRow:
+            arr3[maxRow] = finalVal
+        #Matrix multiplication with the column for both halves
+        for p in range(pre):
+            for row in range(lastRow):
+                val = arr3[row]
+                lowerVal = val if (row + col) % 2 == 0 else -val
+                for q in range(post):
+                    lowerCoeffs[p,row,q] += coeffs[p,col,q] * lowerVal
+                    upperCoeffs[p,row,q] += coeffs[p,col,q] * val
+        maxRow = lastRow
+
+        arr = arr1
+        arr1 = arr2
+        arr2 = arr3
+        arr3 = arr
+    return lowerCoeffs, upperCoeffs, maxRow
+
+@njit(cache=True)
+def TransformChebErrorFreeSplitAlongAxis(coeffs):
+    """Splits the middle axis of a Chebyshev approximation in half at 0 with minimal error, in one pass.
+
+    The same as TransformChebSplitAlongAxis, but the columns of C are calculated as in
+    TransformChebInPlace1DErrorFreeSplit. Gives exactly the same result as calling
+    TransformChebInPlace1DErrorFreeSplit with betaSign -1 and 1.
+
+    Parameters
+    ----------
+    coeffs : numpy array
+        The coefficient tensor, of shape (pre, n, post)
+
+    Returns
+    -------
+    lowerCoeffs : numpy array
+        The coefficient tensor on the lower half, with the same shape as coeffs.
+    upperCoeffs : numpy array
+        The coefficient tensor on the upper half, with the same shape as coeffs.
+    maxRow : int
+        The number of rows of the middle axis that are kept in both.
+    """
+    pre, n, post = coeffs.shape
+    betaSign = 1.
+    lowerCoeffs = np.zeros_like(coeffs)
+    upperCoeffs = np.zeros_like(coeffs)
+    arr1 = np.zeros(n)
+    arr2 = np.zeros(n)
+    arr3 = np.zeros(n)
+    arr1E = np.zeros(n)
+    arr2E = np.zeros(n)
+    arr3E = np.zeros(n)
+
+    arr1[0] = 1.
+    arr2[0] = betaSign*0.5
+    arr2[1] = 0.5
+    for p in range(pre):
+        for q in range(post):
+            lowerCoeffs[p,0,q] = coeffs[p,0,q]
+            lowerCoeffs[p,0,q] += -betaSign*coeffs[p,1,q]/2
+            lowerCoeffs[p,1,q] += coeffs[p,1,q]/2
+            upperCoeffs[p,0,q] = coeffs[p,0,q]
+            upperCoeffs[p,0,q] += betaSign*coeffs[p,1,q]/2
+            upperCoeffs[p,1,q] += coeffs[p,1,q]/2
+
+    maxRow = 2
+    for col in range(2, n):
+        #Find the column of C, as in TransformChebInPlace1DErrorFreeSplit
+        V1, E1 = TwoSum(arr2[1]/2, betaSign*arr2[0])
+        V2, E2 = TwoSum(V1, -arr1[0])
+        arr3[0] = V2
+        arr3E[0] = -arr1E[0] + arr2E[1]/2 + betaSign*arr2E[0] + E1 + E2
+        if maxRow > 2:
+            V1, E1 = TwoSum(arr2[0], arr2[2]/2)
+            V2, E2 = TwoSum(V1, betaSign*arr2[1])
+            V3, E3 = TwoSum(V2, -arr1[1])
+            arr3[1] = V3
+            arr3E[1] = -arr1E[1] + arr2E[0] + arr2E[2]/2 + betaSign*arr2E[1] + E1 + E2 + E3
+        for i in range(2, maxRow - 1):
+            V1, E1 = TwoSum(arr2[i-1], arr2[i+1])
+            V2, E2 = TwoSum(V1/2, betaSign*arr2[i])
+            V3, E3 = TwoSum(V2, -arr1[i])
+            arr3[i] = V3
+            arr3E[i] = -arr1E[i] + (arr2E[i-1] + arr2E[i+1] + E1)/2 + betaSign*arr2E[i] + E2 + E3
+        i = maxRow - 1
+        C1 = (1 if i == 1 else 0.5)
+        V1, E1 = TwoSum(C1*arr2[i-1], betaSign*arr2[i])
+        V2, E2 = TwoSum(V1, -arr1[i])
+        arr3[i] = V2
+        arr3E[i] = -arr1E[i] + C1*arr2E[i-1] + betaSign*arr2E[i] + E1 + E2
+        arr3[maxRow] = arr2[i]/2
+        arr3E[maxRow] = arr2E[i] / 2
+        #Matrix multiplication with the column for both halves. The last entry is always used.
+        for p in range(pre):
+            for row in range(maxRow + 1):
+                val = arr3[row] + arr3E[row]
+                lowerVal = val if (row + col) % 2 == 0 else -val
+                for q in range(post):
+                    lowerCoeffs[p,row,q] += coeffs[p,col,q] * lowerVal
+                    upperCoeffs[p,row,q] += coeffs[p,col,q] * val
+        if abs(arr3[maxRow] + arr3E[maxRow]) > 1e-32:
+            maxRow += 1
+
+        arr = arr1
+        arr1 = arr2
+        arr2 = arr3
+        arr3 = arr
+        arr = arr1E
+        arr1E = arr2E
+        arr2E = arr3E
+        arr3E = arr
+    return lowerCoeffs, upperCoeffs, maxRow
+
+@njit(cache=True)
+def TransformChebBatch(Ms, newMs, alphas, betas, errors):
+    """Transforms a whole list of Chebyshev approximations to the interval xHat = alpha*x + beta.
+
+    Does the same transformation as calling transformCheb with exact = False on each approximation, in a
+    single compiled call. The approximations can all have different shapes. Dimensions that
+    TransformChebInPlace1D would shorten are left full size and padded with zeros.
+
+    Parameters
+    ----------
+    Ms : tuple of numpy arrays
+        The C contiguous chebyshev coefficient tensors, all with the same number of dimensions.
+    newMs : tuple of numpy arrays
+        Arrays of the same shapes as Ms to store the transformed coefficient tensors in.
+    alphas : numpy array
+        The scalers in each dimension of the transformation.
+    betas : numpy array
+        The offsets in each dimension of the transformation.
+    errors : numpy array
+        A bound on the error of each Chebyshev approximation
+
+    Returns
+    -------
+    newErrors : numpy array
+        The errors of the transformed approximations, computed as in transformCheb.
+    sizes : numpy array
+        sizes[k,dim] is how much of dimension dim of newMs[k] should be kept.
+    """
+    machEps = 2**-52
+    newErrors = errors.copy()
+    sizes = np.zeros((len(Ms), len(alphas)), dtype=np.int64)
+    for k in range(len(Ms)):
+        shape = Ms[k].shape
+        work = Ms[k].ravel().copy()
+        for dim in range(len(alphas)):
+            n = shape[dim]
+            #getTransformationError, before the transformation
+            newErrors[k] += n * machEps * np.sum(np.abs(work))
+            sizes[k,dim] = n
+            if (alphas[dim] == 1.0 and betas[dim] == 0.0) or n == 1:
+                continue
+            pre = 1
+            for i in range(dim):
+                pre *= shape[i]
+            post = work.size // (pre*n)
+            transformed, sizes[k,dim] = TransformChebAlongAxis(work.reshape((pre,n,post)), alphas[dim], betas[dim])
+            work = transformed.ravel()
+        newMs[k].reshape(work.size)[:] = work
+    return newErrors, sizes
+
+@njit(cache=True)
+def TransformChebMatrix(n, alpha, beta):
+    """Builds the matrix C of the transformation alpha*x + beta of a degree n-1 Chebyshev polynomial.
+
+    The columns of C are found with the same recurrence as TransformChebInPlace1D, so C @ coeffs
+    is the transformation TransformChebInPlace1D(coeffs, alpha, beta) does.
+
+    Parameters
+    ----------
+    n : int
+        The number of coefficients being transformed
+    alpha : double
+        The scaler of the transformation
+    beta : double
+        The shifting of the transformation
+
+    Returns
+    -------
+    C : numpy array
+        The upper triangular transformation matrix, with the rows TransformChebInPlace1D would cut off removed.
+    """
+    C = np.zeros((n, n))
+    C[0,0] = 1.
+    if n == 1:
+        return C
+    C[0,1] = beta
+    C[1,1] = alpha
+    maxRow = 2
+    for col in range(2, n):
+        C[0,col] = -C[0,col-2] + alpha*C[1,col-1] + 2*beta*C[0,col-1]
+        if maxRow > 2:
+            C[1,col] = -C[1,col-2] + alpha*(2*C[0,col-1] + C[2,col-1]) + 2*beta*C[1,col-1]
+        for i in range(2, maxRow - 1):
+            C[i,col] = -C[i,col-2] + alpha*(C[i-1,col-1] + C[i+1,col-1]) + 2*beta*C[i,col-1]
+        i = maxRow - 1
+        C[i,col] = -C[i,col-2] + (2 if i == 1 else 1)*alpha*(C[i-1,col-1]) + 2*beta*C[i,col-1]
+        finalVal = alpha*C[i,col-1]
+        if abs(finalVal) > 1e-16:
+            C[maxRow,col] = finalVal
+            maxRow += 1
+    return C[:maxRow]
+
+@lru_cache(maxsize=64)
+def getTransformationMatrix(alpha, beta, n):
+    """Gets the read only matrix from TransformChebMatrix, caching the most recently used ones.
+
+    The same transformations come up over and over in subdivision, as each split is at the same point.
+    """
+    C = TransformChebMatrix(n, alpha, beta)
+    C.flags.writeable = False
+    return C
+
 def TransformChebInPlaceND(coeffs, dim, alpha, beta, exact):
     """Transforms a single dimension of a Chebyshev approximation for a polynomial.
 
@@ -361,6 +908,9 @@ def TransformChebInPlaceND(coeffs, dim, alpha, beta, exact):
     #TODO: Make this work for the power basis polynomials
     if (alpha == 1.0 and beta == 0.0) or coeffs.shape[dim] == 1:
         return coeffs # No need to transform if the degree of dim is 0 or transformation is the identity.
+    if not exact and coeffs.shape[dim] >= MATRIX_TRANSFORM_MIN_DEGREE:
+        C = getTransformationMatrix(float(alpha), float(beta), coeffs.shape[dim])
+        return np.moveaxis(np.tensordot(C, coeffs, axes=(1, dim)), 0, dim)
     TransformFunc = TransformChebInPlace1DErrorFree if exact else TransformChebInPlace1D
     if dim == 0:
         return TransformFunc(coeffs, alpha, beta)
@@ -514,7 +1064,7 @@ class TrackedInterval:
 
     def size(self):
         """Gets the volume of the current interval."""
-        return np.product(self.interval[:,1] - self.interval[:,0])
+        return np.prod(self.interval[:,1] - self.interval[:,0])
 
     def dimSize(self):
         """Gets the lengths along each dimension of the current interval."""
@@ -603,8 +1153,29 @@ def getLinearTerms(M):
         spot *= i
     return A[::-1] # Return linear terms in dimension order.
 
+def getLinearTermsBatch(M):
+    """Gets the linear terms of each of a stack of Chebyshev coefficient tensors, as getLinearTerms does.
+
+    Parameters
+    ----------
+    M : numpy array
+        The C contiguous coefficient tensors stacked along the first axis
+
+    Returns
+    -------
+    A: numpy array
+        A[j] has the linear terms of M[j] in dimension order.
+    """
+    flatM = M.reshape(len(M), -1)
+    A = np.zeros((len(M), M.ndim - 1))
+    spot = 1
+    for dim in range(M.ndim - 1, 0, -1):
+        if M.shape[dim] != 1:
+            A[:,dim-1] = flatM[:,spot]
+        spot *= M.shape[dim]
+    return A
 
-@njit
+@njit(cache=True)
 def linearCheck1(totalErrs, A, consts):
     """Takes A, the linear terms of each function approximation, and makes any possible reduction
         in the interval based on the totalErrs."""
@@ -624,6 +1195,15 @@ def linearCheck1(totalErrs, A, consts):
                 b[col] = min(b[col], b_)
     return a, b
 
+@njit(cache=True)
+def linearCheck1Batch(totalErrs, A, consts):
+    """Runs linearCheck1 on a stack of intervals, with the values for interval j in totalErrs[j], A[j], and consts[j]."""
+    a = np.empty_like(consts)
+    b = np.empty_like(consts)
+    for j in range(len(A)):
+        a[j], b[j] = linearCheck1(totalErrs[j], A[j], consts[j])
+    return a, b
+
 def BoundingIntervalLinearSystem(Ms, errors, finalStep, macheps = 2**-52):
     """Finds a smaller region in which any root must be.
 
@@ -722,7 +1302,7 @@ def BoundingIntervalLinearSystem(Ms, errors, finalStep, macheps = 2**-52):
 
         forceShouldStop = finalStep and not wellConditioned
         # Calculate the "changed" variable
-        newRatio = np.product(b - a) / 2**dim
+        newRatio = np.prod(b - a) / 2**dim
         if throwOut:
             changed = True
         elif i == 0:
@@ -748,7 +1328,132 @@ def BoundingIntervalLinearSystem(Ms, errors, finalStep, macheps = 2**-52):
             #so return the original interval with changed = False and is_done = wellConditioned
             return np.vstack([a_orig,b_orig]).T, False, wellConditioned or forceShouldStop, False
 
-@njit(UniTuple(float64,2)(float64, float64))
+def getCheckTerms(Ms):
+    """Gets the terms of approximations of the same shapes on many intervals that the batched checks use.
+
+    Parameters
+    ----------
+    Ms : list of numpy arrays
+        Ms[i][j] is the coefficient tensor of the ith chebyshev polynomial on the jth interval.
+
+    Returns
+    -------
+    A : numpy array
+        A[j,i] has the linear terms of Ms[i][j].
+    consts : numpy array
+        consts[j,i] is the constant term of Ms[i][j].
+    sums : numpy array
+        sums[j,i] is the sum of the absolute values of all the coefficients of Ms[i][j].
+    """
+    flatMs = [M.reshape(len(M), -1) for M in Ms]
+    A = np.stack([getLinearTermsBatch(M) for M in Ms], axis=1)
+    consts = np.stack([M[:,0] for M in flatMs], axis=1)
+    sums = np.stack([np.sum(np.abs(M), axis=1) for M in flatMs], axis=1)
+    return A, consts, sums
+
+def BoundingIntervalLinearSystemBatch(A, consts, sums, errors, finalStep, macheps = 2**-52):
+    """Runs BoundingIntervalLinearSystem on many intervals at once.
+
+    Each step is done for all the intervals in one call, with the SVDs of all the linear terms taken together,
+    so the time doesn't go to numpy's overhead on small approximations.
+
+    Parameters
+    ----------
+    A, consts, sums : numpy arrays
+        The terms of the approximations on each interval, from getCheckTerms. A is changed in place.
+    errors : numpy array
+        errors[j,i] is the maximum error of the ith approximation on the jth interval.
+    finalStep : bool
+        Whether the intervals are in the final step of the algorithm
+
+    Returns
+    -------
+    newIntervals : numpy array
+        newIntervals[j] is the smaller interval where any root of the jth interval must be
+    changed : numpy array
+        Whether each interval has shrunk at all
+    should_stop : numpy array
+        Whether we should stop subdividing each interval
+    throwout : numpy array
+        Whether we should throw out each interval entirely
+    """
+    numIntervals, dim = errors.shape
+    if finalStep:
+        errors = np.zeros_like(errors)
+
+    #Some constants we use here
+    minZoomForChange = 0.99 #If the volume doesn't shrink by this amount say that it hasn't changed
+    minZoomForBaseCaseEnd = 0.4**dim #If the volume doesn't change by at least this amount when running with no error, stop
+    #Get the error of everything but the constant terms combined
+    totalErrs = sums + errors
+    consts = consts.copy()
+    linear_sums = np.sum(np.abs(A), axis=2)
+    err = totalErrs - np.abs(consts) - linear_sums
+
+    #Scale all the polynomials relative to one another
+    errors = errors.copy()
+    scaleVals = np.max(np.abs(A), axis=2)
+    with np.errstate(divide='ignore'):
+        rowScalers = np.where(scaleVals > 0, 2.**np.floor(np.log2(scaleVals)), 1.)
+    A /= rowScalers[:,:,np.newaxis]
+    consts /= rowScalers
+    totalErrs /= rowScalers
+    linear_sums /= rowScalers
+    err /= rowScalers
+    errors /= rowScalers
+    #Precondition the columns. (AP)X = B -> A(PX) = B. So scale columns, solve, then scale the solution.
+    colScaler = np.ones((numIntervals, dim))
+    for i in range(dim):
+        scaleVal = np.max(np.abs(A[:,:,i]), axis=1)
+        scaled = scaleVal > 0
+        with np.errstate(divide='ignore'):
+            s = np.where(scaled, 2**(-np.floor(np.log2(scaleVal))), 1.)
+        colScaler[:,i] = s
+        totalErrs += np.where(scaled[:,np.newaxis], np.abs(A[:,:,i]) * (s[:,np.newaxis] - 1), 0.)
+        A[:,:,i] *= s[:,np.newaxis]
+
+    #Calculate the SVDs of all the linear terms at once
+    U, S, Vh = np.linalg.svd(A)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        condNum = S[:,-1]/S[:,0]
+        wellConditioned = (S[:,0] > 0) & (condNum > 1e-10)
+        #Add this width to the new intervals we find to avoid rounding error throwing out roots
+        widthToAdd = np.maximum(condNum, 2)*macheps
+        Ainv = (1/S[:,np.newaxis,:] * np.swapaxes(Vh, 1, 2)) @ np.swapaxes(U, 1, 2)
+        center = -(Ainv @ consts[:,:,np.newaxis])[:,:,0]
+    #Use the first interval shrinking method
+    a_init, b_init = linearCheck1Batch(totalErrs, A, consts)
+
+    def boundIntervals(a, b, err):
+        #One time through the loop in BoundingIntervalLinearSystem, for all the intervals
+        with np.errstate(invalid='ignore'):
+            #Ainv transforms the hyperrectangle of side lengths err into a parallelogram with these as the principal direction
+            #So summing over them gets the farthest the parallelogram can reach in each dimension.
+            width = np.sum(np.abs(Ainv*err[:,np.newaxis,:]), axis=2)
+            #Bound with previous result where the conditioning is ok
+            a = np.where(wellConditioned[:,np.newaxis], np.maximum(center - width, a), a)
+            b = np.where(wellConditioned[:,np.newaxis], np.minimum(center + width, b), b)
+        #Undo the column preconditioning, add error and bound
+        a = a * colScaler - widthToAdd[:,np.newaxis]
+        b = b * colScaler + widthToAdd[:,np.newaxis]
+        throwOut = np.any(a > b, axis=1) | np.any(a > 1, axis=1) | np.any(b < -1, axis=1)
+        a, b = np.clip(a, -1, 1), np.clip(b, -1, 1)
+        return a, b, throwOut, np.prod(b - a, axis=1) / 2**dim
+
+    forceShouldStop = finalStep & ~wellConditioned
+    a, b, throwOut, newRatio = boundIntervals(a_init, b_init, err)
+    changed = throwOut | (newRatio < minZoomForChange)
+    #If there was no change, run again with tighter errors to see if we would shrink then. BoundingIntervalLinearSystem
+    #changes a_init in place when not well conditioned, so those start from the first result, and return the second.
+    wellConditioned2D = wellConditioned[:,np.newaxis]
+    a2, b2, throwOut2, newRatio2 = boundIntervals(np.where(wellConditioned2D, a_init, a), np.where(wellConditioned2D, b_init, b), errors)
+    changed2 = throwOut2 | (newRatio2 < minZoomForBaseCaseEnd)
+    a = np.where(changed[:,np.newaxis] | wellConditioned2D, a, a2)
+    b = np.where(changed[:,np.newaxis] | wellConditioned2D, b, b2)
+    should_stop = forceShouldStop | (~changed & ~changed2 & wellConditioned)
+    return np.stack([a, b], axis=2), changed, should_stop, changed & throwOut
+
+@njit(UniTuple(float64,2)(float64, float64), cache=True)
 def TwoSum(a,b):
     """Returns x,y such that a+b=x+y exactly, and a+b=x in floating point using numba."""
     x = a+b
@@ -762,7 +1467,7 @@ def TwoSum_NoNumba(a,b):
     y = (a-(x-z)) + (b-z)
     return x,y
 
-@njit(UniTuple(float64,2)(float64))
+@njit(UniTuple(float64,2)(float64), cache=True)
 def Split(a):
     """Returns x,y such that a = x+y exactly and a = x in floating point using numba."""
     c = (2**27 + 1) * a
@@ -776,7 +1481,7 @@ def Split_NoNumba(a):
     y = a-x
     return x,y
 
-@njit(UniTuple(float64,2)(float64, float64))
+@njit(UniTuple(float64,2)(float64, float64), cache=True)
 def TwoProd(a,b):
     """Returns x,y such that a*b=x+y exactly and a*b=x in floating point using numba."""
     x = a*b
@@ -792,7 +1497,7 @@ def TwoProd_NoNumba(a,b):
     y=a2*b2-(((x-a1*b1)-a2*b1)-a1*b2)
     return x,y
 
-@njit(UniTuple(float64,2)(float64, float64, float64, float64))
+@njit(UniTuple(float64,2)(float64, float64, float64, float64), cache=True)
 def TwoProdWithSplit(a,b,a1,a2):
     """Returns x,y such that a*b = x+y exactly and a*b = x in floating point but with a already split."""
     x = a*b
@@ -880,6 +1585,15 @@ def transformChebToInterval(Ms, alphas, betas, errors, exact):
     newErrors : list of numpy arrays
         The new errors associated with the transformed coefficient matrices
     """
+    if not exact and max(max(M.shape) for M in Ms) < MATRIX_TRANSFORM_MIN_DEGREE:
+        #Transform all the chebyshev polynomials at once
+        Ms = tuple(np.ascontiguousarray(M) for M in Ms)
+        newMs = tuple(np.empty_like(M) for M in Ms)
+        newErrors, sizes = TransformChebBatch(Ms, newMs, np.asarray(alphas, dtype=float), np.asarray(betas, dtype=float),
+                                              np.asarray(errors, dtype=float))
+        #Cut off any rows the transformation got rid of
+        newMs = [M if np.all(size == M.shape) else M[tuple(slice(n) for n in size)] for M,size in zip(newMs, sizes)]
+        return newMs, newErrors
     #Transform the chebyshev polynomials
     newMs = []
     newErrors = []
@@ -921,9 +1635,25 @@ def zoomInOnIntervalIter(Ms, errors, trackedInterval, exact):
         Whether or not to continue subdiviing after the iteration of shrinking is completed
     """
 
-    dim = len(Ms)
     #Zoom in on the current interval
     interval, changed, should_stop, throwOut = BoundingIntervalLinearSystem(Ms, errors, trackedInterval.finalStep)
+    return applyBoundingInterval(Ms, errors, trackedInterval, exact, interval, changed, should_stop, throwOut)
+
+def applyBoundingInterval(Ms, errors, trackedInterval, exact, interval, changed, should_stop, throwOut):
+    """Shrinks an interval to the result of BoundingIntervalLinearSystem, the rest of zoomInOnIntervalIter.
+
+    Parameters
+    ----------
+    Ms, errors, trackedInterval, exact
+        As in zoomInOnIntervalIter.
+    interval, changed, should_stop, throwOut
+        The results of BoundingIntervalLinearSystem on the interval.
+
+    Returns
+    -------
+    Ms, errors, trackedInterval, changed, should_stop
+        As in zoomInOnIntervalIter.
+    """
     #Don't zoom in if we're already at a point
     for dim in range(len(Ms)):
         if trackedInterval.interval[dim,0] == trackedInterval.interval[dim,1]:
@@ -974,6 +1704,43 @@ def chebTransform1D(M, alpha, beta, transformDim, exact):
     """
     return TransformChebInPlaceND(M, transformDim, alpha, beta, exact)
 
+def chebSplit1D(M, transformDim, exact):
+    """Splits a Chebyshev coefficient matrix in half at 0 in a single dimension.
+
+    Gives the same result as chebTransform1D(M, 0.5, -0.5, transformDim, exact) and
+    chebTransform1D(M, 0.5, 0.5, transformDim, exact), but finds both halves in one pass when the
+    transformation isn't done by matrix multiplication.
+
+    Parameters
+    ----------
+    M : numpy array
+        The Chebyshev coefficient matrix
+    transformDim:
+        The particular dimension of the approximation to be split
+    exact:
+        Whether the transformation should be performed with higher precision to minimize error
+
+    Returns
+    -------
+    lower_M : numpy array
+        The Chebyshev coefficient matrix on the lower half of the interval in dimension transformDim
+    upper_M : numpy array
+        The Chebyshev coefficient matrix on the upper half of the interval in dimension transformDim
+    """
+    shape = M.shape
+    n = shape[transformDim]
+    if n == 1:
+        return M, M
+    if not exact and n >= MATRIX_TRANSFORM_MIN_DEGREE:
+        #Matrix multiplication is faster for high degrees
+        return chebTransform1D(M, 0.5, -0.5, transformDim, exact), chebTransform1D(M, 0.5, 0.5, transformDim, exact)
+    pre = int(np.prod(shape[:transformDim]))
+    M3D = np.ascontiguousarray(M).reshape((pre, n, M.size//(pre*n)))
+    SplitFunc = TransformChebErrorFreeSplitAlongAxis if exact else TransformChebSplitAlongAxis
+    lower_M, upper_M, maxRow = SplitFunc(M3D)
+    slices = tuple(slice(maxRow) if dim == transformDim else slice(None) for dim in range(M.ndim))
+    return lower_M.reshape(shape)[slices], upper_M.reshape(shape)[slices]
+
 def getInverseOrder(order):
     """Gets a particular order of matrices needed in getSubdivisionIntervals (helper function).
 
@@ -1087,7 +1854,10 @@ def getSubdivisionIntervals(Ms, errors, trackedInterval, exact, level):
             tempErrs = []
             for T,E in zip(currMs, currErrs):
                 #Transform the polys
-                P1, P2 = chebTransform1D(T, alpha, beta, thisDim, exact), chebTransform1D(T, -beta, alpha, thisDim, exact)
+                if newMidpoint == 0:
+                    P1, P2 = chebSplit1D(T, thisDim, exact)
+                else:
+                    P1, P2 = chebTransform1D(T, alpha, beta, thisDim, exact), chebTransform1D(T, -beta, alpha, thisDim, exact)
                 E1 = getTransformationError(T, thisDim)
                 tempMs += [P1, P2]
                 tempErrs += [E1 + E, E1 + E]
@@ -1170,130 +1940,201 @@ def isExteriorInterval(originalInterval, trackedInterval):
     """Determines if the current interval is exterior to its original interval."""
     return np.any(trackedInterval.getIntervalForCombining() == originalInterval.getIntervalForCombining())
 
-def solvePolyRecursive(Ms, trackedInterval, errors, solverOptions):
-    """Recursively shrinks and subdivides the given interval to find the locations of all roots.
+def getWorkerOptions(solverOptions):
+    """Gets a copy of the options to send to the executor with solvePolyRecursive.
+
+    Workers solve their whole subtree themselves, so they are given no executor of their own, and they
+    aren't traced as the tracer might not be safe to share between threads or processes. If statistics
+    are being kept, each worker keeps its own, which solveSubtree sends back to be merged.
+    """
+    workerOptions = solverOptions.copy()
+    workerOptions.executor = None
+    workerOptions.tracer = None
+    if solverOptions.stats is not None:
+        workerOptions.stats = SolverStats()
+    return workerOptions
+
+def solveSubtree(Ms, trackedInterval, errors, solverOptions):
+    """Runs solvePolyRecursive as a task on the executor.
+
+    Returns the results of solvePolyRecursive and the SolverStats (or None) the worker kept.
+    """
+    return solvePolyRecursive(Ms, trackedInterval, errors, solverOptions), solverOptions.stats
+
+def getSubtreeResult(future, solverOptions):
+    """Gets the results of solveSubtree from a finished task, merging its statistics."""
+    result, stats = future.result()
+    if solverOptions.stats is not None:
+        solverOptions.stats.merge(stats)
+    return result
+
+def solveSubintervals(allMs, allErrors, allIntervals, solverOptions):
+    """Runs solvePolyRecursive on each of the subintervals from getSubdivisionIntervals.
+
+    Once the subdivision has reached solverOptions.parallelDepth, each subinterval is sent to
+    solverOptions.executor as its own task. The workers don't subdivide in parallel again, and the
+    results are collected in the order of the subintervals, so the output doesn't depend on which
+    tasks finish first.
 
     Parameters
     ----------
-    Ms : list of numpy arrays
-        The chebyshev approximations of the functions
-    trackedInterval : TrackedInterval
-        The information about the interval we are solving on.
-    errors : numpy array
-        An upper bound for the error of the Chebyshev approximation of the function on the interval
+    allMs : list of lists of numpy arrays
+        The chebyshev approximations of the functions on each subinterval. Emptied if they are solved here.
+    allErrors : list of numpy arrays
+        The error of the approximations on each subinterval
+    allIntervals : list of TrackedIntervals
+        The subintervals to solve on
     solverOptions : SolverOptions
         Desired settings for running interval checks, transformations, and subdivision.
 
     Returns
     -------
-    boundingBoxesInterior : list of numpy arrays (optional)
-        Each element of the list is an interval in which there may be a root. The interval is on the interior of the current
-        interval
-    boundingBoxesExterior : list of numpy arrays (optional)
-        Each element of the list is an interval in which there may be a root. The interval is on the exterior of the current
-        interval
+    results : list of tuples
+        The (boundingBoxesInterior, boundingBoxesExterior) returned by solvePolyRecursive for each subinterval.
     """
-    #TODO: Check if trackedInterval.interval has width 0 in some dimension, in which case we should get rid of that dimension.
-    #If the interval is a point, return it
-    if trackedInterval.isPoint():
-        return [], [trackedInterval]
+    if solverOptions.executor is None or solverOptions.level < solverOptions.parallelDepth:
+        #Take each subinterval's approximations off the list, so they can be freed once its subtree is done with them
+        allMs.reverse()
+        return [solvePolyRecursive(allMs.pop(), newInt, newErrs, solverOptions) for newErrs, newInt in zip(allErrors, allIntervals)]
+    futures = [solverOptions.executor.submit(solveSubtree, newMs, newInt, newErrs, getWorkerOptions(solverOptions))
+                for newMs, newErrs, newInt in zip(allMs, allErrors, allIntervals)]
+    return [getSubtreeResult(future, solverOptions) for future in futures]
 
-    #If we ever change the options in this function, we will need to do a copy here.
-    #Should be cheap, but as we never change them for now just avoid the copy
-    solverOptions = solverOptions.copy()
-    solverOptions.level += 1
+def combineExteriorIntervals(resultExterior, originalInterval):
+    """Combines any of the exterior intervals that overlap, in place.
 
-    #Constant term check, runs at the beginning of the solve and before each subdivision
-    #If the absolute value of the constant term for any of the chebyshev polynomials is greater than the sum of the
-    #absoulte values of any of the other terms, it will return that there are no zeros on that interval
-    if solverOptions.constant_check:
-        consts = np.array([M.ravel()[0] for M in Ms])
-        err = np.array([np.sum(np.abs(M))-abs(c)+e for M,e,c in zip(Ms,errors,consts)])
-        if np.any(np.abs(consts) > err):
-            return [], []
-
-    #Runs quadratic check after constant check, only for dimensions 2 and 3 by default
-    #More expensive than constant term check, but testing show it saves time in lower dimensions
-    if (solverOptions.low_dim_quadratic_check and Ms[0].ndim <= 3) or solverOptions.all_dim_quadratic_check:
-        for i in range(len(Ms)):
-            if quadratic_check(Ms[i], errors[i]):
-                return [], []
-
-    #Trim
-    Ms = Ms.copy()
-    originalMs = Ms.copy()
-    trackedInterval = trackedInterval.copy()
-    errors = errors.copy()
-    tolerable_error = max(errors) * 1e-3
-    trimMs(Ms, errors)
+    Each combined interval is put at the back of the list with reRun set to True. All other intervals get
+    reRun set to False.
 
-    #Solve
-    dim = Ms[0].ndim
-    changed = True
-    zoomCount = 0
-    originalInterval = trackedInterval.copy()
-    originalIntervalSize = trackedInterval.size()
-    #Zoom in while we can
-    lastSizes = trackedInterval.dimSize()
-    while changed and zoomCount <= solverOptions.maxZoomCount:
-        #Zoom in until we stop changing or we hit machine epsilon
-        Ms, errors, trackedInterval, changed, should_stop = zoomInOnIntervalIter(Ms, errors, trackedInterval, solverOptions.exact)
-        if trackedInterval.empty: #Throw out the interval
-            return [], []
-        #Only count in towards the max is we don't cut the interval in half
-        newSizes = trackedInterval.dimSize()
-        if np.all(newSizes >= lastSizes / 2): #Check all dims and use >= to account for a dimension being 0.
-            zoomCount += 1
-        lastSizes = newSizes
-    if should_stop:
-        #Start the final step if the is in the options and we aren't already in it.
-        if trackedInterval.finalStep or not solverOptions.useFinalStep:
-            if solverOptions.verbose:
-                print("*",end="")
-            if isExteriorInterval(originalInterval, trackedInterval):
-                return [], [trackedInterval]
-            else:
-                return [trackedInterval], []
-        else:
-            trackedInterval.startFinalStep()
-            return solvePolyRecursive(Ms, trackedInterval, errors, solverOptions)
-    elif trackedInterval.finalStep:
-        trackedInterval.canThrowOutFinalStep = True
-        allMs, allErrors, allIntervals = getSubdivisionIntervals(Ms, errors, trackedInterval, solverOptions.exact, solverOptions.level)
-        resultsAll = []
-        for newMs, newErrs, newInt in zip(allMs, allErrors, allIntervals):
-            newInterior, newExterior = solvePolyRecursive(newMs, newInt, newErrs, solverOptions)
-            resultsAll += newInterior + newExterior
-        if len(resultsAll) == 0:
-            #Can't throw out final step! This might not actually be a root though!
-            trackedInterval.possibleExtraRoot = True
-            if isExteriorInterval(originalInterval, trackedInterval):
-                return [], [trackedInterval]
-            else:
-                return [trackedInterval], []
-        else:
-            #Combine all roots that converged to the same point.
-            allFoundRoots = set()
-            tempResults = []
-            for result in resultsAll:
-                point = tuple(result.interval[:,0])
-                if point in allFoundRoots:
-                    continue
-                allFoundRoots.add(point)
-                tempResults.append(result)
-            for result in tempResults:
-                if len(result.possibleDuplicateRoots) > 0:
-                    trackedInterval.possibleDuplicateRoots += result.possibleDuplicateRoots
-                else:
-                    trackedInterval.possibleDuplicateRoots.append(result.getFinalPoint())
-            if isExteriorInterval(originalInterval, trackedInterval):
-                return [], [trackedInterval]
+    Parameters
+    ----------
+    resultExterior : list of TrackedIntervals
+        The intervals found by the subintervals that lie on the exterior of those subintervals.
+    originalInterval : TrackedInterval
+        The interval that was subdivided.
+    """
+    idx1 = 0
+    idx2 = 1
+    #Combine any touching intervals and throw them at the end. Flip a bool saying rerun them
+    #If changing this code, test it by defaulting the nextTransformationsInterals to 0, so roots lie on the boundary more.
+    for tempInterval in resultExterior:
+        tempInterval.reRun = False
+    while idx1 < len(resultExterior):
+        while idx2 < len(resultExterior):
+            if resultExterior[idx1].overlapsWith(resultExterior[idx2]):
+                #Combine, throw at the back. Set reRun to true.
+                combinedInterval = originalInterval.copy()
+                if combinedInterval.finalStep:
+                    combinedInterval.interval = combinedInterval.preFinalInterval.copy()
+                    combinedInterval.transforms = combinedInterval.preFinalTransforms.copy()
+                newAs = np.min([resultExterior[idx1].getIntervalForCombining()[:,0], resultExterior[idx2].getIntervalForCombining()[:,0]], axis=0)
+                newBs = np.max([resultExterior[idx1].getIntervalForCombining()[:,1], resultExterior[idx2].getIntervalForCombining()[:,1]], axis=0)
+                final1 = resultExterior[idx1].getFinalInterval()
+                final2 = resultExterior[idx2].getFinalInterval()
+                newAsFinal = np.min([final1[:,0], final2[:,0]], axis=0)
+                newBsFinal = np.max([final1[:,1], final2[:,1]], axis=0)
+                oldAs = originalInterval.interval[:,0]
+                oldBs = originalInterval.interval[:,1]
+                oldAsFinal, oldBsFinal = originalInterval.getFinalInterval().T
+                #Find the final A and B values exactly. Then do the currSubinterval calculation exactly.
+                #Look at what was done on the example that's failing and see why.
+                equalMask = oldBsFinal == oldAsFinal
+                oldBsFinal[equalMask] = oldBsFinal[equalMask] + 1 #Avoid a divide by zero on the next line
+                currSubinterval = ((2*np.array([newAsFinal, newBsFinal]) - oldAsFinal - oldBsFinal)/(oldBsFinal - oldAsFinal)).T
+                #If the interval is exactly -1 or 1, make sure that shows up as exact.
+                currSubinterval[equalMask,0] = -1
+                currSubinterval[equalMask,1] = 1
+                currSubinterval[:,0][oldAs == newAs] = -1
+                currSubinterval[:,1][oldBs == newBs] = 1
+                #Update the current subinterval. Use the best transform we can get here, but use the exact combined
+                #interval for tracking
+                combinedInterval.addTransform(currSubinterval)
+                combinedInterval.interval = np.array([newAs, newBs]).T
+                combinedInterval.reRun = True
+                del resultExterior[idx2]
+                del resultExterior[idx1]
+                resultExterior.append(combinedInterval)
+                idx2 = idx1 + 1
             else:
-                return [trackedInterval], []
-            #TODO: Don't subdivide in the final step in dimensions that are already points!
-    else:
-        #Otherwise, Subdivide
-        if solverOptions.level == 15:
+                idx2 += 1
+        idx1 += 1
+        idx2 = idx1 + 1
+
+def rebuildMs(Ms, errors, trackedInterval, exact):
+    """Transforms the approximations on the search interval to trackedInterval with its recorded transforms.
+
+    Parameters
+    ----------
+    Ms : list of numpy arrays
+        The chebyshev approximations of the functions on the search interval
+    errors : numpy array
+        The error of the approximations in Ms
+    trackedInterval : TrackedInterval
+        The interval to transform the approximations to
+    exact : bool
+        Whether to perform the transformations with higher precision to minimize error
+
+    Returns
+    -------
+    Ms : list of numpy arrays
+        The approximations on trackedInterval
+    errors : numpy array
+        The errors of the approximations, including the error of each transformation
+    """
+    Ms, errors = list(Ms), np.array(errors, dtype=float)
+    for alphas, betas in trackedInterval.transforms:
+        Ms, errors = transformChebToInterval(Ms, alphas, betas, errors, exact)
+    return Ms, errors
+
+def coefficientBytes(Ms):
+    """Gets the number of bytes in a list of coefficient tensors."""
+    return sum(M.nbytes for M in Ms)
+
+class SubdivisionNode():
+    """An interval that has to be subdivided, waiting on the results from its subintervals.
+
+    Creating the node gets the subintervals to solve on. Once they are solved, addResults combines the
+    results and returns the combined intervals that have to be solved again. Once those are solved as well,
+    getResults returns the bounding boxes for the interval.
+
+    Parameters
+    ----------
+    Ms : list of numpy arrays
+        The chebyshev approximations of the functions on the interval after zooming in.
+    originalMs : list of numpy arrays
+        The chebyshev approximations of the functions on the interval before zooming in. These are only
+        kept if not solverOptions.memoryBounded, otherwise they are rebuilt if combined intervals need them.
+    errors : numpy array
+        The error of the approximations in Ms.
+    trackedInterval : TrackedInterval
+        The interval after zooming in.
+    originalInterval : TrackedInterval
+        The interval before zooming in.
+    solverOptions : SolverOptions
+        The settings used to solve on the interval.
+
+    Attributes
+    ----------
+    allMs, allErrors, allIntervals : lists
+        The approximations, errors, and intervals for each of the subintervals, from getSubdivisionIntervals.
+        allMs is set to None once the subintervals are handed off to be solved.
+    """
+    def __init__(self, Ms, originalMs, errors, trackedInterval, originalInterval, solverOptions):
+        self.originalMs = None if solverOptions.memoryBounded else originalMs
+        self.errors = errors
+        self.trackedInterval = trackedInterval
+        self.originalInterval = originalInterval
+        self.solverOptions = solverOptions
+        #Where the results go in solvePolyQueue
+        self.parent = None
+        self.slot = 0
+        self.results = None
+        self.pending = 0
+        self.reRuns = None
+        self.heldBytes = 0 #The bytes of originalMs solvePolyQueue counts as held by the node
+        if trackedInterval.finalStep:
+            trackedInterval.canThrowOutFinalStep = True
+        elif solverOptions.level == 15:
             warnings.warn(f"High subdivision depth!\nSubdivision on the search interval has now reached" +
                           " at least depth 15. Runtime may be prolonged.")
         elif solverOptions.level == 25:
@@ -1301,75 +2142,112 @@ def solvePolyRecursive(Ms, trackedInterval, errors, solverOptions):
                           " at least depth 25, which is unusual. The solver may not finish running." +
                           "Ensure the input functions meet the requirements of being continuous, smooth," +
                           "and having only finitely many simple roots on the search interval.")
-        resultInterior, resultExterior = [], []
         #Get the new intervals and polynomials
-        allMs, allErrors, allIntervals = getSubdivisionIntervals(Ms, errors, trackedInterval, solverOptions.exact, solverOptions.level)
-        #Run each interval
-        for newMs, newErrs, newInt in zip(allMs, allErrors, allIntervals):
-            newInterior, newExterior = solvePolyRecursive(newMs, newInt, newErrs, solverOptions)
-            resultInterior += newInterior
-            resultExterior += newExterior
-        #Rerun the touching intervals
-        idx1 = 0
-        idx2 = 1
-        #Combine any touching intervals and throw them at the end. Flip a bool saying rerun them
-        #If changing this code, test it by defaulting the nextTransformationsInterals to 0, so roots lie on the boundary more.
-        #TODO: Make the combining intervals it's own function!!!
-        for tempInterval in resultExterior:
-            tempInterval.reRun = False
-        while idx1 < len(resultExterior):
-            while idx2 < len(resultExterior):
-                if resultExterior[idx1].overlapsWith(resultExterior[idx2]):
-                    #Combine, throw at the back. Set reRun to true.
-                    combinedInterval = originalInterval.copy()
-                    if combinedInterval.finalStep:
-                        combinedInterval.interval = combinedInterval.preFinalInterval.copy()
-                        combinedInterval.transforms = combinedInterval.preFinalTransforms.copy()
-                    newAs = np.min([resultExterior[idx1].getIntervalForCombining()[:,0], resultExterior[idx2].getIntervalForCombining()[:,0]], axis=0)
-                    newBs = np.max([resultExterior[idx1].getIntervalForCombining()[:,1], resultExterior[idx2].getIntervalForCombining()[:,1]], axis=0)
-                    final1 = resultExterior[idx1].getFinalInterval()
-                    final2 = resultExterior[idx2].getFinalInterval()
-                    newAsFinal = np.min([final1[:,0], final2[:,0]], axis=0)
-                    newBsFinal = np.max([final1[:,1], final2[:,1]], axis=0)
-                    oldAs = originalInterval.interval[:,0]
-                    oldBs = originalInterval.interval[:,1]
-                    oldAsFinal, oldBsFinal = originalInterval.getFinalInterval().T
-                    #Find the final A and B values exactly. Then do the currSubinterval calculation exactly.
-                    #Look at what was done on the example that's failing and see why.
-                    equalMask = oldBsFinal == oldAsFinal
-                    oldBsFinal[equalMask] = oldBsFinal[equalMask] + 1 #Avoid a divide by zero on the next line
-                    currSubinterval = ((2*np.array([newAsFinal, newBsFinal]) - oldAsFinal - oldBsFinal)/(oldBsFinal - oldAsFinal)).T
-                    #If the interval is exactly -1 or 1, make sure that shows up as exact.
-                    currSubinterval[equalMask,0] = -1
-                    currSubinterval[equalMask,1] = 1
-                    currSubinterval[:,0][oldAs == newAs] = -1
-                    currSubinterval[:,1][oldBs == newBs] = 1
-                    #Update the current subinterval. Use the best transform we can get here, but use the exact combined
-                    #interval for tracking
-                    combinedInterval.addTransform(currSubinterval)
-                    combinedInterval.interval = np.array([newAs, newBs]).T
-                    combinedInterval.reRun = True
-                    del resultExterior[idx2]
-                    del resultExterior[idx1]
-                    resultExterior.append(combinedInterval)
-                    idx2 = idx1 + 1
-                else:
-                    idx2 += 1
-            idx1 += 1
-            idx2 = idx1 + 1
-        #Rerun, check if still on exterior
+        with stageTimer(solverOptions.stats, 'subdivide'):
+            self.allMs, self.allErrors, self.allIntervals = getSubdivisionIntervals(Ms, errors, trackedInterval, solverOptions.exact, solverOptions.level)
+        if solverOptions.stats is not None:
+            solverOptions.stats.transforms += len(self.allIntervals)*len(Ms)
+        if solverOptions.tracer is not None:
+            solverOptions.tracer.intervalSubdivided(trackedInterval, solverOptions.level, len(self.allIntervals))
+
+    def addResults(self, results):
+        """Combines the results from the subintervals.
+
+        Parameters
+        ----------
+        results : list of tuples
+            The (boundingBoxesInterior, boundingBoxesExterior) found on each subinterval, in order.
+
+        Returns
+        -------
+        reRuns : list of tuples
+            The (Ms, trackedInterval, errors) for each combined interval that has to be solved again.
+        """
+        self.resultInterior, self.resultExterior = [], []
+        for newInterior, newExterior in results:
+            self.resultInterior += newInterior
+            self.resultExterior += newExterior
+        if self.trackedInterval.finalStep:
+            return []
+        stats = self.solverOptions.stats
+        with stageTimer(stats, 'combine'):
+            combineExteriorIntervals(self.resultExterior, self.originalInterval)
+            reRuns = []
+            originalMs, originalErrors = self.originalMs, self.errors
+            for tempInterval in self.resultExterior:
+                if tempInterval.reRun and not np.all(tempInterval.interval == self.originalInterval.interval):
+                    if originalMs is None:
+                        #Rebuild the approximations from the search interval. They weren't trimmed along the way,
+                        #so keep the larger error bound to solve the same way as with the kept approximations.
+                        originalMs, rebuiltErrors = rebuildMs(self.solverOptions.topMs, self.solverOptions.topErrors,
+                                                              self.originalInterval, self.solverOptions.exact)
+                        originalErrors = np.maximum(self.errors, rebuiltErrors)
+                        if stats is not None:
+                            stats.transforms += len(self.originalInterval.transforms)*len(originalMs)
+                    #Project the MS onto the interval, then recall the function.
+                    #TODO: Instead of using the originalMs, use Ms, and then don't use the original interval, use the one
+                    #we started subdivision with.
+                    tempMs, tempErrors = transformChebToInterval(originalMs, *tempInterval.getLastTransform(), originalErrors, self.solverOptions.exact)
+                    reRuns.append((tempMs, tempInterval, tempErrors))
+                    if self.solverOptions.tracer is not None:
+                        self.solverOptions.tracer.intervalsCombined(tempInterval, self.solverOptions.level)
+        if stats is not None:
+            stats.transforms += len(reRuns)*len(self.errors)
+        return reRuns
+
+    def getResults(self, reRunResults):
+        """Gets the bounding boxes for the interval.
+
+        Parameters
+        ----------
+        reRunResults : list of tuples
+            The (boundingBoxesInterior, boundingBoxesExterior) found on each of the intervals from addResults.
+
+        Returns
+        -------
+        boundingBoxesInterior : list of TrackedIntervals
+            The intervals in which there may be a root on the interior of the interval.
+        boundingBoxesExterior : list of TrackedIntervals
+            The intervals in which there may be a root on the exterior of the interval.
+        """
+        trackedInterval = self.trackedInterval
+        originalInterval = self.originalInterval
+        if trackedInterval.finalStep:
+            resultsAll = self.resultInterior + self.resultExterior
+            if len(resultsAll) == 0:
+                #Can't throw out final step! This might not actually be a root though!
+                trackedInterval.possibleExtraRoot = True
+            else:
+                #Combine all roots that converged to the same point.
+                allFoundRoots = set()
+                tempResults = []
+                for result in resultsAll:
+                    point = tuple(result.interval[:,0])
+                    if point in allFoundRoots:
+                        continue
+                    allFoundRoots.add(point)
+                    tempResults.append(result)
+                for result in tempResults:
+                    if len(result.possibleDuplicateRoots) > 0:
+                        trackedInterval.possibleDuplicateRoots += result.possibleDuplicateRoots
+                    else:
+                        trackedInterval.possibleDuplicateRoots.append(result.getFinalPoint())
+                #TODO: Don't subdivide in the final step in dimensions that are already points!
+            if isExteriorInterval(originalInterval, trackedInterval):
+                return [], [trackedInterval]
+            else:
+                return [trackedInterval], []
+        #Check if the intervals are still on the exterior
+        resultInterior = self.resultInterior
         newResultExterior = []
-        for tempInterval in resultExterior:
+        reRunResults = iter(reRunResults)
+        for tempInterval in self.resultExterior:
             if tempInterval.reRun:
                 if np.all(tempInterval.interval == originalInterval.interval):
                     newResultExterior.append(tempInterval)
                 else:
-                    #Project the MS onto the interval, then recall the function.
-                    #TODO: Instead of using the originalMs, use Ms, and then don't use the original interval, use the one
-                    #we started subdivision with.
-                    tempMs, tempErrors = transformChebToInterval(originalMs, *tempInterval.getLastTransform(), errors, solverOptions.exact)
-                    tempResultsInterior, tempResultsExterior = solvePolyRecursive(tempMs, tempInterval, tempErrors, solverOptions)
                     #We can assume that nothing in these has to be recombined
+                    tempResultsInterior, tempResultsExterior = next(reRunResults)
                     resultInterior += tempResultsInterior
                     newResultExterior += tempResultsExterior
             elif isExteriorInterval(originalInterval, tempInterval):
@@ -1378,7 +2256,621 @@ def solvePolyRecursive(Ms, trackedInterval, errors, solverOptions):
                 resultInterior.append(tempInterval)
         return resultInterior, newResultExterior
 
-def solveChebyshevSubdivision(Ms, errors, verbose = False, returnBoundingBoxes = False, exact = False, constant_check = True, low_dim_quadratic_check = True, all_dim_quadratic_check = False):
+    def getPartialResults(self):
+        """Gets the bounding boxes found so far, when the solve stops before the node has all of its results.
+
+        Returns
+        -------
+        boundingBoxes : list of TrackedIntervals
+            The boxes in the results that are in, except for the combined intervals still being solved again.
+        """
+        boxes = []
+        if self.reRuns is not None:
+            boxes += self.resultInterior
+            boxes += [tempInterval for tempInterval in self.resultExterior
+                      if not tempInterval.reRun or np.all(tempInterval.interval == self.originalInterval.interval)]
+        for result in self.results:
+            if result is not None:
+                boxes += result[0] + result[1]
+        return boxes
+
+def enterInterval(trackedInterval, solverOptions):
+    """Starts a visit to an interval, counting it and telling the tracer.
+
+    Returns
+    -------
+    solverOptions : SolverOptions
+        A copy of the options with the level of the interval.
+    """
+    #If we ever change the options in this function, we will need to do a copy here.
+    #Should be cheap, but as we never change them for now just avoid the copy
+    solverOptions = solverOptions.copy()
+    solverOptions.level += 1
+    stats = solverOptions.stats
+    if stats is not None:
+        stats.intervalsPerLevel[solverOptions.level] = stats.intervalsPerLevel.get(solverOptions.level, 0) + 1
+    if solverOptions.tracer is not None:
+        solverOptions.tracer.intervalEntered(trackedInterval, solverOptions.level)
+    return solverOptions
+
+def pruneInterval(trackedInterval, solverOptions, reason):
+    """Records that an interval was thrown out, where reason is 'constantCheck', 'quadraticCheck', or 'linearCheck'.
+
+    Returns
+    -------
+    results : tuple of lists
+        The empty (boundingBoxesInterior, boundingBoxesExterior) of the interval.
+    """
+    stats = solverOptions.stats
+    if stats is not None:
+        setattr(stats, reason + "Discards", getattr(stats, reason + "Discards") + 1)
+    if solverOptions.tracer is not None:
+        solverOptions.tracer.intervalPruned(trackedInterval, solverOptions.level, reason)
+    return [], []
+
+def runsQuadraticCheck(Ms, solverOptions):
+    """Whether the quadratic check is run on approximations of the dimension of Ms."""
+    return (solverOptions.low_dim_quadratic_check and Ms[0].ndim <= 3) or solverOptions.all_dim_quadratic_check
+
+def recordZoom(trackedInterval, solverOptions, numMs, changed, lastSizes):
+    """Records an iteration of zoomInOnIntervalIter, once the interval is known not to be empty.
+
+    Returns
+    -------
+    newSizes : numpy array
+        The lengths of the interval along each dimension after zooming in.
+    countsTowardsMax : bool
+        Whether the iteration counts towards solverOptions.maxZoomCount, as it didn't cut the interval in half.
+    """
+    if changed and solverOptions.stats is not None:
+        solverOptions.stats.transforms += numMs
+    newSizes = trackedInterval.dimSize()
+    if changed and solverOptions.tracer is not None:
+        solverOptions.tracer.intervalZoomed(trackedInterval, solverOptions.level, np.prod(np.divide(newSizes, lastSizes, out=np.ones_like(newSizes), where=lastSizes > 0)))
+    #Check all dims and use >= to account for a dimension being 0.
+    return newSizes, np.all(newSizes >= lastSizes / 2)
+
+def finishZooming(Ms, originalMs, errors, trackedInterval, originalInterval, solverOptions, should_stop):
+    """Subdivides the interval, reports it as a root, or starts the final step on it once zooming in is done.
+
+    Returns
+    -------
+    result : tuple of lists, SubdivisionNode, or None
+        The (boundingBoxesInterior, boundingBoxesExterior) for the interval if it is done, a SubdivisionNode
+        if it has to be subdivided, or None if it started the final step and has to be checked again.
+    """
+    if not should_stop:
+        #Otherwise, Subdivide
+        return SubdivisionNode(Ms, originalMs, errors, trackedInterval, originalInterval, solverOptions)
+    tracer = solverOptions.tracer
+    #Start the final step if the is in the options and we aren't already in it.
+    if trackedInterval.finalStep or not solverOptions.useFinalStep:
+        if solverOptions.verbose:
+            print("*",end="")
+        if tracer is not None:
+            tracer.rootBoxFound(trackedInterval, solverOptions.level)
+        if isExteriorInterval(originalInterval, trackedInterval):
+            return [], [trackedInterval]
+        else:
+            return [trackedInterval], []
+    #Run the checks again on the final step interval
+    if tracer is not None:
+        tracer.finalStepStarted(trackedInterval, solverOptions.level)
+    trackedInterval.startFinalStep()
+    if solverOptions.stats is not None:
+        solverOptions.stats.finalStepEntries += 1
+    return None
+
+def zoomInOnInterval(Ms, trackedInterval, errors, solverOptions):
+    """Runs the interval checks on the given interval and shrinks it as far as possible.
+
+    Parameters
+    ----------
+    Ms : list of numpy arrays
+        The chebyshev approximations of the functions
+    trackedInterval : TrackedInterval
+        The information about the interval we are solving on.
+    errors : numpy array
+        An upper bound for the error of the Chebyshev approximation of the function on the interval
+    solverOptions : SolverOptions
+        Desired settings for running interval checks, transformations, and subdivision.
+
+    Returns
+    -------
+    result : tuple of lists or SubdivisionNode
+        The (boundingBoxesInterior, boundingBoxesExterior) for the interval if it is done, otherwise
+        a SubdivisionNode for the interval that still has to be subdivided.
+    """
+    while True:
+        #TODO: Check if trackedInterval.interval has width 0 in some dimension, in which case we should get rid of that dimension.
+        #If the interval is a point, return it
+        if trackedInterval.isPoint():
+            if solverOptions.tracer is not None:
+                solverOptions.tracer.rootBoxFound(trackedInterval, solverOptions.level)
+            return [], [trackedInterval]
+
+        solverOptions = enterInterval(trackedInterval, solverOptions)
+        stats = solverOptions.stats
+
+        #Constant term check, runs at the beginning of the solve and before each subdivision
+        #If the absolute value of the constant term for any of the chebyshev polynomials is greater than the sum of the
+        #absoulte values of any of the other terms, it will return that there are no zeros on that interval
+        if solverOptions.constant_check:
+            with stageTimer(stats, 'constantCheck'):
+                consts = np.array([M.ravel()[0] for M in Ms])
+                err = np.array([np.sum(np.abs(M))-abs(c)+e for M,e,c in zip(Ms,errors,consts)])
+                throwOut = np.any(np.abs(consts) > err)
+            if throwOut:
+                return pruneInterval(trackedInterval, solverOptions, 'constantCheck')
+
+        #Runs quadratic check after constant check, in all dimensions by default
+        #More expensive than constant term check, but with the compiled checks it saves time even in 4D
+        if runsQuadraticCheck(Ms, solverOptions):
+            with stageTimer(stats, 'quadraticCheck'):
+                throwOut = any(quadratic_check(Ms[i], errors[i]) for i in range(len(Ms)))
+            if throwOut:
+                return pruneInterval(trackedInterval, solverOptions, 'quadraticCheck')
+
+        #Trim
+        with stageTimer(stats, 'trim'):
+            Ms = Ms.copy()
+            originalMs = Ms.copy()
+            trackedInterval = trackedInterval.copy()
+            errors = errors.copy()
+            trimMs(Ms, errors)
+
+        #Solve
+        changed = True
+        zoomCount = 0
+        originalInterval = trackedInterval.copy()
+        #Zoom in while we can
+        lastSizes = trackedInterval.dimSize()
+        while changed and zoomCount <= solverOptions.maxZoomCount:
+            #Zoom in until we stop changing or we hit machine epsilon
+            with stageTimer(stats, 'zoom'):
+                Ms, errors, trackedInterval, changed, should_stop = zoomInOnIntervalIter(Ms, errors, trackedInterval, solverOptions.exact)
+            if stats is not None:
+                stats.zoomIterations += 1
+            if trackedInterval.empty: #Throw out the interval
+                return pruneInterval(trackedInterval, solverOptions, 'linearCheck')
+            #Only count in towards the max is we don't cut the interval in half
+            lastSizes, countsTowardsMax = recordZoom(trackedInterval, solverOptions, len(Ms), changed, lastSizes)
+            if countsTowardsMax:
+                zoomCount += 1
+        result = finishZooming(Ms, originalMs, errors, trackedInterval, originalInterval, solverOptions, should_stop)
+        if result is not None:
+            return result
+
+def constantCheckBatch(consts, sums, errors):
+    """Runs the constant term check from zoomInOnInterval on many intervals at once.
+
+    Parameters
+    ----------
+    consts, sums : numpy arrays
+        The terms of the approximations on each interval, from getCheckTerms.
+    errors : numpy array
+        errors[j,i] is the maximum error of the ith approximation on the jth interval.
+
+    Returns
+    -------
+    throwOut : numpy array
+        Whether each interval can be thrown out.
+    """
+    return np.any(np.abs(consts) > sums - np.abs(consts) + errors, axis=1)
+
+class IntervalVisit():
+    """The state of an interval going through zoomInOnIntervals, with the variables of zoomInOnInterval."""
+    def __init__(self, Ms, trackedInterval, errors, solverOptions):
+        self.Ms = Ms
+        self.trackedInterval = trackedInterval
+        self.errors = errors
+        self.solverOptions = solverOptions
+        self.result = None
+
+def getVisitTerms(visits):
+    """Gets the terms from getCheckTerms for visits with any shapes of approximations.
+
+    The approximations of each shape are stacked to get their terms together.
+
+    Returns
+    -------
+    visits : list of IntervalVisits
+        The visits, reordered to match the terms.
+    A, consts, sums : numpy arrays
+        The terms from getCheckTerms for each visit.
+    errors : numpy array
+        The errors of the approximations of each visit.
+    """
+    groups = {}
+    for visit in visits:
+        groups.setdefault(tuple(M.shape for M in visit.Ms), []).append(visit)
+    visits, terms = [], []
+    for group in groups.values():
+        visits += group
+        terms.append(getCheckTerms([np.stack([visit.Ms[i] for visit in group]) for i in range(len(group[0].Ms))]))
+    A, consts, sums = [np.concatenate(term) for term in zip(*terms)]
+    return visits, A, consts, sums, np.array([visit.errors for visit in visits])
+
+def zoomInOnIntervals(tasks):
+    """Runs zoomInOnInterval on many intervals at once, a step at a time.
+
+    The intervals go through the constant term check and BoundingIntervalLinearSystem together, with the
+    terms they need taken from all the approximations of the same shape at once, so deep in the subdivision,
+    where there are many intervals with small approximations, the time isn't spent on numpy's overhead for
+    each interval.
+    The quadratic check, trimming, and transformations are still done for each interval.
+
+    Parameters
+    ----------
+    tasks : list of tuples
+        The (Ms, trackedInterval, errors, solverOptions) to call zoomInOnInterval with for each interval.
+
+    Returns
+    -------
+    results : list
+        What zoomInOnInterval returns for each interval, in order.
+    """
+    visits = [IntervalVisit(*task) for task in tasks]
+    stats = visits[0].solverOptions.stats
+    entering = visits
+    while len(entering) > 0:
+        checking = []
+        for visit in entering:
+            #If the interval is a point, return it
+            if visit.trackedInterval.isPoint():
+                if visit.solverOptions.tracer is not None:
+                    visit.solverOptions.tracer.rootBoxFound(visit.trackedInterval, visit.solverOptions.level)
+                visit.result = [], [visit.trackedInterval]
+            else:
+                visit.solverOptions = enterInterval(visit.trackedInterval, visit.solverOptions)
+                checking.append(visit)
+
+        #Constant term check
+        toCheck = [visit for visit in checking if visit.solverOptions.constant_check]
+        if len(toCheck) > 0:
+            with stageTimer(stats, 'constantCheck'):
+                toCheck, A, consts, sums, errors = getVisitTerms(toCheck)
+                throwOut = constantCheckBatch(consts, sums, errors)
+            for visit, visitThrowOut in zip(toCheck, throwOut):
+                if visitThrowOut:
+                    visit.result = pruneInterval(visit.trackedInterval, visit.solverOptions, 'constantCheck')
+
+        zooming = []
+        for visit in checking:
+            if visit.result is not None:
+                continue
+            Ms, errors, solverOptions = visit.Ms, visit.errors, visit.solverOptions
+            #Quadratic check
+            if runsQuadraticCheck(Ms, solverOptions):
+                with stageTimer(stats, 'quadraticCheck'):
+                    throwOut = any(quadratic_check(Ms[i], errors[i]) for i in range(len(Ms)))
+                if throwOut:
+                    visit.result = pruneInterval(visit.trackedInterval, solverOptions, 'quadraticCheck')
+                    continue
+            #Trim
+            with stageTimer(stats, 'trim'):
+                visit.Ms = Ms.copy()
+                visit.originalMs = Ms.copy()
+                visit.trackedInterval = visit.trackedInterval.copy()
+                visit.errors = errors.copy()
+                trimMs(visit.Ms, visit.errors)
+            visit.zoomCount = 0
+            visit.originalInterval = visit.trackedInterval.copy()
+            visit.lastSizes = visit.trackedInterval.dimSize()
+            zooming.append(visit)
+
+        #Zoom in on all the intervals while we can
+        entering = []
+        while len(zooming) > 0:
+            with stageTimer(stats, 'zoom'):
+                for finalStep in [False, True]:
+                    group = [visit for visit in zooming if visit.trackedInterval.finalStep == finalStep]
+                    if len(group) == 0:
+                        continue
+                    group, A, consts, sums, errors = getVisitTerms(group)
+                    bounds = BoundingIntervalLinearSystemBatch(A, consts, sums, errors, finalStep)
+                    for visit, interval, changed, should_stop, throwOut in zip(group, *bounds):
+                        visit.Ms, visit.errors, visit.trackedInterval, visit.changed, visit.should_stop = applyBoundingInterval(
+                            visit.Ms, visit.errors, visit.trackedInterval, visit.solverOptions.exact, interval, changed, should_stop, throwOut)
+            stillZooming = []
+            for visit in zooming:
+                solverOptions = visit.solverOptions
+                if stats is not None:
+                    stats.zoomIterations += 1
+                if visit.trackedInterval.empty: #Throw out the interval
+                    visit.result = pruneInterval(visit.trackedInterval, solverOptions, 'linearCheck')
+                    continue
+                visit.lastSizes, countsTowardsMax = recordZoom(visit.trackedInterval, solverOptions, len(visit.Ms), visit.changed, visit.lastSizes)
+                if countsTowardsMax:
+                    visit.zoomCount += 1
+                if visit.changed and visit.zoomCount <= solverOptions.maxZoomCount:
+                    stillZooming.append(visit)
+                    continue
+                visit.result = finishZooming(visit.Ms, visit.originalMs, visit.errors, visit.trackedInterval, visit.originalInterval,
+                                             solverOptions, visit.should_stop)
+                if visit.result is None:
+                    #Run the checks again on the final step interval
+                    entering.append(visit)
+            zooming = stillZooming
+    return [visit.result for visit in visits]
+
+def solvePolyRecursive(Ms, trackedInterval, errors, solverOptions):
+    """Recursively shrinks and subdivides the given interval to find the locations of all roots.
+
+    Parameters
+    ----------
+    Ms : list of numpy arrays
+        The chebyshev approximations of the functions
+    trackedInterval : TrackedInterval
+        The information about the interval we are solving on.
+    errors : numpy array
+        An upper bound for the error of the Chebyshev approximation of the function on the interval
+    solverOptions : SolverOptions
+        Desired settings for running interval checks, transformations, and subdivision.
+
+    Returns
+    -------
+    boundingBoxesInterior : list of numpy arrays (optional)
+        Each element of the list is an interval in which there may be a root. The interval is on the interior of the current
+        interval
+    boundingBoxesExterior : list of numpy arrays (optional)
+        Each element of the list is an interval in which there may be a root. The interval is on the exterior of the current
+        interval
+    """
+    node = zoomInOnInterval(Ms, trackedInterval, errors, solverOptions)
+    if not isinstance(node, SubdivisionNode):
+        return node
+    del Ms #Only the node keeps the approximations on this interval, unless solverOptions.memoryBounded
+    #Run each interval
+    allMs, node.allMs = node.allMs, None
+    results = solveSubintervals(allMs, node.allErrors, node.allIntervals, node.solverOptions)
+    #Rerun the combined intervals
+    reRuns = node.addResults(results)
+    reRunResults = [solvePolyRecursive(tempMs, tempInterval, tempErrors, node.solverOptions) for tempMs, tempInterval, tempErrors in reRuns]
+    return node.getResults(reRunResults)
+
+class IntervalQueue():
+    """The intervals waiting to be solved by solvePolyQueue.
+
+    Parameters
+    ----------
+    order : string
+        The order to solve the intervals in. 'depth' solves the subintervals of an interval before moving on
+        to the next interval, like solvePolyRecursive. 'breadth' solves all the intervals at one depth before the
+        next depth. 'volume' always solves the largest interval next. 'level' is 'breadth' with all the intervals
+        at one depth taken off the queue at once by popAll.
+    """
+    def __init__(self, order='depth'):
+        if order not in ['depth', 'breadth', 'volume', 'level']:
+            raise ValueError(f"Invalid input: queue order must be 'depth', 'breadth', 'volume', or 'level', not {order!r}")
+        self.order = order
+        self.tasks = [] if order == 'volume' else deque()
+        self.count = 0 #Breaks ties between intervals of the same volume in the order they were added
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def push(self, tasks):
+        """Adds a list of tasks to the queue. Each task is a tuple (Ms, trackedInterval, errors, parent, slot)."""
+        if self.order == 'depth':
+            #Reverse them so the first task is solved first
+            self.tasks.extend(reversed(tasks))
+        elif self.order in ['breadth', 'level']:
+            self.tasks.extend(tasks)
+        else:
+            for task in tasks:
+                heapq.heappush(self.tasks, (-task[1].size(), self.count, task))
+                self.count += 1
+
+    def pop(self):
+        """Removes and returns the next task to solve."""
+        if self.order == 'depth':
+            return self.tasks.pop()
+        elif self.order in ['breadth', 'level']:
+            return self.tasks.popleft()
+        else:
+            return heapq.heappop(self.tasks)[2]
+
+    def popAll(self):
+        """Removes and returns all the tasks, in the order pop would return them."""
+        return [self.pop() for i in range(len(self.tasks))]
+
+def solvePolyQueue(Ms, trackedInterval, errors, solverOptions):
+    """Shrinks and subdivides the given interval to find the locations of all roots, using a work queue.
+
+    Runs solvePolyQueueIter to the end. See it for the details.
+
+    Parameters
+    ----------
+    Ms : list of numpy arrays
+        The chebyshev approximations of the functions
+    trackedInterval : TrackedInterval
+        The information about the interval we are solving on.
+    errors : numpy array
+        An upper bound for the error of the Chebyshev approximation of the function on the interval
+    solverOptions : SolverOptions
+        Desired settings for running interval checks, transformations, and subdivision.
+
+    Returns
+    -------
+    boundingBoxesInterior : list of TrackedIntervals
+        The intervals in which there may be a root on the interior of the given interval.
+    boundingBoxesExterior : list of TrackedIntervals
+        The intervals in which there may be a root on the exterior of the given interval.
+    unresolvedIntervals : list of TrackedIntervals
+        The intervals that weren't solved because solverOptions.budget ran out.
+    """
+    solver = solvePolyQueueIter(Ms, trackedInterval, errors, solverOptions)
+    while True:
+        try:
+            next(solver)
+        except StopIteration as done:
+            return done.value
+
+def solvePolyQueueIter(Ms, trackedInterval, errors, solverOptions):
+    """Shrinks and subdivides the given interval to find the locations of all roots, yielding the bounding
+    boxes as soon as they are final.
+
+    Finds the same bounding boxes as solvePolyRecursive without recursing. Each interval waiting to be solved is
+    kept in an IntervalQueue, and each subdivided interval is kept as a SubdivisionNode until the results from
+    all of its subintervals are in. Once the subdivision reaches solverOptions.parallelDepth, the subintervals
+    are solved with solvePolyRecursive on solverOptions.executor while the rest of the queue is worked through.
+    With the queue order 'level', all the intervals at each depth are solved together with zoomInOnIntervals.
+
+    A bounding box is final once it is in the interior results of a subdivided interval outside of the final
+    step, as those are never combined with other boxes again. The rest are final when the whole interval is done.
+
+    If solverOptions.budget runs out, the intervals still waiting to be solved are returned as unresolved, and
+    the boxes found in the results that are in are returned as bounding boxes, without combining the ones on
+    the edges of subintervals. The subtrees already sent to the executor are cancelled if they haven't started
+    and used if they have finished. A budget can't stop the ones that are running, which keep running on the
+    executor after this returns, and their intervals are returned as unresolved.
+
+    Parameters
+    ----------
+    Ms : list of numpy arrays
+        The chebyshev approximations of the functions
+    trackedInterval : TrackedInterval
+        The information about the interval we are solving on.
+    errors : numpy array
+        An upper bound for the error of the Chebyshev approximation of the function on the interval
+    solverOptions : SolverOptions
+        Desired settings for running interval checks, transformations, and subdivision. The order the
+        intervals are solved in is solverOptions.queueOrder.
+
+    Yields
+    ------
+    boundingBoxes : list of TrackedIntervals
+        The bounding boxes that were found to be final since the last yield. Every bounding box in the
+        returned results is yielded once.
+
+    Returns
+    -------
+    boundingBoxesInterior : list of TrackedIntervals
+        The intervals in which there may be a root on the interior of the given interval.
+    boundingBoxesExterior : list of TrackedIntervals
+        The intervals in which there may be a root on the exterior of the given interval.
+    unresolvedIntervals : list of TrackedIntervals
+        The intervals that weren't solved because solverOptions.budget ran out.
+    """
+    queue = IntervalQueue(solverOptions.queueOrder)
+    futures = {}
+    futureIntervals = {}
+    finalResult = []
+    finalBoxes = []
+    finalIds = set()
+    yieldedBoxes = []
+    openNodes = {} #The nodes waiting on results, in the order they were made
+    budget = solverOptions.budget
+    stats = solverOptions.stats
+    residentBytes = 0
+
+    def holdBytes(numBytes, activeBytes=0):
+        #Counts the coefficient bytes held by the queue and the nodes, and the most held at once with the active interval
+        nonlocal residentBytes
+        residentBytes += numBytes
+        if stats is not None:
+            stats.peakCoefficientBytes = max(stats.peakCoefficientBytes, residentBytes + activeBytes)
+
+    def addTasks(tasks, node):
+        #Waits for len(tasks) results, and sends the tasks to the executor or the queue.
+        node.results = [None]*len(tasks)
+        node.pending = len(tasks)
+        if solverOptions.executor is not None and node.solverOptions.level >= solverOptions.parallelDepth:
+            for newMs, newInt, newErrs, parent, slot in tasks:
+                future = solverOptions.executor.submit(solveSubtree, newMs, newInt, newErrs, getWorkerOptions(node.solverOptions))
+                futures[future] = (parent, slot)
+                futureIntervals[future] = newInt
+        else:
+            holdBytes(sum(coefficientBytes(task[0]) for task in tasks))
+            queue.push(tasks)
+
+    def addResult(result, node, slot):
+        #Store the result in the node, and pass the results up the tree once the node has all of its results.
+        while node is not None:
+            node.results[slot] = result
+            node.pending -= 1
+            if node.pending > 0:
+                return
+            if node.reRuns is None:
+                node.reRuns = node.addResults(node.results)
+                if len(node.reRuns) > 0:
+                    addTasks([(tempMs, tempInterval, tempErrors, node, i) for i, (tempMs, tempInterval, tempErrors) in enumerate(node.reRuns)], node)
+                    return
+                node.results = []
+            result = node.getResults(node.results)
+            if not node.trackedInterval.finalStep:
+                #The interior boxes are never combined again. The final step combines all of its boxes into one.
+                finalBoxes.extend(box for box in result[0] if id(box) not in finalIds)
+                finalIds.update(id(box) for box in result[0])
+            holdBytes(-node.heldBytes)
+            openNodes.pop(node, None)
+            node, slot = node.parent, node.slot
+        finalResult.append(result)
+
+    #The given approximations are held the whole time, by the caller and for rebuilding the others when memoryBounded
+    holdBytes(coefficientBytes(Ms))
+    queue.push([(Ms, trackedInterval, errors, None, 0)])
+    while len(queue) > 0 or len(futures) > 0:
+        if budget is not None and budget.exhausted():
+            break
+        if len(queue) == 0:
+            done, _ = wait(futures, timeout=None if budget is None else budget.remainingTime(), return_when=FIRST_COMPLETED)
+            for future in done:
+                del futureIntervals[future]
+                addResult(getSubtreeResult(future, solverOptions), *futures.pop(future))
+        else:
+            tasks = queue.popAll() if queue.order == 'level' else [queue.pop()]
+            if budget is not None:
+                #Put back the intervals that don't fit in the budget, to be returned as unresolved
+                numTasks = budget.takeIntervals(len(tasks))
+                queue.push(tasks[numTasks:])
+                tasks = tasks[:numTasks]
+            #The tasks are (Ms, trackedInterval, errors, parent, slot)
+            parents, slots = [task[3] for task in tasks], [task[4] for task in tasks]
+            activeBytes = [0 if parent is None else coefficientBytes(task[0]) for task, parent in zip(tasks, parents)]
+            holdBytes(-sum(activeBytes))
+            tasks = [(Ms, trackedInterval, errors, solverOptions if parent is None else parent.solverOptions)
+                        for Ms, trackedInterval, errors, parent, slot in tasks]
+            results = zoomInOnIntervals(tasks) if len(tasks) > 1 else [zoomInOnInterval(*tasks[0])]
+            del tasks #Only the nodes keep the approximations on the intervals, unless solverOptions.memoryBounded
+            holdBytes(0, sum(activeBytes) + sum(coefficientBytes(newMs) for result in results if isinstance(result, SubdivisionNode) for newMs in result.allMs))
+            for result, parent, slot, nodeBytes in zip(results, parents, slots, activeBytes):
+                if isinstance(result, SubdivisionNode):
+                    result.parent, result.slot = parent, slot
+                    openNodes[result] = None
+                    #The original approximations are the given ones on the first interval
+                    result.heldBytes = 0 if result.originalMs is None else nodeBytes
+                    holdBytes(result.heldBytes)
+                    addTasks([(newMs, newInt, newErrs, result, i) for i, (newMs, newErrs, newInt) in enumerate(zip(result.allMs, result.allErrors, result.allIntervals))], result)
+                    result.allMs = None #The queue holds them now
+                else:
+                    addResult(result, parent, slot)
+        if len(finalBoxes) > 0:
+            yieldedBoxes.extend(finalBoxes)
+            yield finalBoxes.copy()
+            finalBoxes.clear()
+    #If the budget ran out, use the results of the subtrees that have finished since the last wait
+    for future in [future for future in futures if future.done()]:
+        del futureIntervals[future]
+        addResult(getSubtreeResult(future, solverOptions), *futures.pop(future))
+    if len(finalResult) == 0:
+        #The budget ran out. The subtrees that are running can't be stopped, so they are left to finish.
+        for future in futures:
+            future.cancel()
+        unresolved = [task[1] for task in queue.popAll()] + list(futureIntervals.values())
+        boxes = [box for node in openNodes for box in node.getPartialResults() if id(box) not in finalIds]
+        if len(boxes) > 0:
+            yield boxes
+        return yieldedBoxes + boxes, [], unresolved
+    boxes = finalResult[0][0] + finalResult[0][1]
+    if any(id(box) not in finalIds for box in boxes):
+        yield [box for box in boxes if id(box) not in finalIds]
+    return finalResult[0] + ([],)
+
+def solveChebyshevSubdivision(Ms, errors, verbose = False, returnBoundingBoxes = False, exact = False, constant_check = True, low_dim_quadratic_check = True, all_dim_quadratic_check = True,
+                              executor = None, parallelDepth = 1, queueOrder = 'depth', stats = None, tracer = None,
+                              memoryBounded = False, maxTime = None, maxIntervals = None, budget = None):
     """Initiates shrinking and subdivision recursion and returns the roots and bounding boxes.
 
     Parameters
@@ -1398,7 +2890,38 @@ def solveChebyshevSubdivision(Ms, errors, verbose = False, returnBoundingBoxes =
     low_dim_quadratic_check : bool
         Defaults to True. Whether or not to run quadratic check in dim 2, 3.
     all_dim_quadratic_check : bool
-        Defaults to False. Whether or not to run quadratic check in dim >= 4.
+        Defaults to True. Whether or not to run quadratic check in dim >= 4.
+    executor : concurrent.futures.Executor
+        Defaults to None. If given, the subtrees of the subdivision starting at parallelDepth are solved as
+        separate tasks on this executor. A ProcessPoolExecutor lets independent subtrees run at the same time.
+    parallelDepth : int
+        Defaults to 1. The subdivision depth at which subtrees are handed off to the executor. Depth 1 sends
+        each of the subintervals from the first subdivision to the executor.
+    queueOrder : string
+        Defaults to 'depth'. The order the intervals waiting to be solved are taken off the work queue in.
+        'depth' finishes the subintervals of an interval first, 'breadth' finishes each depth of the subdivision
+        before the next, and 'volume' always solves the largest interval next. All give the same roots. 'level'
+        solves all the intervals at each depth together, running the constant term check and the linear
+        shrinking on intervals with approximations of the same shape at once, which is faster when there are
+        many intervals with small approximations. Its roots agree with the others up to rounding.
+    stats : SolverStats
+        Defaults to None. If given, the number of intervals visited, intervals thrown out by each check,
+        transforms, and the time spent in each stage of the subdivision are added to it.
+    tracer : SolverTracer
+        Defaults to None. If given, it is called each time an interval is entered, thrown out, zoomed in on,
+        subdivided, combined, or found to contain a root. Subtrees solved on the executor are not traced.
+    memoryBounded : bool
+        Defaults to False. If True, subdivided intervals don't keep their approximations while their subintervals
+        are solved. When combined intervals have to be solved again, the approximations are rebuilt from Ms with
+        the transforms recorded in the intervals. This keeps less in memory at once for large approximations,
+        at the cost of the extra transforms. See SolverStats.peakCoefficientBytes.
+    maxTime : float
+        Defaults to None. If given, the subdivision stops after about this many seconds, see SolveBudget.
+        Subtrees already running on the executor aren't stopped.
+    maxIntervals : int
+        Defaults to None. If given, the subdivision stops after solving this many intervals.
+    budget : SolveBudget
+        Defaults to None. A budget to share with other solves, used instead of maxTime and maxIntervals.
 
     Returns
     -------
@@ -1406,6 +2929,87 @@ def solveChebyshevSubdivision(Ms, errors, verbose = False, returnBoundingBoxes =
         The roots of the system of functions on the interval given to Combined Solver
     boundingBoxes : list of numpy arrays (optional)
         List of intervals for each root in which the root is bound to lie.
+    unresolvedIntervals : list of TrackedIntervals (only with a budget)
+        The intervals that weren't solved because the budget ran out. Their interval attribute is the part
+        of [-1,1] they cover. Roots in them are missing from roots.
+    status : string (only with a budget)
+        The status of the budget, 'solved' if it didn't run out, see SolveBudget.
+    """
+    if budget is None and (maxTime is not None or maxIntervals is not None):
+        budget = SolveBudget(maxTime, maxIntervals)
+    solverOptions = getSolverOptions(Ms, errors, verbose, exact, constant_check, low_dim_quadratic_check, all_dim_quadratic_check,
+                                     executor, parallelDepth, queueOrder, stats, tracer, memoryBounded, budget)
+    originalInterval = TrackedInterval(np.array([[-1.,1.]]*Ms[0].ndim))
+
+    if verbose:
+        print("Finding roots...", end=' ')
+    with stageTimer(stats, 'subdivision'):
+        b1, b2, unresolvedIntervals = solvePolyQueue(Ms, originalInterval, errors, solverOptions)
+
+    boundingIntervals = b1 + b2
+    roots = []
+    for interval in boundingIntervals:
+        roots += getBoxRoots(interval)
+    warnAboutBoxes(boundingIntervals)
+    #Return
+    roots = np.array(roots)
+    if verbose:
+        finish_string = '\n' + f"Found {len(roots)} roots"
+        print((finish_string if len(roots) != 1 else finish_string[:-1]),end='\n\n')
+        if len(unresolvedIntervals) > 0:
+            print(f"Stopped by {budget.status} with {len(unresolvedIntervals)} unresolved intervals")
+    results = (roots, boundingIntervals) if returnBoundingBoxes else (roots,)
+    if budget is not None:
+        results += (unresolvedIntervals, budget.status)
+    return results if len(results) > 1 else roots
+
+def solveChebyshevSubdivisionIter(Ms, errors, verbose = False, exact = False, constant_check = True, low_dim_quadratic_check = True, all_dim_quadratic_check = True,
+                                  executor = None, parallelDepth = 1, queueOrder = 'depth', stats = None, tracer = None,
+                                  memoryBounded = False):
+    """Finds the same bounding boxes as solveChebyshevSubdivision, yielding each one as soon as it is final.
+
+    The parameters are the same as for solveChebyshevSubdivision. The boxes come in the order they are
+    finished, which usually isn't the order solveChebyshevSubdivision returns them in. The warnings about
+    extra and duplicate roots are given once all the boxes have been yielded.
+
+    Yields
+    ------
+    boundingBox : TrackedInterval
+        The bounding box of a root, with its finalInterval set. Its roots are getBoxRoots(boundingBox).
+    """
+    solverOptions = getSolverOptions(Ms, errors, verbose, exact, constant_check, low_dim_quadratic_check, all_dim_quadratic_check,
+                                     executor, parallelDepth, queueOrder, stats, tracer, memoryBounded)
+    originalInterval = TrackedInterval(np.array([[-1.,1.]]*Ms[0].ndim))
+
+    if verbose:
+        print("Finding roots...", end=' ')
+    solver = solvePolyQueueIter(Ms, originalInterval, errors, solverOptions)
+    boundingIntervals = []
+    while True:
+        #Only time the solver, not the caller's work between boxes
+        with stageTimer(stats, 'subdivision'):
+            boxes = next(solver, None)
+        if boxes is None:
+            break
+        for interval in boxes:
+            interval.getFinalInterval()
+            boundingIntervals.append(interval)
+            yield interval
+    warnAboutBoxes(boundingIntervals)
+    if verbose:
+        finish_string = '\n' + f"Found {len(boundingIntervals)} bounding boxes"
+        print((finish_string if len(boundingIntervals) != 1 else finish_string[:-1]),end='\n\n')
+
+def getSolverOptions(Ms, errors, verbose, exact, constant_check, low_dim_quadratic_check, all_dim_quadratic_check,
+                     executor, parallelDepth, queueOrder, stats, tracer, memoryBounded, budget=None):
+    """Checks the input to solveChebyshevSubdivision and gets the SolverOptions for solving the top interval.
+
+    The parameters are the same as for solveChebyshevSubdivision.
+
+    Returns
+    -------
+    solverOptions : SolverOptions
+        The settings for solving the top interval.
     """
     #Assert that we have n nD polys
     if np.any([M.ndim != len(Ms) for M in Ms]):
@@ -1413,8 +3017,6 @@ def solveChebyshevSubdivision(Ms, errors, verbose = False, returnBoundingBoxes =
     if len(Ms) != len(errors):
         raise ValueError("Ms and errors must be same length!")
 
-    #Solve
-    originalInterval = TrackedInterval(np.array([[-1.,1.]]*Ms[0].ndim))
     solverOptions = SolverOptions()
     solverOptions.verbose = verbose
     solverOptions.exact = exact
@@ -1422,37 +3024,41 @@ def solveChebyshevSubdivision(Ms, errors, verbose = False, returnBoundingBoxes =
     solverOptions.low_dim_quadratic_check = low_dim_quadratic_check
     solverOptions.all_dim_quadratic_check = all_dim_quadratic_check
     solverOptions.useFinalStep = True
+    solverOptions.executor = executor
+    solverOptions.parallelDepth = parallelDepth
+    solverOptions.queueOrder = queueOrder
+    solverOptions.stats = stats
+    solverOptions.tracer = tracer
+    solverOptions.memoryBounded = memoryBounded
+    solverOptions.budget = budget
+    if memoryBounded:
+        solverOptions.topMs = list(Ms)
+        solverOptions.topErrors = np.array(errors, dtype=float)
+    return solverOptions
+
+def getBoxRoots(interval):
+    """Gets the roots in a bounding box found by the solver, and sets its finalInterval.
 
-    if verbose:
-        print("Finding roots...", end=' ')
-    b1, b2 = solvePolyRecursive(Ms, originalInterval, errors, solverOptions)
+    Parameters
+    ----------
+    interval : TrackedInterval
+        A bounding box returned by solvePolyQueue.
 
-    boundingIntervals = b1 + b2
-    roots = []
-    hasDupRoots = False
-    hasExtraRoots = False
-    for interval in boundingIntervals:
-        #TODO: Figure out the best way to return the bounding intervals.
-        #Right now interval.finalInterval is the interval where we say the root is.
-        interval.getFinalInterval()
-        if interval.possibleExtraRoot:
-            hasExtraRoots = True
-        if len(interval.possibleDuplicateRoots) > 0:
-            roots += interval.possibleDuplicateRoots
-            hasDupRoots = True
-        else:
-            roots.append(interval.getFinalPoint())
-    #Warn if extra or duplicate roots
-    if hasExtraRoots:
+    Returns
+    -------
+    roots : list of numpy arrays
+        The possible duplicate roots in the box if it has them, or else the one root in it.
+    """
+    #TODO: Figure out the best way to return the bounding intervals.
+    #Right now interval.finalInterval is the interval where we say the root is.
+    interval.getFinalInterval()
+    if len(interval.possibleDuplicateRoots) > 0:
+        return list(interval.possibleDuplicateRoots)
+    return [interval.getFinalPoint()]
+
+def warnAboutBoxes(boundingIntervals):
+    """Warns if any of the bounding boxes might have extra or duplicate roots."""
+    if any(interval.possibleExtraRoot for interval in boundingIntervals):
         warnings.warn(f"Might Have Extra Roots! See Bounding Boxes for details!")
-    if hasDupRoots:
+    if any(len(interval.possibleDuplicateRoots) > 0 for interval in boundingIntervals):
         warnings.warn(f"Might Have Duplicate Roots! See Bounding Boxes for details!")
-    #Return
-    roots = np.array(roots)
-    if verbose:
-        finish_string = '\n' + f"Found {len(roots)} roots"
-        print((finish_string if len(roots) != 1 else finish_string[:-1]),end='\n\n')
-    if returnBoundingBoxes:
-        return roots, boundingIntervals
-    else:
-        return roots
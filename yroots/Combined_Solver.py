@@ -2,11 +2,351 @@ import numpy as np
 from numba import njit
 import itertools
 import functools
+import inspect
+from time import perf_counter
+import warnings
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import yroots.ChebyshevSubdivisionSolver as ChebyshevSubdivisionSolver
 import yroots.ChebyshevApproximator as ChebyshevApproximator
 from yroots.polynomial import MultiCheb, MultiPower
 
-def solve(funcs,a=-1,b=1, verbose = False, returnBoundingBoxes = False, exact=False, minBoundingIntervalSize=1e-5):
+#How large the error of an approximation transformed from a larger interval can be, relative to its largest
+#non-constant coefficient, for it to be used instead of approximating the function again. Approximating again
+#usually gets this below 1e-13. The error of a transformed approximation stays about the same as the interval
+#shrinks while the non-constant coefficients shrink with it, so only approximations on intervals not much
+#smaller than the original are reused.
+REUSE_APPROXIMATION_TOL = 1e-12
+
+def approximateFromParent(a, b, parentA, parentB, parentCoeff, parentError, exact):
+    """Transforms an approximation on the interval [parentA,parentB] to the subinterval [a,b].
+
+    Parameters
+    ----------
+    a : numpy array
+        The lower bound of the subinterval in each dimension.
+    b : numpy array
+        The upper bound of the subinterval in each dimension.
+    parentA : numpy array
+        The lower bound of the interval of the approximation.
+    parentB : numpy array
+        The upper bound of the interval of the approximation.
+    parentCoeff : numpy array
+        The Chebyshev coefficient tensor of the approximation.
+    parentError : float
+        An upper bound on the error of the approximation.
+    exact : bool
+        Whether to transform with higher precision to minimize error.
+
+    Returns
+    -------
+    coeff : numpy array
+        The Chebyshev coefficient tensor on [a,b], or None if the error bound is too large compared to the
+        non-constant coefficients, see REUSE_APPROXIMATION_TOL.
+    error : float
+        An upper bound on the error of coeff, or None.
+    initialDegrees : numpy array
+        The degree the approximation needs on [a,b] if the parent's degree scales with the width of the
+        interval, for starting the degree search if the function has to be approximated again.
+    """
+    width = parentB - parentA
+    ratios = np.divide(b - a, width, out=np.ones_like(width), where=width > 0)
+    initialDegrees = np.ceil((np.array(parentCoeff.shape) - 1)*ratios).astype(int)
+    if np.any(width == 0):
+        return None, None, initialDegrees
+    #The subinterval in the [-1,1] coordinates of the parent approximation
+    lower = (2*a - parentA - parentB)/width
+    upper = (2*b - parentA - parentB)/width
+    alphas, betas = (upper - lower)/2, (upper + lower)/2
+    [coeff], [error] = ChebyshevSubdivisionSolver.transformChebToInterval([parentCoeff], alphas, betas, np.array([parentError]), exact)
+    if error > REUSE_APPROXIMATION_TOL * np.max(np.abs(coeff.ravel()[1:]), initial=0):
+        return None, None, initialDegrees
+    return coeff, error, initialDegrees
+
+def approximateFunction(func, a, b, vectorized=None, executor=None, parent=None, exact=False, jitFunctions=False,
+                        dctBackend=None, evaluationCounter=None):
+    """Gets the Chebyshev approximation of a single function on the interval [a,b].
+
+    Parameters
+    ----------
+    func : function or Polynomial
+        The function to approximate.
+    a : numpy array
+        The lower bound of the interval in each dimension.
+    b : numpy array
+        The upper bound of the interval in each dimension.
+    vectorized : bool or None
+        Whether func evaluates numpy arrays elementwise. Detected if None.
+    executor : concurrent.futures.Executor (optional)
+        A pool used to evaluate chunks of each Chebyshev grid concurrently.
+    parent : tuple (optional)
+        The (parentA, parentB, coeff, error) of an approximation of func on an interval containing [a,b]. If
+        given, it is transformed to [a,b] with approximateFromParent, and func is only evaluated if the
+        transformed error bound is too large.
+    exact : bool
+        Defaults to False. Whether to transform the parent approximation with higher precision.
+    jitFunctions : bool
+        Defaults to False. Whether to try compiling func with numba to evaluate the grids.
+    dctBackend : DCTBackend or string (optional)
+        How to compute the DCT in the approximation, see ChebyshevApproximator.DCTBackend.
+    evaluationCounter : ChebyshevApproximator.EvaluationBudgetCounter (optional)
+        Counts the points func is evaluated at.
+
+    Returns
+    -------
+    coeff : numpy array
+        The Chebyshev coefficient tensor of the approximation.
+    error : float
+        An upper bound on the error of the approximation.
+    approxTime : float
+        The time in seconds spent building the approximation.
+    reused : bool
+        Whether the approximation was transformed from parent.
+    """
+    start = perf_counter()
+    if isinstance(func, MultiPower) or isinstance(func, MultiCheb):
+        coeff, error = ChebyshevApproximator.polynomialApproximate(func, a, b)
+    else:
+        initialDegrees = None
+        if parent is not None:
+            coeff, error, initialDegrees = approximateFromParent(a, b, *parent, exact)
+            if coeff is not None:
+                return coeff, error, perf_counter() - start, True
+        coeff, error = ChebyshevApproximator.chebApproximate(func,a,b,vectorized=vectorized,executor=executor,
+                                                             initialDegrees=initialDegrees, jitFunctions=jitFunctions,
+                                                             dctBackend=dctBackend, evaluationCounter=evaluationCounter)
+    return coeff, error, perf_counter() - start, False
+
+def approximateSystem(F, a, b, vectorized=None, executor=None, parents=None, exact=False, dctBackend=None,
+                      evaluationCounter=None):
+    """Gets the Chebyshev approximations of the components of a function F: R^n -> R^n on the interval [a,b].
+
+    F is evaluated once on each grid for all its components, see ChebyshevApproximator.chebApproximateSystem.
+
+    Parameters
+    ----------
+    F : function
+        The function returning the values of every function in the system.
+    a : numpy array
+        The lower bound of the interval in each dimension.
+    b : numpy array
+        The upper bound of the interval in each dimension.
+    vectorized : bool or None
+        Whether F evaluates numpy arrays elementwise. Detected if None.
+    executor : concurrent.futures.Executor (optional)
+        A pool used to evaluate chunks of each Chebyshev grid concurrently.
+    parents : list (optional)
+        The (parentA, parentB, coeff, error) of each component, as in approximateFunction. F is only
+        evaluated if one of them can't be transformed to [a,b].
+    exact : bool
+        Defaults to False. Whether to transform the parent approximations with higher precision.
+    dctBackend : DCTBackend or string (optional)
+        How to compute the DCT in the approximation, see ChebyshevApproximator.DCTBackend.
+    evaluationCounter : ChebyshevApproximator.EvaluationBudgetCounter (optional)
+        Counts the points F is evaluated at.
+
+    Returns
+    -------
+    approximations : list
+        The (coeff, error, approxTime, reused) of each component, as returned by approximateFunction.
+        The time is split evenly between the components.
+    """
+    start = perf_counter()
+    dim = len(a)
+    initialDegrees = None
+    if parents is not None and parents[0] is not None:
+        transformed = [approximateFromParent(a, b, *parent, exact) for parent in parents]
+        if all(coeff is not None for coeff, _, _ in transformed):
+            return [(coeff, error, (perf_counter() - start)/dim, True) for coeff, error, _ in transformed]
+        initialDegrees = np.max([degs for _, _, degs in transformed], axis=0)
+    coeffs, errors = ChebyshevApproximator.chebApproximateSystem(F, a, b, vectorized=vectorized, executor=executor,
+                                                                 initialDegrees=initialDegrees, dctBackend=dctBackend,
+                                                                 evaluationCounter=evaluationCounter)
+    if len(coeffs) != dim:
+        raise ValueError(f"Invalid input: the function returned {len(coeffs)} values but the search interval has {dim} dimensions")
+    return [(coeff, error, (perf_counter() - start)/dim, False) for coeff, error in zip(coeffs, errors)]
+
+def solveSubproblem(funcs, a, b, options):
+    """Runs solve on a subinterval in a worker process.
+
+    Returns the roots, the bounding boxes, and the SolverStats (or None) the worker kept.
+    """
+    roots, boxes = solve(funcs, a=a, b=b, **options)
+    return roots, boxes, options["stats"]
+
+def resolveSubintervals(funcs, subintervals, resolveOptions, parallelResolves=False, maxWorkers=None):
+    """Runs solve again on each of the given subintervals.
+
+    Parameters
+    ----------
+    funcs : list
+        The functions being solved.
+    subintervals : list of tuples
+        The (a, b) of each subinterval to solve on.
+    resolveOptions : dict
+        The keyword arguments to pass to solve.
+    parallelResolves : bool
+        Defaults to False. Whether to solve the subintervals at the same time in a process pool. The workers
+        solve their subintervals serially, with no executors or tracer, and their statistics are merged
+        into resolveOptions['stats']. The functions have to be picklable. With a budget in resolveOptions, the
+        subintervals are always solved one after another.
+    maxWorkers : int
+        Defaults to None. The number of processes in the pool, or the number of cpus if None.
+
+    Returns
+    -------
+    results : list of tuples
+        The (roots, boundingBoxes) on each subinterval, in the order of subintervals, followed by the
+        unresolved boxes and status if resolveOptions has a budget.
+    """
+    stats = resolveOptions["stats"]
+    if stats is not None:
+        stats.resolves += len(subintervals)
+    if resolveOptions["verbose"]:
+        for newA, newB in subintervals:
+            print("Re-solving on:", newA, newB)
+    #A budget can't be shared with worker processes
+    if not parallelResolves or len(subintervals) < 2 or resolveOptions.get("budget") is not None:
+        return [solve(funcs, a=newA, b=newB, **resolveOptions) for newA, newB in subintervals]
+    workerOptions = dict(resolveOptions, executor=None, subdivisionExecutor=None, tracer=None, parallelResolves=False)
+    with ProcessPoolExecutor(max_workers=maxWorkers) as pool:
+        futures = [pool.submit(solveSubproblem, funcs, newA, newB,
+                               dict(workerOptions, stats=None if stats is None else ChebyshevSubdivisionSolver.SolverStats()))
+                   for newA, newB in subintervals]
+        results = []
+        for future in futures:
+            roots, boxes, workerStats = future.result()
+            if stats is not None:
+                stats.merge(workerStats)
+            results.append((roots, boxes))
+    return results
+
+def checkSolveInput(funcs, a, b):
+    """Checks the functions and search interval given to solve, and puts them in the form solve uses.
+
+    Returns
+    -------
+    funcs : list or function
+        The list of functions, or the single function returning the whole system.
+    a : numpy array
+        The float lower bound of the search interval in each dimension.
+    b : numpy array
+        The float upper bound of the search interval in each dimension.
+    vectorValued : bool
+        Whether funcs is a single function returning the values of the whole system.
+    """
+    #A single function with a multidimensional interval returns the values of the whole system
+    vectorValued = (hasattr(funcs, '__call__') and not isinstance(funcs, (MultiCheb, MultiPower))
+                    and np.ndim(a) == 1 and len(a) > 1)
+    if vectorValued:
+        dim = len(a)
+    else:
+        if type(funcs) != list and type(funcs) != np.ndarray:
+            funcs = [funcs]
+        for i in range(len(funcs)):
+            if not hasattr(funcs[i], '__call__'):
+                raise ValueError(f"Invalid input: input function {i} is not callable")
+        dim = len(funcs)
+    if type(a) == list:
+        a = np.array(a)
+    if type(b) == list:
+        b = np.array(b)
+    if type(a) != np.ndarray:
+        a = np.full(dim,a)
+    if type(b) != np.ndarray:
+        b = np.full(dim,b)
+    if len(a) != len(b):
+        raise ValueError(f"Invalid input: {len(a)} lower bounds were given but {len(b)} upper bounds were given")
+    if (b<=a).any():
+        raise ValueError(f"Invalid input: at least one lower bound is greater than or equal to the corresponding upper bound.")
+    #Always use float bounds, so integer bounds don't need their own compiled versions of the numba functions
+    a, b = a.astype(float), b.astype(float)
+    return funcs, a, b, vectorValued
+
+def approximateSearchInterval(funcs, a, b, vectorValued, parentApproximations, options):
+    """Gets the Chebyshev approximation of each function on the search interval [a,b] for solve.
+
+    Parameters
+    ----------
+    funcs : list or function
+        The functions being solved, as returned by checkSolveInput.
+    a : numpy array
+        The lower bound of the search interval in each dimension.
+    b : numpy array
+        The upper bound of the search interval in each dimension.
+    vectorValued : bool
+        Whether funcs is a single function returning the values of the whole system.
+    parentApproximations : tuple
+        The (a, b, coeffs, errors) of the approximations to transform to [a,b], or None.
+    options : dict
+        The keyword arguments of solve. The function evaluations are added to options["budget"] if it is given.
+
+    Returns
+    -------
+    polys : numpy array
+        The Chebyshev coefficient tensor of each function.
+    errs : numpy array
+        An upper bound on the error of each approximation.
+    """
+    dim = len(a)
+    polys = np.array([None]*dim) if vectorValued else np.array(funcs)
+    errs = np.array([0.]*dim)
+    # Get an approximation for each function.
+    if parentApproximations is None:
+        parents = [None]*dim
+    else:
+        parentA, parentB, parentCoeffs, parentErrors = parentApproximations
+        parents = [(parentA, parentB, coeff, error) for coeff, error in zip(parentCoeffs, parentErrors)]
+    #Each function gets its own counter, so they can be approximated at the same time
+    budget = options.get("budget")
+    counters = [None if budget is None else ChebyshevApproximator.EvaluationBudgetCounter() for i in range(dim)]
+    approximate = functools.partial(approximateFunction, a=a, b=b, vectorized=options["vectorized"], executor=options["executor"],
+                                    exact=options["exact"], jitFunctions=options["jitFunctions"], dctBackend=options["dctBackend"])
+    if vectorValued:
+        approximations = approximateSystem(funcs, a, b, options["vectorized"], options["executor"], parents, options["exact"],
+                                           options["dctBackend"], counters[0])
+    elif options["concurrentApproximation"] and dim > 1:
+        with ThreadPoolExecutor(max_workers=dim) as pool:
+            approximations = list(pool.map(lambda args: approximate(args[0], parent=args[1], evaluationCounter=args[2]),
+                                           zip(funcs, parents, counters)))
+    else:
+        approximations = [approximate(func, parent=parent, evaluationCounter=counter) for func, parent, counter in zip(funcs, parents, counters)]
+    if budget is not None:
+        budget.functionEvals += sum(counter.numEvaluations for counter in counters)
+    if options["verbose"]:
+        print("Approximation shapes:", end=" ")
+    for i in range(dim):
+        polys[i], errs[i], approxTime, reused = approximations[i]
+        if options["stats"] is not None:
+            options["stats"].addTime('approximation', approxTime)
+            options["stats"].reusedApproximations += reused
+        if options["verbose"]:
+            print(f"{i}: {polys[i].shape} ({approxTime:.3g}s)", end = " " if i != dim-1 else '\n')
+    if options["verbose"]:
+        print(f"Searching on interval {[[a[i],b[i]] for i in range(dim)]}")
+    return polys, errs
+
+def splitSearchInterval(a, b):
+    """Splits the search interval [a,b] almost in half in each dimension.
+
+    Returns
+    -------
+    subintervals : list of tuples
+        The (a, b) of each of the 2^n subintervals.
+    """
+    subintervals = []
+    for val in itertools.product([False, True], repeat=len(a)):
+        #Split almost in half
+        #TODO: Do we need to combine bounding boxes in this step of the recursion as well?
+        #      For now it seems safe enough to assume we won't have any roots on the midpoints.
+        midPoint = (a + b) * 0.51234912839471234
+        subintervals.append((np.where(val, midPoint, a), np.where(val, b, midPoint)))
+    return subintervals
+
+def solve(funcs,a=-1,b=1, verbose = False, returnBoundingBoxes = False, exact=False, minBoundingIntervalSize=1e-5,
+          vectorized=None, executor=None, concurrentApproximation=False, subdivisionExecutor=None, parallelDepth=1,
+          stats=None, tracer=None, reuseApproximations=False, parentApproximations=None, parallelResolves=False,
+          maxWorkers=None, jitFunctions=False, dctBackend=None, memoryBounded=False, queueOrder='depth', maxTime=None,
+          maxIntervals=None, maxFunctionEvals=None, budget=None):
     """Finds and returns the roots of a system of functions on the search interval [a,b].
 
     Generates an approximation for each function using Chebyshev polynomials on the interval given,
@@ -20,7 +360,8 @@ def solve(funcs,a=-1,b=1, verbose = False, returnBoundingBoxes = False, exact=Fa
     As a result, the very first time the solver is given any system of equations of a particular dimension,
     the module will take several seconds longer to solve due to compiling time. Once the first system of a
     particular dimension has run, however, other systems of that dimension (or even the same system run
-    again) will be solved at the normal (faster) speed thereafter.
+    again) will be solved at the normal (faster) speed thereafter. The compiled code is saved to disk, so
+    later processes don't compile it again. Call warmup once to compile everything ahead of time.
 
     NOTE: The solve function is only guaranteed to work well on systems of equations where each function
     is continuous and smooth and each root in the interval is a simple root. If a function is not
@@ -49,10 +390,13 @@ def solve(funcs,a=-1,b=1, verbose = False, returnBoundingBoxes = False, exact=Fa
 
     Parameters
     ----------
-    funcs: list
+    funcs: list or function
         List of functions for searching. NOTE: Valid input is restricted to callable Python functions
         (including user-created functions) and yroots Polynomial (MultiCheb and MultiPower) objects.
         String representations of functions are not valid input.
+        A single function F: R^n -> R^n that returns the values of all n functions at once can be given
+        instead, with a and b as arrays of length n. F is evaluated once on a shared grid for all its
+        components, which saves work when the functions share expensive subexpressions.
     a: list or numpy array
         An array containing the lower bound of the search interval in each dimension, listed in
         dimension order. If the lower bound is to be the same in each dimension, a single float input
@@ -76,6 +420,87 @@ def solve(funcs,a=-1,b=1, verbose = False, returnBoundingBoxes = False, exact=Fa
         times. Should give more accurate roots when smaller. This number is absolute when the boudning interval in
         question is in [-1,1], and relative otherwise. So if an interval has an endpoint of magnitude > 1, then
         minBoundingIntervalSize is multipled by that value for that dimension.
+    vectorized : bool or None
+        Defaults to None. Whether the functions accept numpy arrays and evaluate them elementwise, in which
+        case each Chebyshev grid is evaluated in a single call rather than one point at a time. If None,
+        this is detected separately for each function.
+    executor : concurrent.futures.Executor
+        Defaults to None. A thread or process pool used to evaluate the functions on chunks of each
+        Chebyshev grid concurrently. Useful when the functions are expensive to evaluate. With a
+        ProcessPoolExecutor, the functions must be picklable (defined at the top level of a module,
+        not lambdas).
+    concurrentApproximation : bool
+        Defaults to False. Whether to build the approximations of all the functions at the same time, each
+        on its own thread. This helps most when the functions are vectorized (numpy releases the GIL on
+        large arrays) or when an executor is given to evaluate the grids on. When verbose, the time spent
+        approximating each function is printed in either case. It has no effect when funcs is a single
+        function returning the whole system.
+    subdivisionExecutor : concurrent.futures.Executor
+        Defaults to None. An executor on which independent subtrees of the subdivision are solved. Use a
+        ProcessPoolExecutor to search the subintervals at the same time.
+    parallelDepth : int
+        Defaults to 1. The subdivision depth at which subtrees are handed off to subdivisionExecutor.
+    stats : SolverStats
+        Defaults to None. Pass in a ChebyshevSubdivisionSolver.SolverStats to have it filled in with statistics
+        about the solve: the intervals visited at each level of subdivision, the intervals thrown out by each
+        check, the number of transforms and re-solves, and the time spent in each stage. Printing it gives
+        a summary.
+    tracer : SolverTracer
+        Defaults to None. A tracer from tracers.py, such as an NDJSONTracer or TimingTracer, that is called
+        on each event of the subdivision: intervals entered, thrown out, zoomed in on, subdivided, combined,
+        and root boxes found. The intervals are relative to the search interval of each solve.
+    reuseApproximations : bool
+        Defaults to False. Whether to re-solve on parts of the interval with the approximations from this solve
+        transformed to the smaller interval, instead of approximating the functions again. A function is only
+        approximated again if its transformed approximation has too large an error bound, and then the search
+        for its degree starts near the degree the larger interval needed. This saves most of the function
+        evaluations in the re-solves.
+    parentApproximations : tuple
+        Defaults to None. Used when re-solving with reuseApproximations: the (a, b, coeffs, errors) of the
+        approximations on the interval being re-solved from.
+    parallelResolves : bool
+        Defaults to False. Whether to run the solves on the 2^n subintervals, when the search interval is split,
+        or on the bounding boxes that are too large, at the same time in a process pool. The roots and boxes
+        are put together in the same order as solving them one after another. The functions have to be
+        picklable (defined at the top level of a module, not lambdas). The re-solves don't use executor or
+        subdivisionExecutor and aren't traced.
+    maxWorkers : int
+        Defaults to None. The number of processes to use with parallelResolves. If None, the number of cpus.
+    jitFunctions : bool
+        Defaults to False. Whether to try compiling each function with numba into a kernel that evaluates a
+        whole grid at once. This speeds up sampling functions written with only arithmetic and numpy
+        functions, like the examples above, especially ones that aren't vectorized. Each function is
+        compiled once, which takes a fraction of a second, and functions that can't be compiled are
+        evaluated as usual. It has no effect when funcs is a single function returning the whole system.
+    dctBackend : string or ChebyshevApproximator.DCTBackend
+        Defaults to None, which uses 'fftpack'. How to compute the DCTs that turn function values into
+        Chebyshev coefficients. 'scipy' uses scipy.fft on all the cpus, which helps on large grids, like
+        degree 500 in two dimensions, 'fftw' uses pyFFTW (if it is installed) and reuses its plans for
+        grids of the same shape, and 'matrix' uses matrix products on tiny grids. See DCTBackend.
+    memoryBounded : bool
+        Defaults to False. Whether to keep fewer Chebyshev approximations in memory during the subdivision.
+        Subdivided intervals drop their approximations, and they are rebuilt from the approximations on the
+        search interval if they are needed again. Useful for large approximations in higher dimensions. The
+        most coefficient memory held at once is recorded in stats.peakCoefficientBytes.
+    queueOrder : string
+        Defaults to 'depth'. The order the subdivision solves the intervals in, see solveChebyshevSubdivision.
+        'level' solves all the intervals at each depth together, running the checks on them at once, which
+        is faster on systems that subdivide into many intervals.
+    maxTime : float
+        Defaults to None. The most seconds to spend solving. Once they run out, the solve stops and returns the
+        roots found so far, the boxes it didn't get to, and a status, see below. The time is checked between
+        intervals and approximations, so the solve can run over by the time one of them takes. Subtrees
+        already running on subdivisionExecutor aren't stopped, and their boxes are returned as unresolved.
+    maxIntervals : int
+        Defaults to None. The most intervals the subdivision can solve, over all the re-solves, before it
+        stops like with maxTime.
+    maxFunctionEvals : int
+        Defaults to None. The most points the functions can be evaluated at to approximate them, over all the
+        re-solves, before it stops like with maxTime. An approximation that is started is always finished.
+    budget : SolveBudget
+        Defaults to None. Used when re-solving with a budget: the budget shared with the solve that re-solves,
+        used instead of maxTime, maxIntervals, and maxFunctionEvals. With a budget, the re-solves are done one
+        after another, even with parallelResolves.
 
     Returns
     -------
@@ -83,96 +508,80 @@ def solve(funcs,a=-1,b=1, verbose = False, returnBoundingBoxes = False, exact=Fa
         A list of the roots of the system of functions on the interval.
     boundingBoxes : numpy array (optional)
         The exact intervals (boxes) in which each root is bound to lie.
+    unresolvedBoxes : numpy array (only with a budget)
+        The boxes, with the lower and upper bound in each dimension, that weren't solved because the budget
+        ran out. Roots in them are missing from yroots.
+    status : string (only with a budget)
+        'solved' if the budget didn't run out, or the limit that ran out first: 'maxTime', 'maxIntervals', or
+        'maxFunctionEvals'.
     """
-    # Ensure input functions and upper/lower bounds are valid
-    if type(funcs) != list and type(funcs) != np.ndarray:
-        funcs = [funcs]
-    for i in range(len(funcs)):
-        if not hasattr(funcs[i], '__call__'):
-            raise ValueError(f"Invalid input: input function {i} is not callable")
-    dim = len(funcs)
-    if type(a) == list:
-        a = np.array(a)
-    if type(b) == list:
-        b = np.array(b)
-    if type(a) != np.ndarray:
-        a = np.full(dim,a)
-    if type(b) != np.ndarray:
-        b = np.full(dim,b)
-    if len(a) != len(b):
-        raise ValueError(f"Invalid input: {len(a)} lower bounds were given but {len(b)} upper bounds were given")
-    if (b<a).any():
-        raise ValueError(f"Invalid input: at least one lower bound is greater than the corresponding upper bound.")
-    polys = np.array(funcs)
-    errs = np.array([0.]*dim)
-    macheps = 2**-52
-    # Get an approximation for each function.
-    if verbose:
-        print("Approximation shapes:", end=" ")
-    for i in range(dim):
-        if isinstance(funcs[i], MultiPower):
-            polys[i] = funcs[i].to_cheb()
-            errs[i] = macheps
-        elif isinstance(funcs[i], MultiCheb):
-            polys[i] = funcs[i].coeff
-            errs[i] = macheps
-        else:
-            polys[i], errs[i] = ChebyshevApproximator.chebApproximate(funcs[i],a,b)
-        if verbose:
-            print(f"{i}: {polys[i].shape}", end = " " if i != dim-1 else '\n')
-    if verbose:
-        print(f"Searching on interval {[[a[i],b[i]] for i in range(dim)]}")
-        
+    funcs, a, b, vectorValued = checkSolveInput(funcs, a, b)
+    if budget is None and (maxTime is not None or maxIntervals is not None or maxFunctionEvals is not None):
+        budget = ChebyshevSubdivisionSolver.SolveBudget(maxTime, maxIntervals, maxFunctionEvals)
+    #Options used when re-solving on smaller intervals
+    resolveOptions = dict(verbose=verbose, returnBoundingBoxes=True, exact=exact, minBoundingIntervalSize=minBoundingIntervalSize,
+                          vectorized=vectorized, executor=executor, concurrentApproximation=concurrentApproximation,
+                          subdivisionExecutor=subdivisionExecutor, parallelDepth=parallelDepth, stats=stats,
+                          tracer=tracer, reuseApproximations=reuseApproximations, parallelResolves=parallelResolves,
+                          maxWorkers=maxWorkers, jitFunctions=jitFunctions, dctBackend=dctBackend, memoryBounded=memoryBounded,
+                          queueOrder=queueOrder, budget=budget)
+    if budget is not None and budget.exhausted():
+        #Leave the whole search interval unresolved
+        return getSolveResults([], [], [np.column_stack([a, b])], budget, returnBoundingBoxes)
+    polys, errs = approximateSearchInterval(funcs, a, b, vectorValued, parentApproximations, resolveOptions)
+
     #Solve the Chebyshev polynomial system
-    yroots, boundingBoxes = ChebyshevSubdivisionSolver.solveChebyshevSubdivision(polys,errs,verbose,True,exact,
-                constant_check=True, low_dim_quadratic_check=True, all_dim_quadratic_check=False)
+    results = ChebyshevSubdivisionSolver.solveChebyshevSubdivision(polys,errs,verbose,True,exact,
+                constant_check=True, low_dim_quadratic_check=True, all_dim_quadratic_check=True,
+                executor=subdivisionExecutor, parallelDepth=parallelDepth, stats=stats, tracer=tracer,
+                memoryBounded=memoryBounded, queueOrder=queueOrder, budget=budget)
+    yroots, boundingBoxes = results[:2]
+    #The parts of the search interval left when the budget ran out
+    unresolvedBoxes = [] if budget is None else [ChebyshevApproximator.transform(interval.interval.T,a,b).T for interval in results[2]]
     
+    #The approximations to transform when re-solving
+    resolveOptions["parentApproximations"] = (a, b, list(polys), errs) if reuseApproximations else None
+
     #If the bounding box is the entire interval, subdivide it!
     usingSubdivision = np.all(b-a > minBoundingIntervalSize)
     if len(boundingBoxes) == 1 and np.all(boundingBoxes[0].finalDimSize() == 2) and usingSubdivision:
         #Subdivide the interval and resolve to get better resolution across different parts of the interval
+        #Solve recursively
         yroots, boundingBoxes = [], []
-        for val in itertools.product([False, True], repeat=len(a)):
-            #Split almost in half
-            #TODO: Do we need to combine bounding boxes in this step of the recursion as well?
-            #      For now it seems safe enough to assume we won't have any roots on the midpoints.
-            midPoint = (a + b) * 0.51234912839471234
-            newA = np.where(val, midPoint, a)
-            newB = np.where(val, b, midPoint)
-            #Solve recursively
-            if verbose:
-                print("Re-solving on:", newA, newB)
-            roots, boxes = solve(funcs, a=newA, b=newB, verbose=verbose, returnBoundingBoxes=True, exact=exact, minBoundingIntervalSize = minBoundingIntervalSize)
+        for results in resolveSubintervals(funcs, splitSearchInterval(a, b), resolveOptions, parallelResolves, maxWorkers):
+            roots, boxes = results[:2]
             if len(roots) != 0:
                 boundingBoxes.append(boxes)
                 yroots.append(roots)
+            if budget is not None:
+                unresolvedBoxes += list(results[2])
         if len(yroots) > 0:
             yroots = np.vstack(yroots)
             boundingBoxes = np.vstack(boundingBoxes)
-        if returnBoundingBoxes:
-            return yroots, boundingBoxes
-        else:
-            return yroots
+        return getSolveResults(yroots, boundingBoxes, unresolvedBoxes, budget, returnBoundingBoxes)
     
     #TODO: Handle if we have duplicate roots or extra roots at the top level. Easiest if we actually return the bounding boxes!
     #Maybe return the bounding boxes in the recursive steps?
     
     #If any of the bounding boxes is too large, re-solve that box.
+    #Get the relative max size in each dimension. If a or b > 1 in magnitude, minBoundingIntervalSize is a relative number.
+    #If they are < 1 in magnitude, it is an absolute number.
+    relMaxSize = minBoundingIntervalSize * functools.reduce(np.maximum, [np.abs(a),np.abs(b), 1])
+    boxIntervals = [ChebyshevApproximator.transform(box.finalInterval.T,a,b) for box in boundingBoxes]
+    resolveBoxes = [(newA, newB) for newA, newB in boxIntervals if np.all(newB - newA > relMaxSize)]
+    resolveResults = iter(resolveSubintervals(funcs, resolveBoxes, resolveOptions, parallelResolves, maxWorkers))
     finalBoxes = []
     finalRoots = []
-    for box in boundingBoxes:
-        #Get the relative max size in each dimension. If a or b > 1 in magnitude, minBoundingIntervalSize is a relative number.
-        #If they are < 1 in magnitude, it is an absolute number.
-        newA, newB = ChebyshevApproximator.transform(box.finalInterval.T,a,b)
-        relMaxSize = minBoundingIntervalSize * functools.reduce(np.maximum, [np.abs(a),np.abs(b), 1])
+    for box, (newA, newB) in zip(boundingBoxes, boxIntervals):
         if np.all(newB - newA > relMaxSize):
             #Re-solve this box
-            if verbose:
-                print("Re-solving on:", newA, newB)
-            roots, boxes = solve(funcs, a=newA, b=newB, verbose=verbose, returnBoundingBoxes=True, exact=exact, minBoundingIntervalSize = minBoundingIntervalSize)
+            results = next(resolveResults)
+            roots, boxes = results[:2]
             if len(roots) > 0:
                 finalRoots.append(roots)
                 finalBoxes.append(boxes)
+            if budget is not None:
+                unresolvedBoxes += list(results[2])
         else:
             #Transform back
             finalBoxes.append([ChebyshevApproximator.transform(box.finalInterval.T,a,b).T])
@@ -187,7 +596,135 @@ def solve(funcs,a=-1,b=1, verbose = False, returnBoundingBoxes = False, exact=Fa
         finalRoots = np.vstack(finalRoots)
     
     # Find and return the roots (and, optionally, the bounding boxes)
-    if returnBoundingBoxes:
-        return finalRoots, finalBoxes
-    else:
-        return finalRoots
+    return getSolveResults(finalRoots, finalBoxes, unresolvedBoxes, budget, returnBoundingBoxes)
+
+def getSolveResults(roots, boundingBoxes, unresolvedBoxes, budget, returnBoundingBoxes):
+    """Puts together what solve returns: the roots, the bounding boxes if returnBoundingBoxes, and the unresolved
+    boxes and the status of the budget if there is one.
+    """
+    results = (roots, boundingBoxes) if returnBoundingBoxes else (roots,)
+    if budget is not None:
+        results += (np.array(unresolvedBoxes) if len(unresolvedBoxes) > 0 else [], budget.status)
+    return results if len(results) > 1 else roots
+
+def solveIter(funcs, a=-1, b=1, **options):
+    """Finds the roots of a system of functions on the search interval [a,b], yielding each root as soon as
+    its bounding box is final.
+
+    Finds the same roots and bounding boxes as solve, so the first roots can be used while the rest of the
+    search interval is still being solved. A bounding box is final once it can't be combined with the boxes
+    next to it, so possible duplicate roots have already been put together. Bounding boxes that are too large
+    are re-solved as they are found, and the roots from them come next. The roots usually come in a different
+    order than solve returns them in.
+
+    >>> for root, box in yroots.solveIter([f, g], a, b):
+    ...     print(root)
+
+    Parameters
+    ----------
+    funcs: list or function
+        The functions to find the roots of, as for solve.
+    a: list or numpy array
+        The lower bound of the search interval, as for solve.
+    b: list or numpy array
+        The upper bound of the search interval, as for solve.
+    options
+        Any of the other keyword arguments of solve. returnBoundingBoxes has no effect, as the bounding box is
+        always given, and parallelResolves has no effect, as the re-solves are done one after another. The
+        budgets maxTime, maxIntervals, and maxFunctionEvals aren't taken, as the iteration can be stopped at any time.
+
+    Yields
+    ------
+    root : numpy array
+        A root of the system of functions on the interval.
+    boundingBox : numpy array
+        The box the root is bound to lie in, with the lower and upper bound in each dimension. Possible
+        duplicate roots are given one at a time, with the box they share.
+    """
+    arguments = inspect.signature(solve).bind(funcs, a, b, **options)
+    arguments.apply_defaults()
+    options = arguments.arguments
+    for name in ["maxTime", "maxIntervals", "maxFunctionEvals", "budget"]:
+        if options[name] is not None:
+            raise ValueError(f"Invalid input: solveIter doesn't take {name}, stop iterating over it instead")
+    funcs, a, b, vectorValued = checkSolveInput(options.pop("funcs"), options.pop("a"), options.pop("b"))
+    resolveOptions = dict(options, returnBoundingBoxes=True, parallelResolves=False)
+    polys, errs = approximateSearchInterval(funcs, a, b, vectorValued, resolveOptions.pop("parentApproximations"), resolveOptions)
+    #The approximations to transform when re-solving
+    resolveOptions["parentApproximations"] = (a, b, list(polys), errs) if options["reuseApproximations"] else None
+
+    usingSubdivision = np.all(b-a > options["minBoundingIntervalSize"])
+    relMaxSize = options["minBoundingIntervalSize"] * functools.reduce(np.maximum, [np.abs(a),np.abs(b), 1])
+    for box in ChebyshevSubdivisionSolver.solveChebyshevSubdivisionIter(polys, errs, options["verbose"], options["exact"],
+                executor=options["subdivisionExecutor"], parallelDepth=options["parallelDepth"], stats=options["stats"],
+                tracer=options["tracer"], memoryBounded=options["memoryBounded"], queueOrder=options["queueOrder"]):
+        #A box covering the entire interval is the only box, so subdivide the interval as solve does
+        if np.all(box.finalDimSize() == 2) and usingSubdivision:
+            yield from resolveSubintervalsIter(funcs, splitSearchInterval(a, b), resolveOptions)
+            continue
+        newA, newB = ChebyshevApproximator.transform(box.finalInterval.T,a,b)
+        if np.all(newB - newA > relMaxSize):
+            #Re-solve this box
+            yield from resolveSubintervalsIter(funcs, [(newA, newB)], resolveOptions)
+            continue
+        #Transform back
+        boundingBox = ChebyshevApproximator.transform(box.finalInterval.T,a,b).T
+        for root in ChebyshevSubdivisionSolver.getBoxRoots(box):
+            yield ChebyshevApproximator.transform(root,a,b), boundingBox
+
+def resolveSubintervalsIter(funcs, subintervals, resolveOptions):
+    """Runs solveIter again on each of the given subintervals, yielding the roots and bounding boxes from each.
+
+    Parameters
+    ----------
+    funcs : list
+        The functions being solved.
+    subintervals : list of tuples
+        The (a, b) of each subinterval to solve on.
+    resolveOptions : dict
+        The keyword arguments to pass to solveIter.
+
+    Yields
+    ------
+    root : numpy array
+        A root of the system of functions on one of the subintervals.
+    boundingBox : numpy array
+        The box the root is bound to lie in.
+    """
+    stats = resolveOptions["stats"]
+    if stats is not None:
+        stats.resolves += len(subintervals)
+    for newA, newB in subintervals:
+        if resolveOptions["verbose"]:
+            print("Re-solving on:", newA, newB)
+        yield from solveIter(funcs, a=newA, b=newB, **resolveOptions)
+
+def warmup(dims=(1,2,3,4), exact=(False,True)):
+    """Compiles the numba code the solver uses for systems of the given dimensions.
+
+    The compiled code is cached on disk, so running this once (for example when installing or building an
+    image) removes the compile time from the first solve in every later process. In a process where the cache
+    is already filled this takes well under a second per dimension.
+
+    Parameters
+    ----------
+    dims : iterable of ints
+        Defaults to (1,2,3,4). The dimensions of the systems to compile for.
+    exact : iterable of bools
+        Defaults to (False,True). The values of the exact argument of solve to compile for.
+    """
+    for dim in dims:
+        #A system with two roots in each dimension, so the solver zooms, subdivides, and combines
+        funcs = [functools.partial(_warmupFunction, i=i) for i in range(dim)]
+        for useExact in exact:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                solve(funcs, -np.ones(dim), np.ones(dim), exact=useExact)
+    #Kernels for cases the system above might not reach. They reshape their input to the same shape in any dimension.
+    for useExact in exact:
+        ChebyshevSubdivisionSolver.chebSplit1D(np.ones((3,3)), 0, useExact)
+    if False in exact:
+        ChebyshevSubdivisionSolver.TransformChebMatrix(ChebyshevSubdivisionSolver.MATRIX_TRANSFORM_MIN_DEGREE, .5, .5)
+
+def _warmupFunction(*x, i):
+    return np.cos(3*x[i]) + 0.05*x[(i+1)%len(x)]
@@ -8,9 +8,7 @@ import numpy as np
 from itertools import product
 import itertools
 from yroots.polynomial import MultiCheb
-from matplotlib import pyplot as plt
 from yroots.polynomial import MultiCheb, Polynomial
-from matplotlib import patches
 from scipy import linalg as la
 from math import fabs                      # faster than np.abs for small arrays
 from yroots.utils import memoize, transform, get_var_list, isNumber
@@ -326,6 +324,9 @@ class IntervalData:
         #3D plot with small alpha, matplotlib interactive, animation
         #make logo
         #make easier to input lower/upper bounds as a list
+        #Imported here so matplotlib is only loaded when plotting
+        from matplotlib import pyplot as plt
+        from matplotlib import patches
         #plt.figure(dpi=300)
         fig,ax = plt.subplots(1)
         fig.set_size_inches(6.5, 6.5)
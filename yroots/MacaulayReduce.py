@@ -5,12 +5,12 @@ from yroots.polynomial import Polynomial, MultiCheb, MultiPower
 from yroots.utils import row_swap_matrix, MacaulayError, slice_top, mon_combos, \
                               num_mons_full, memoized_all_permutations, mons_ordered, \
                               all_permutations_cheb, ConditioningError, TooManyRoots
-from matplotlib import pyplot as plt
 from warnings import warn
 
 macheps = 2.220446049250313e-16
 
 def plot_scree(s,tol):
+    from matplotlib import pyplot as plt
     plt.semilogy(s,marker='.')
     plt.plot(np.ones(len(s))*tol)
     plt.show()
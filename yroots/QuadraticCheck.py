@@ -1,5 +1,7 @@
 import numpy as np
 import itertools
+from numba import njit
+from functools import lru_cache
 from scipy import linalg as la
 from math import fabs
 
@@ -22,7 +24,43 @@ def get_fixed_vars(dim):
     return list(itertools.chain.from_iterable(itertools.combinations(range(dim), r)\
                                              for r in range(dim-1,0,-1)))
 
-def quadratic_check(test_coeff, tol, nd_check=False):
+@lru_cache(maxsize=None)
+def get_fixed_masks(dim):
+    """The boundaries from get_fixed_vars, in the same order, as rows of a boolean array that is True
+    for the fixed variables. Used by quadratic_check_nd_jit.
+    """
+    masks = np.zeros((len(get_fixed_vars(dim)), dim), dtype=np.bool_)
+    for row, fixed in enumerate(get_fixed_vars(dim)):
+        masks[row, list(fixed)] = True
+    return masks
+
+def quadratic_check(test_coeff, tol, nd_check=False, compiled=True):
+    """Runs the quadratic check for the dimension of test_coeff.
+
+    Parameters
+    ----------
+    test_coeff : numpy array
+        The coefficient matrix of the polynomial to check
+    tol: float
+        The bound of the sup norm error of the chebyshev approximation.
+    nd_check : bool
+        Defaults to False. Whether to use quadratic_check_nd in 2D and 3D too.
+    compiled : bool
+        Defaults to True. Whether to use the numba compiled checks, which make the same decisions as the
+        python versions much faster.
+
+    Returns
+    -------
+    True if there is guaranteed to be no root in the interval, False otherwise
+    """
+    if compiled:
+        if test_coeff.ndim == 2 and not nd_check:
+            return quadratic_check_2D_jit(test_coeff, tol)
+        elif test_coeff.ndim == 3 and not nd_check:
+            return quadratic_check_3D_jit(test_coeff, tol)
+        else:
+            return quadratic_check_nd_jit(np.ascontiguousarray(test_coeff, dtype=np.float64).ravel(),
+                                          np.array(test_coeff.shape), tol, get_fixed_masks(test_coeff.ndim))
     if test_coeff.ndim == 2 and not nd_check:
         return quadratic_check_2D(test_coeff, tol)
     elif test_coeff.ndim == 3 and not nd_check:
@@ -684,4 +722,363 @@ def quadratic_check_nd(test_coeff, tol):
                         if min_satisfied and max_satisfied:
                             Done = True
         #no root
-    return not Done
\ No newline at end of file
+    return not Done
+
+@njit(cache=True)
+def quadratic_check_2D_jit(test_coeff, tol):
+    """Compiled version of quadratic_check_2D, which makes the same decisions.
+
+    The candidate extrema of the quadratic part are collected first, in the same order as in
+    quadratic_check_2D, and then evaluated until one is < other_sum and one is > -other_sum.
+
+    Parameters
+    ----------
+    test_coeff : numpy array
+        The coefficient matrix of the polynomial to check
+    tol: float
+        The bound of the sup norm error of the chebyshev approximation.
+
+    Returns
+    -------
+    True if the function is guaranteed to never be zero in the interval. False otherwise.
+    """
+    #Get the coefficients of the quadratic part
+    c = np.zeros(6)
+    shape = test_coeff.shape
+    c[0] = test_coeff[0,0]
+    if shape[0] > 1:
+        c[1] = test_coeff[1,0]
+    if shape[1] > 1:
+        c[2] = test_coeff[0,1]
+    if shape[0] > 2:
+        c[3] = test_coeff[2,0]
+    if shape[0] > 1 and shape[1] > 1:
+        c[4] = test_coeff[1,1]
+    if shape[1] > 2:
+        c[5] = test_coeff[0,2]
+    quad_sum = 0.
+    for coeff in c:
+        quad_sum += fabs(coeff)
+    other_sum = np.sum(np.abs(test_coeff)) - quad_sum + tol
+
+    k0 = c[0]-c[3]-c[5]
+    k3 = 2*c[3]
+    k5 = 2*c[5]
+
+    #The corners, the extrema on the x and y constant boundaries, and the interior extremum
+    points = np.empty((9,2))
+    n = 0
+    for y in (-1., 1.):
+        for x in (-1., 1.):
+            points[n] = x, y
+            n += 1
+    if c[5] != 0:
+        cc5 = 4 * c[5]
+        for x in (-1., 1.):
+            y = -(c[2] + c[4]*x)/cc5
+            if -1 < y < 1:
+                points[n] = x, y
+                n += 1
+    if c[3] != 0:
+        cc3 = 4*c[3]
+        for y in (-1., 1.):
+            x = -(c[1] + c[4]*y)/cc3
+            if -1 < x < 1:
+                points[n] = x, y
+                n += 1
+    det = 16 * c[3] * c[5] - c[4]**2
+    if det != 0:
+        int_x = (c[2] * c[4] - 4 * c[1] * c[5]) / det
+        int_y = (c[1] * c[4] - 4 * c[2] * c[3]) / det
+        if -1 < int_x < 1 and -1 < int_y < 1:
+            points[n] = int_x, int_y
+            n += 1
+
+    min_satisfied, max_satisfied = False,False
+    for i in range(n):
+        x, y = points[i]
+        eval = k0 + (c[1] + k3 * x + c[4] * y) * x  + (c[2] + k5 * y) * y
+        min_satisfied = min_satisfied or eval < other_sum
+        max_satisfied = max_satisfied or eval > -other_sum
+        if min_satisfied and max_satisfied:
+            return False
+
+    #No root possible
+    return True
+
+@njit(cache=True)
+def quadratic_check_3D_jit(test_coeff, tol):
+    """Compiled version of quadratic_check_3D, which makes the same decisions.
+
+    The candidate extrema of the quadratic part are collected first, in the same order as in
+    quadratic_check_3D, and then evaluated until one is < other_sum and one is > -other_sum.
+
+    Parameters
+    ----------
+    test_coeff : numpy array
+        The coefficient matrix of the polynomial to check
+    tol: float
+        The bound of the sup norm error of the chebyshev approximation.
+
+    Returns
+    -------
+    True if the function is guaranteed to never be zero in the interval. False otherwise.
+    """
+    c = np.zeros(10)
+    shape = test_coeff.shape
+    c[0] = test_coeff[0,0,0]
+    if shape[0] > 1:
+        c[1] = test_coeff[1,0,0]
+    if shape[1] > 1:
+        c[2] = test_coeff[0,1,0]
+    if shape[2] > 1:
+        c[3] = test_coeff[0,0,1]
+    if shape[0] > 1 and shape[1] > 1:
+        c[4] = test_coeff[1,1,0]
+    if shape[0] > 1 and shape[2] > 1:
+        c[5] = test_coeff[1,0,1]
+    if shape[1] > 1 and shape[2] > 1:
+        c[6] = test_coeff[0,1,1]
+    if shape[0] > 2:
+        c[7] = test_coeff[2,0,0]
+    if shape[1] > 2:
+        c[8] = test_coeff[0,2,0]
+    if shape[2] > 2:
+        c[9] = test_coeff[0,0,2]
+    quad_sum = 0.
+    for coeff in c:
+        quad_sum += fabs(coeff)
+    other_sum = np.sum(np.abs(test_coeff)) - quad_sum + tol
+
+    k0 = c[0]-c[7]-c[8]-c[9]
+    k7 = 2*c[7]
+    k8 = 2*c[8]
+    k9 = 2*c[9]
+    kk7 = 2*k7 #4c7
+    kk8 = 2*k8 #4c8
+    kk9 = 2*k9 #4c9
+    fix_x_det = kk8*kk9-c[6]**2
+    fix_y_det = kk7*kk9-c[5]**2
+    fix_z_det = kk7*kk8-c[4]**2
+    minor_1_2 = kk9*c[4]-c[5]*c[6]
+    minor_1_3 = c[4]*c[6]-kk8*c[5]
+    minor_2_3 = kk7*c[6]-c[4]*c[5]
+    det = 4*c[7]*fix_x_det - c[4]*minor_1_2 + c[5]*minor_1_3
+
+    #The corners, the extrema on the edges, on the faces, and the interior extremum
+    points = np.empty((27,3))
+    n = 0
+    for x in (-1., 1.):
+        for y in (-1., 1.):
+            for z in (-1., 1.):
+                points[n] = x, y, z
+                n += 1
+    #The x and y constant edges, where the partial with respect to z is zero
+    if c[9] != 0:
+        for x in (-1., 1.):
+            for y in (-1., 1.):
+                z = -((c[5]*x + c[3])+c[6]*y)/kk9
+                if -1 < z < 1:
+                    points[n] = x, y, z
+                    n += 1
+    #The x and z constant edges
+    if c[8] != 0:
+        for x in (-1., 1.):
+            for z in (-1., 1.):
+                y = -((c[2]+c[4]*x)+c[6]*z)/kk8
+                if -1 < y < 1:
+                    points[n] = x, y, z
+                    n += 1
+    #The y and z constant edges
+    if c[7] != 0:
+        for y in (-1., 1.):
+            for z in (-1., 1.):
+                x = -((c[1]+c[4]*y)+c[5]*z)/kk7
+                if -1 < x < 1:
+                    points[n] = x, y, z
+                    n += 1
+    #The x constant faces, where the partials with respect to y and z are zero
+    if fix_x_det != 0:
+        for x in (-1., 1.):
+            c2_c4x = c[2]+c[4]*x
+            c3_c5x = c[3]+c[5]*x
+            y = (-kk9*c2_c4x +   c[6]*c3_c5x)/fix_x_det
+            z = (c[6]*c2_c4x -    kk8*c3_c5x)/fix_x_det
+            if -1 < y < 1 and -1 < z < 1:
+                points[n] = x, y, z
+                n += 1
+    #The y constant faces
+    if fix_y_det != 0:
+        for y in (-1., 1.):
+            c1_c4y = c[1]+c[4]*y
+            c3_c6y = c[3]+c[6]*y
+            x = (-kk9*c1_c4y +   c[5]*c3_c6y)/fix_y_det
+            z = (c[5]*c1_c4y -    kk7*c3_c6y)/fix_y_det
+            if -1 < x < 1 and -1 < z < 1:
+                points[n] = x, y, z
+                n += 1
+    #The z constant faces
+    if fix_z_det != 0:
+        for z in (-1., 1.):
+            c1_c5z = c[1]+c[5]*z
+            c2_c6z = c[2]+c[6]*z
+            x = (-kk8*c1_c5z +   c[4]*c2_c6z)/fix_z_det
+            y = (c[4]*c1_c5z -    kk7*c2_c6z)/fix_z_det
+            if -1 < x < 1 and -1 < y < 1:
+                points[n] = x, y, z
+                n += 1
+    #The interior
+    if det != 0:
+        int_x = (c[1]*-fix_x_det + c[2]*minor_1_2  + c[3]*-minor_1_3)/det
+        int_y = (c[1]*minor_1_2  + c[2]*-fix_y_det + c[3]*minor_2_3)/det
+        int_z = (c[1]*-minor_1_3  + c[2]*minor_2_3  + c[3]*-fix_z_det)/det
+        if -1 < int_x < 1 and -1 < int_y < 1 and -1 < int_z < 1:
+            points[n] = int_x, int_y, int_z
+            n += 1
+
+    min_satisfied, max_satisfied = False,False
+    for i in range(n):
+        x, y, z = points[i]
+        eval = k0 + (c[1] + k7 * x + c[4] * y + c[5] * z) * x + \
+                    (c[2] + k8 * y + c[6] * z) * y + \
+                    (c[3] + k9 * z) * z
+        min_satisfied = min_satisfied or eval < other_sum
+        max_satisfied = max_satisfied or eval > -other_sum
+        if min_satisfied and max_satisfied:
+            return False
+
+    # No root possible
+    return True
+
+@njit(cache=True)
+def _eval_quadratic_nd(point, k0, B, pure_quad_coeff_doubled, A):
+    "fast evaluation of quadratic chebyshev polynomials using horner's algorithm"
+    dim = len(point)
+    _sum = k0
+    for i in range(dim):
+        cross = 0.
+        for j in range(i+1,dim):
+            cross += A[i,j]*point[j]
+        _sum += (B[i] + pure_quad_coeff_doubled[i]*point[i] + cross) * point[i]
+    return _sum
+
+@njit(cache=True)
+def _is_full_rank_symmetric(A):
+    "Whether np.linalg.matrix_rank(A, hermitian=True) is the size of A"
+    S = np.abs(np.linalg.eigvalsh(A))
+    return np.sum(S > S.max() * A.shape[0] * np.finfo(np.float64).eps) == A.shape[0]
+
+@njit(cache=True)
+def _has_sign_change(diag):
+    for i in range(len(diag)-1):
+        if diag[i]*diag[i+1] < 0:
+            return True
+    return False
+
+@njit(cache=True)
+def quadratic_check_nd_jit(coeff, shape, tol, fixed_masks):
+    """Compiled version of quadratic_check_nd, which makes the same decisions.
+
+    Parameters
+    ----------
+    coeff : numpy array
+        The coefficient tensor of the polynomial to check, flattened in C order.
+    shape : numpy array
+        The shape of the coefficient tensor.
+    tol: float
+        The bound of the sup norm error of the chebyshev approximation.
+    fixed_masks : numpy array
+        The boundaries to check, from get_fixed_masks(len(shape)).
+
+    Returns
+    -------
+    True if there is guaranteed to be no root in the interval, False otherwise
+    """
+    dim = len(shape)
+    #pull out coefficients we care about, and add up the absolute values of everything else
+    A = np.zeros((dim,dim))
+    B = np.zeros(dim)
+    pure_quad_coeff = np.zeros(dim)
+    const = 0.
+    other_sum = 0.
+    spot = np.zeros(dim, dtype=np.int64)
+    for flat in range(len(coeff)):
+        spot_deg = spot.sum()
+        if spot_deg == 0:
+            const = coeff[flat]
+        elif spot_deg == 1:
+            B[np.argmax(spot)] = coeff[flat]
+        elif spot_deg == 2:
+            where_nonzero = np.nonzero(spot)[0]
+            if len(where_nonzero) == 2:
+                i, j = where_nonzero[0], where_nonzero[1]
+                A[j,i] = coeff[flat]
+                A[i,j] = A[j,i]
+            else:
+                pure_quad_coeff[where_nonzero[0]] = coeff[flat]
+        else:
+            other_sum += fabs(coeff[flat])
+        #Go to the next spot, with the last index changing fastest
+        for d in range(dim-1,-1,-1):
+            spot[d] += 1
+            if spot[d] < shape[d]:
+                break
+            spot[d] = 0
+    other_sum += tol
+    pure_quad_coeff_doubled = 2*pure_quad_coeff
+    for i in range(dim):
+        A[i,i] = 2*pure_quad_coeff_doubled[i]
+    quad_sum = 0.
+    for p in pure_quad_coeff:
+        quad_sum += p
+    k0 = const - quad_sum
+
+    min_satisfied, max_satisfied = False,False
+    #fix all variables--> corners
+    X = np.empty(dim)
+    for corner in range(2**dim):
+        for i in range(dim):
+            X[i] = 1. if (corner >> (dim-1-i)) & 1 else -1.
+        eval = _eval_quadratic_nd(X, k0, B, pure_quad_coeff_doubled, A)
+        min_satisfied = min_satisfied or eval < other_sum
+        max_satisfied = max_satisfied or eval > -other_sum
+        if min_satisfied and max_satisfied:
+            return False
+
+    #fixed some variables --> "sides"
+    for row in range(len(fixed_masks)):
+        fixed = np.nonzero(fixed_masks[row])[0]
+        unfixed = np.nonzero(~fixed_masks[row])[0]
+        A_ = A[unfixed][:,unfixed]
+        #if diagonal entries change sign, can't be definite. not full rank --> no soln
+        if _has_sign_change(np.diag(A_)) or not _is_full_rank_symmetric(A_):
+            continue
+        fixed_A = A[unfixed][:,fixed]
+        B_ = B[unfixed]
+        X0 = np.empty(len(fixed))
+        for side in range(2**len(fixed)):
+            for i in range(len(fixed)):
+                X0[i] = 1. if (side >> (len(fixed)-1-i)) & 1 else -1.
+            X_ = np.linalg.solve(A_, -B_-fixed_A@X0)
+            #make sure it's in the domain
+            if np.all(np.abs(X_) <= 1):
+                X[fixed] = X0
+                X[unfixed] = X_
+                eval = _eval_quadratic_nd(X, k0, B, pure_quad_coeff_doubled, A)
+                min_satisfied = min_satisfied or eval < other_sum
+                max_satisfied = max_satisfied or eval > -other_sum
+                if min_satisfied and max_satisfied:
+                    return False
+
+    #fix no vars--> interior
+    if not _has_sign_change(pure_quad_coeff) and _is_full_rank_symmetric(A):
+        X = np.linalg.solve(A, -B)
+        if np.all(np.abs(X) <= 1):
+            eval = _eval_quadratic_nd(X, k0, B, pure_quad_coeff_doubled, A)
+            min_satisfied = min_satisfied or eval < other_sum
+            max_satisfied = max_satisfied or eval > -other_sum
+            if min_satisfied and max_satisfied:
+                return False
+
+    #no root
+    return True
@@ -1,6 +1,35 @@
 # Do not delete this file. It tells python that groebner is a module you can import from.
 #public facing functions should be imported here so they can be used directly
+import importlib
+
 name = "yroots"
-from .Combined_Solver import solve
-from .polynomial import MultiPower
-from .polynomial import MultiCheb
+#The public functions and classes are only imported when they are first used, so that importing yroots
+#doesn't load numba and scipy. Add new public names here with the module they come from.
+_publicNames = {"solve": "Combined_Solver",
+                "solveIter": "Combined_Solver",
+                "warmup": "Combined_Solver",
+                "MultiPower": "polynomial",
+                "MultiCheb": "polynomial",
+                "SolverStats": "ChebyshevSubdivisionSolver",
+                "SolveBudget": "ChebyshevSubdivisionSolver",
+                "SolverTracer": "tracers",
+                "NDJSONTracer": "tracers",
+                "TimingTracer": "tracers"}
+#Submodules that used to be loaded by importing yroots, so yroots.<module> still works without importing it
+_submodules = {"Combined_Solver", "ChebyshevApproximator", "ChebyshevSubdivisionSolver", "QuadraticCheck", "polynomial"}
+
+def __getattr__(attr):
+    if attr in _publicNames:
+        moduleName = _publicNames[attr]
+        module = importlib.import_module("." + moduleName, __name__)
+        #Bind all the public names from the module at once
+        for publicName, publicModule in _publicNames.items():
+            if publicModule == moduleName:
+                globals()[publicName] = getattr(module, publicName)
+        return globals()[attr]
+    if attr in _submodules:
+        return importlib.import_module("." + attr, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_publicNames) | _submodules)
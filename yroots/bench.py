@@ -0,0 +1,454 @@
+"""Benchmarks the solver on the chebfun2 test problems and the 4D examples.
+
+Run from the root of the repository with
+
+    python -m yroots.bench --output results.json
+
+and compare against an earlier run with
+
+    python -m yroots.bench --baseline results.json
+
+For each problem this records the wall time, the time spent approximating and subdividing, the number
+of function evaluations, the number of intervals visited, and the peak memory. It also records how long
+importing yroots takes in a new process, how long each DCT backend takes on grids of a few sizes, and
+how long the python and compiled quadratic checks take in each dimension. When a baseline is given, any
+problem that got slower (or used more evaluations, intervals, or memory) by more than the tolerance, or
+any import, DCT, or quadratic check that got slower, is reported as a regression, and the exit code is 1.
+
+The problems are found by running each test in chebfun2_suite.py and tests/high_dim/4d_examples.py with
+solve replaced by a function that records the functions and search interval it was called with, so the
+problems don't have to be defined twice.
+"""
+import numpy as np
+import argparse
+import contextlib
+import importlib.util
+import inspect
+import io
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import threading
+import tracemalloc
+import warnings
+from time import perf_counter
+from yroots import Combined_Solver
+from yroots import ChebyshevApproximator
+from yroots import QuadraticCheck
+from yroots.ChebyshevSubdivisionSolver import SolverStats
+from yroots.polynomial import Polynomial
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SUITES = {"chebfun2": ("chebfun2_suite.py", r"test_roots_\d"),
+          "4d": (os.path.join("tests", "high_dim", "4d_examples.py"), r"ex\d+$")}
+#The quantities compared against the baseline
+METRICS = ["wallTime", "functionEvaluations", "intervalsVisited", "peakMemory"]
+#The modules whose import time is measured. Importing Combined_Solver is what the first solve pays for.
+IMPORT_MODULES = ["yroots", "yroots.Combined_Solver"]
+#Import times that change by less than this many seconds are never regressions, as they are mostly noise
+IMPORT_TIME_SLACK = 0.02
+#The grid shapes the DCT backends are timed on, from the tiny grids of the degree search to large 2D grids
+DCT_SHAPES = [(9, 6), (17, 6, 6), (65, 65), (257, 257), (513, 513)]
+DCT_BACKENDS = ["fftpack", "scipy", "matrix", "fftw"]
+#DCT times that change by less than this many seconds are never regressions
+DCT_TIME_SLACK = 1e-5
+#The dimensions and degree of the coefficient tensors the quadratic checks are timed on
+QUADRATIC_CHECK_DEGREES = {2: 20, 3: 9, 4: 5, 5: 4}
+#Quadratic check times that change by less than this many seconds are never regressions
+QUADRATIC_CHECK_TIME_SLACK = 1e-6
+
+class BenchmarkProblem():
+    """A system of functions to solve on a search interval.
+
+    Parameters
+    ----------
+    name : string
+        The name of the problem, '<suite>:<test function>'.
+    funcs : list of functions
+        The functions to find the common roots of.
+    a : numpy array
+        The lower bounds of the search interval.
+    b : numpy array
+        The upper bounds of the search interval.
+    kwargs : dict
+        Any other arguments the test passed to solve.
+    """
+    def __init__(self, name, funcs, a, b, kwargs):
+        self.name = name
+        self.funcs = funcs
+        self.a = a
+        self.b = b
+        self.kwargs = kwargs
+
+class _ProblemFound(Exception):
+    """Raised in place of solving to stop a test once its problem is recorded."""
+    def __init__(self, funcs, a, b, kwargs):
+        self.funcs, self.a, self.b, self.kwargs = funcs, a, b, kwargs
+
+def _recordProblem(funcs, a=-1, b=1, **kwargs):
+    raise _ProblemFound(funcs, a, b, kwargs)
+
+def loadProblems(suites=("chebfun2", "4d"), pattern=None):
+    """Finds the benchmark problems in the test suites of the repository.
+
+    Parameters
+    ----------
+    suites : iterable of strings
+        Which suites to load, from the keys of SUITES.
+    pattern : string (optional)
+        A regular expression. Only problems with names that match it are returned.
+
+    Returns
+    -------
+    problems : list of BenchmarkProblems
+        The problems, in the order they are defined in each suite.
+    """
+    solveArgs = inspect.signature(Combined_Solver.solve).parameters
+    problems = []
+    for suite in suites:
+        if suite not in SUITES:
+            raise ValueError(f"Invalid input: unknown suite {suite!r}. Options are {list(SUITES)}")
+        fileName, testPattern = SUITES[suite]
+        path = os.path.join(REPO_ROOT, fileName)
+        if not os.path.exists(path):
+            warnings.warn(f"Skipping the {suite} suite, {path} was not found.")
+            continue
+        spec = importlib.util.spec_from_file_location(f"_bench_{suite}", path)
+        module = importlib.util.module_from_spec(spec)
+        try:
+            spec.loader.exec_module(module)
+        except ImportError as e:
+            warnings.warn(f"Skipping the {suite} suite, it could not be imported: {e}")
+            continue
+        module.solve = _recordProblem
+        tests = [(name, func) for name, func in vars(module).items() if re.match(testPattern, name) and callable(func)]
+        tests.sort(key=lambda test: test[1].__code__.co_firstlineno)
+        for testName, test in tests:
+            name = f"{suite}:{testName}"
+            if pattern is not None and re.search(pattern, name) is None:
+                continue
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    test()
+            except _ProblemFound as problem:
+                #Drop any arguments solve doesn't take anymore
+                kwargs = {key:val for key,val in problem.kwargs.items() if key in solveArgs}
+                problems.append(BenchmarkProblem(name, list(problem.funcs), problem.a, problem.b, kwargs))
+            except Exception:
+                #Tests that don't call solve, like ex6 which returns a known residual
+                continue
+    return problems
+
+class EvaluationCounter():
+    """Wraps a function and counts the number of points it is evaluated at.
+
+    A call with arrays counts each point of the broadcast arrays. The count is safe to update from
+    several threads.
+
+    Parameters
+    ----------
+    func : function
+        The function to wrap.
+    """
+    def __init__(self, func):
+        self.func = func
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, *args):
+        with self.lock:
+            self.count += np.broadcast(*args).size if len(args) > 1 else np.size(args[0])
+        return self.func(*args)
+
+def runProblem(problem, repeat=1, measureMemory=True, warmup=True):
+    """Solves a benchmark problem and records how long it took and what it used.
+
+    Parameters
+    ----------
+    problem : BenchmarkProblem
+        The problem to solve.
+    repeat : int
+        Defaults to 1. How many times to solve the problem. The fastest run is reported.
+    measureMemory : bool
+        Defaults to True. Whether to solve the problem once more under tracemalloc to find the peak memory.
+        This is a separate run because tracemalloc slows down the solver.
+    warmup : bool
+        Defaults to True. Whether to solve the problem once before timing it, so the time numba spends
+        compiling isn't included.
+
+    Returns
+    -------
+    result : dict
+        The wall time, approximation time, subdivision time, number of function evaluations, number of
+        intervals visited, peak memory in bytes, number of roots found, and the full SolverStats as a dict.
+        If the solve raised an exception, just the error message.
+    """
+    result = None
+    if warmup:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                Combined_Solver.solve(problem.funcs, problem.a, problem.b, **problem.kwargs)
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+    for _ in range(repeat):
+        funcs = [func if isinstance(func, Polynomial) else EvaluationCounter(func) for func in problem.funcs]
+        try:
+            stats = SolverStats()
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                start = perf_counter()
+                roots = Combined_Solver.solve(funcs, problem.a, problem.b, stats=stats, **problem.kwargs)
+                wallTime = perf_counter() - start
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+        if result is None or wallTime < result["wallTime"]:
+            result = {"wallTime": wallTime,
+                      "approximationTime": stats.times.get("approximation", 0.),
+                      "subdivisionTime": stats.times.get("subdivision", 0.),
+                      "functionEvaluations": sum(func.count for func in funcs if isinstance(func, EvaluationCounter)),
+                      "intervalsVisited": stats.intervalsVisited,
+                      "numRoots": len(roots),
+                      "stats": stats.asDict()}
+    if measureMemory:
+        tracemalloc.start()
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                Combined_Solver.solve(problem.funcs, problem.a, problem.b, **problem.kwargs)
+            result["peakMemory"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+def measureImportTime(module, repeat=3):
+    """Measures how long it takes to import a module in a new python process.
+
+    Parameters
+    ----------
+    module : string
+        The name of the module to import.
+    repeat : int
+        Defaults to 3. How many processes to time. The fastest is reported.
+
+    Returns
+    -------
+    importTime : float
+        The time in seconds the import statement took.
+    """
+    code = f"from time import perf_counter; start = perf_counter(); import {module}; print(perf_counter() - start)"
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+        times.append(float(output.stdout.split()[-1]))
+    return min(times)
+
+def measureDCTTimes(shapes=DCT_SHAPES, backends=DCT_BACKENDS, repeat=5):
+    """Times each DCT backend on grids of random values.
+
+    Parameters
+    ----------
+    shapes : list of tuples
+        The shapes of the grids.
+    backends : list of strings
+        The names of the backends, see ChebyshevApproximator.DCTBackend. Backends that aren't installed
+        are skipped.
+    repeat : int
+        Defaults to 5. How many times to transform each grid. The fastest is reported. The first transform
+        isn't timed, so FFTW's planning isn't included.
+
+    Returns
+    -------
+    dctTimes : dict
+        The time in seconds for each '<backend>:<shape>', like 'scipy:65x65'.
+    """
+    dctTimes = {}
+    rng = np.random.default_rng(0)
+    for backendName in backends:
+        try:
+            backend = ChebyshevApproximator.getDCTBackend(backendName)
+        except ImportError:
+            continue
+        for shape in shapes:
+            values = rng.random(shape)
+            backend.dct(values.copy(), len(shape))
+            times = []
+            for _ in range(repeat):
+                start = perf_counter()
+                backend.dct(values.copy(), len(shape))
+                times.append(perf_counter() - start)
+            dctTimes[f"{backendName}:{'x'.join(map(str, shape))}"] = min(times)
+    return dctTimes
+
+def measureQuadraticCheckTimes(degrees=QUADRATIC_CHECK_DEGREES, numTests=50, repeat=5):
+    """Times the python and compiled quadratic checks on random coefficient tensors.
+
+    The tensors have quadratic parts much larger than the rest, so some are thrown out and some aren't.
+
+    Parameters
+    ----------
+    degrees : dict
+        The size of the tensors in each dimension to time.
+    numTests : int
+        Defaults to 50. The number of tensors in each dimension.
+    repeat : int
+        Defaults to 5. How many times to check all the tensors. The fastest is reported.
+
+    Returns
+    -------
+    quadraticCheckTimes : dict
+        The average time in seconds to check a tensor for each '<python or compiled>:<dim>d'.
+    """
+    quadraticCheckTimes = {}
+    rng = np.random.default_rng(0)
+    for dim, degree in degrees.items():
+        shape = (degree,)*dim
+        scale = np.where(np.indices(shape).sum(axis=0) <= 2, 1, 1e-2)
+        tests = [rng.standard_normal(shape)*scale for _ in range(numTests)]
+        for name, compiled in [("python", False), ("compiled", True)]:
+            QuadraticCheck.quadratic_check(tests[0], 1e-3, compiled=compiled)
+            times = []
+            for _ in range(repeat):
+                start = perf_counter()
+                for test in tests:
+                    QuadraticCheck.quadratic_check(test, 1e-3, compiled=compiled)
+                times.append((perf_counter() - start)/numTests)
+            quadraticCheckTimes[f"{name}:{dim}d"] = min(times)
+    return quadraticCheckTimes
+
+def compareResults(results, baseline, tolerance=0.25):
+    """Finds the problems that regressed compared to a baseline.
+
+    Parameters
+    ----------
+    results : dict
+        The results of runBenchmarks.
+    baseline : dict
+        Earlier results of runBenchmarks.
+    tolerance : float
+        Defaults to 0.25. How much larger than the baseline a metric can be, relatively, before it counts as
+        a regression.
+
+    Returns
+    -------
+    regressions : list of strings
+        A description of each regression. A problem that now raises an error or finds a different number
+        of roots is always a regression.
+    """
+    regressions = []
+    for timings, label, slack in [("importTimes", "import", IMPORT_TIME_SLACK), ("dctTimes", "dct", DCT_TIME_SLACK),
+                                  ("quadraticCheckTimes", "quadratic check", QUADRATIC_CHECK_TIME_SLACK)]:
+        for name, newTime in results.get(timings, {}).items():
+            oldTime = baseline.get(timings, {}).get(name)
+            if oldTime is not None and newTime > oldTime*(1 + tolerance) + slack:
+                regressions.append(f"{label} {name}: went from {oldTime:.4g}s to {newTime:.4g}s")
+    for name, result in results["problems"].items():
+        if name not in baseline["problems"]:
+            continue
+        old = baseline["problems"][name]
+        if "error" in result:
+            if "error" not in old:
+                regressions.append(f"{name}: now fails with {result['error']}")
+            continue
+        if "error" in old:
+            continue
+        if result["numRoots"] != old["numRoots"]:
+            regressions.append(f"{name}: found {result['numRoots']} roots, baseline found {old['numRoots']}")
+        for metric in METRICS:
+            if metric in result and metric in old and result[metric] > old[metric]*(1 + tolerance):
+                regressions.append(f"{name}: {metric} went from {old[metric]:.4g} to {result[metric]:.4g}")
+    return regressions
+
+def runBenchmarks(problems, repeat=1, measureMemory=True, warmup=True, verbose=True):
+    """Runs each benchmark problem.
+
+    Parameters
+    ----------
+    problems : list of BenchmarkProblems
+        The problems to run, from loadProblems.
+    repeat : int
+        Defaults to 1. How many times to solve each problem. The fastest run is reported.
+    measureMemory : bool
+        Defaults to True. Whether to record the peak memory of each problem.
+    warmup : bool
+        Defaults to True. Whether to solve each problem once before timing it.
+    verbose : bool
+        Defaults to True. Whether to print each result as it finishes.
+
+    Returns
+    -------
+    results : dict
+        'metadata' has the versions and machine the benchmarks ran on, 'importTimes' has the time to import
+        each of IMPORT_MODULES, 'dctTimes' and 'quadraticCheckTimes' have the results of measureDCTTimes and
+        measureQuadraticCheckTimes, and 'problems' has the result of runProblem for each problem by name.
+    """
+    import numba, scipy
+    results = {"metadata": {"python": platform.python_version(), "numpy": np.__version__,
+                            "scipy": scipy.__version__, "numba": numba.__version__,
+                            "machine": platform.platform(), "cpus": os.cpu_count()},
+               "importTimes": {module: measureImportTime(module) for module in IMPORT_MODULES},
+               "dctTimes": measureDCTTimes(),
+               "quadraticCheckTimes": measureQuadraticCheckTimes(),
+               "problems": {}}
+    if verbose:
+        for module, importTime in results["importTimes"].items():
+            print(f"{'import ' + module:30} {importTime:8.3f}s")
+        for name, dctTime in results["dctTimes"].items():
+            print(f"{'dct ' + name:30} {dctTime*1e3:8.3f}ms")
+        for name, checkTime in results["quadraticCheckTimes"].items():
+            print(f"{'quadratic check ' + name:30} {checkTime*1e6:8.1f}us")
+    for problem in problems:
+        result = runProblem(problem, repeat, measureMemory, warmup)
+        results["problems"][problem.name] = result
+        if verbose:
+            if "error" in result:
+                print(f"{problem.name:30} {result['error']}")
+            else:
+                print(f"{problem.name:30} {result['wallTime']:8.3f}s (approx {result['approximationTime']:.3f}s,"
+                      f" subdiv {result['subdivisionTime']:.3f}s) {result['functionEvaluations']:9d} evals"
+                      f" {result['intervalsVisited']:6d} intervals"
+                      + (f" {result['peakMemory']/2**20:8.1f} MiB" if "peakMemory" in result else ""))
+    return results
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Benchmark yroots on the chebfun2 and 4D test problems.")
+    parser.add_argument("--suites", nargs="+", default=list(SUITES), choices=list(SUITES),
+                        help="Which problem suites to run.")
+    parser.add_argument("--problems", default=None, help="Only run problems with names matching this regex.")
+    parser.add_argument("--repeat", type=int, default=1, help="Solve each problem this many times and keep the fastest.")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the extra run that measures peak memory.")
+    parser.add_argument("--no-warmup", action="store_true",
+                        help="Don't solve each problem once before timing it. Numba compile times will be included.")
+    parser.add_argument("--output", default=None, help="Save the results to this JSON file.")
+    parser.add_argument("--baseline", default=None, help="Compare against the results in this JSON file.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Relative increase over the baseline that counts as a regression.")
+    parser.add_argument("--dct-backend", default=None, choices=DCT_BACKENDS,
+                        help="Solve the problems with this DCT backend instead of the default.")
+    args = parser.parse_args(args)
+
+    problems = loadProblems(args.suites, args.problems)
+    if args.dct_backend is not None:
+        for problem in problems:
+            problem.kwargs["dctBackend"] = args.dct_backend
+    results = runBenchmarks(problems, args.repeat, not args.no_memory, not args.no_warmup)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compareResults(results, baseline, args.tolerance)
+        if len(regressions) > 0:
+            print(f"\n{len(regressions)} regressions compared to {args.baseline}:")
+            for regression in regressions:
+                print("\t" + regression)
+            return 1
+        print(f"\nNo regressions compared to {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
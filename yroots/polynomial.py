@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.signal import convolve
 from numpy.polynomial import chebyshev as cheb
 from numpy.polynomial import polynomial as poly
 
@@ -498,6 +497,8 @@ class MultiPower(Polynomial):
         else:
             new_self, new_other = self.coeff, other.coeff
 
+        #scipy.signal is slow to import and only needed here
+        from scipy.signal import convolve
         return MultiPower(convolve(new_self, new_other))
     
     def __call__(self, points):
@@ -17,7 +17,6 @@ from yroots.polynomial import MultiCheb
 from yroots.IntervalChecks import IntervalData
 from yroots.RootTracker import RootTracker
 from itertools import product
-from matplotlib import pyplot as plt
 from scipy.linalg import lu
 import time
 import warnings
@@ -191,6 +190,7 @@ def subdivide_to_linear(funcs, a, b, rel_approx_tol=1.e-15, abs_approx_tol=1.e-1
 
     # Plotting
     if plot:
+        from matplotlib import pyplot as plt
         if dim == 1:
             x = np.linspace(a, b, 1000)
             plt.plot(x, funcs(x), color='k')
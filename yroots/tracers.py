@@ -0,0 +1,173 @@
+"""Tracers for following what happens to each interval in the subdivision solver.
+
+A tracer is passed to solve or solveChebyshevSubdivision with the tracer argument, and is called on each
+event as the solver runs. Subclass SolverTracer and override the events you need, or use one of the
+built in tracers:
+
+NDJSONTracer writes every event to a file as a line of JSON.
+TimingTracer adds up the time spent on intervals by how they ended and their depth of subdivision.
+
+Intervals are TrackedIntervals, and interval.interval is the part of the search interval they cover,
+scaled to [-1,1] in each dimension. Subtrees solved on an executor are not traced.
+"""
+import json
+from time import perf_counter
+
+class SolverTracer():
+    """The events the subdivision solver reports. Each does nothing unless overridden.
+
+    The events for one visit to an interval come in order: intervalEntered, any number of intervalZoomed,
+    then one of intervalPruned, intervalSubdivided, finalStepStarted, or rootBoxFound. After
+    finalStepStarted the same interval is entered again. With the queue order 'level', the intervals at each
+    depth are solved together, so the events of their visits are interleaved and TimingTracer can't time them.
+    """
+    def intervalEntered(self, interval, level):
+        """The solver starts working on interval, at depth level of the subdivision."""
+        pass
+
+    def intervalPruned(self, interval, level, reason):
+        """interval has no roots. reason is 'constantCheck', 'quadraticCheck', or 'linearCheck'."""
+        pass
+
+    def intervalZoomed(self, interval, level, volumeRatio):
+        """interval was shrunk, to volumeRatio times its previous volume."""
+        pass
+
+    def intervalSubdivided(self, interval, level, numSubintervals):
+        """interval was split into numSubintervals pieces."""
+        pass
+
+    def intervalsCombined(self, interval, level):
+        """interval was made by combining subintervals with roots on their boundaries, and is solved again."""
+        pass
+
+    def finalStepStarted(self, interval, level):
+        """interval is small enough to start the final step, and is solved again in it."""
+        pass
+
+    def rootBoxFound(self, interval, level):
+        """interval is a bounding box of a root."""
+        pass
+
+class NDJSONTracer(SolverTracer):
+    """Writes each event as a line of JSON.
+
+    Each line has the event name, the seconds since the tracer was made, the level, the interval as a list
+    of [lower, upper] pairs, and the reason, volumeRatio, or numSubintervals for the events that have one.
+    Use it as a context manager, or call close when done, to make sure the file is written.
+
+    Parameters
+    ----------
+    file : string or file object
+        The path to write the trace to, or an open text file.
+    """
+    def __init__(self, file):
+        self.ownsFile = isinstance(file, str)
+        self.file = open(file, 'w') if self.ownsFile else file
+        self.start = perf_counter()
+
+    def write(self, event, interval, level, **extra):
+        record = {"event": event, "t": round(perf_counter() - self.start, 7), "level": level,
+                  "interval": interval.interval.tolist()}
+        record.update(extra)
+        self.file.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+    def intervalEntered(self, interval, level):
+        self.write("entered", interval, level)
+
+    def intervalPruned(self, interval, level, reason):
+        self.write("pruned", interval, level, reason=reason)
+
+    def intervalZoomed(self, interval, level, volumeRatio):
+        self.write("zoomed", interval, level, volumeRatio=float(volumeRatio))
+
+    def intervalSubdivided(self, interval, level, numSubintervals):
+        self.write("subdivided", interval, level, numSubintervals=numSubintervals)
+
+    def intervalsCombined(self, interval, level):
+        self.write("combined", interval, level)
+
+    def finalStepStarted(self, interval, level):
+        self.write("finalStep", interval, level)
+
+    def rootBoxFound(self, interval, level):
+        self.write("rootBox", interval, level)
+
+    def close(self):
+        if self.ownsFile:
+            self.file.close()
+        else:
+            self.file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class TimingTracer(SolverTracer):
+    """Adds up the time spent on each visit to an interval, by how the visit ended and the level.
+
+    The time of a visit is from intervalEntered until the event that ends it. The outcomes are the prune
+    reasons, 'subdivided', 'finalStep', and 'rootBox'.
+
+    Attributes
+    ----------
+    timings : dict
+        For each (outcome, level), a list [count, total seconds, max seconds].
+    zooms : int
+        The number of times an interval was shrunk.
+    combined : int
+        The number of combined intervals that were solved again.
+    """
+    def __init__(self):
+        self.timings = {}
+        self.zooms = 0
+        self.combined = 0
+        self.visitStart = None
+
+    def endVisit(self, outcome, level):
+        elapsed = 0. if self.visitStart is None else perf_counter() - self.visitStart
+        self.visitStart = None
+        timing = self.timings.setdefault((outcome, level), [0, 0., 0.])
+        timing[0] += 1
+        timing[1] += elapsed
+        timing[2] = max(timing[2], elapsed)
+
+    def intervalEntered(self, interval, level):
+        self.visitStart = perf_counter()
+
+    def intervalPruned(self, interval, level, reason):
+        self.endVisit(reason, level)
+
+    def intervalZoomed(self, interval, level, volumeRatio):
+        self.zooms += 1
+
+    def intervalSubdivided(self, interval, level, numSubintervals):
+        self.endVisit("subdivided", level)
+
+    def intervalsCombined(self, interval, level):
+        self.combined += 1
+
+    def finalStepStarted(self, interval, level):
+        self.endVisit("finalStep", level)
+
+    def rootBoxFound(self, interval, level):
+        self.endVisit("rootBox", level)
+
+    def totals(self):
+        """Gets the [count, total seconds, max seconds] for each outcome, over all levels."""
+        totals = {}
+        for (outcome, level), (count, total, maxTime) in self.timings.items():
+            timing = totals.setdefault(outcome, [0, 0., 0.])
+            timing[0] += count
+            timing[1] += total
+            timing[2] = max(timing[2], maxTime)
+        return totals
+
+    def __str__(self):
+        lines = [f"{'outcome':>15} {'level':>5} {'count':>7} {'total (s)':>10} {'mean (s)':>10} {'max (s)':>10}"]
+        for (outcome, level), (count, total, maxTime) in sorted(self.timings.items(), key=lambda item: (item[0][1], item[0][0])):
+            lines.append(f"{outcome:>15} {level:>5} {count:>7} {total:>10.4g} {total/count:>10.4g} {maxTime:>10.4g}")
+        lines.append(f"{self.zooms} zooms, {self.combined} combined intervals")
+        return "\n".join(lines)